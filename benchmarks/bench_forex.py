@@ -0,0 +1,63 @@
+"""Benchmark: forex course for many countries, scalar loop versus batch.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_forex [--rows 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import fields
+import timeit
+
+import numpy as np
+
+from functions import array_models
+from functions.trade_models import ForexFeatureBatch, ForexFeatures, TradeModels
+
+
+def _features(rows: int) -> ForexFeatureBatch:
+    rng = np.random.default_rng(0)
+    return ForexFeatureBatch(
+        stability=rng.integers(0, 100, rows),
+        income=rng.uniform(-500, 3000, rows),
+        wastes=rng.uniform(0, 2000, rows),
+        budget=rng.uniform(-10000, 20000, rows),
+        trade_rank=rng.integers(1, 10, rows),
+        trade_efficiency=rng.uniform(0, 100, rows),
+        trade_overload=rng.uniform(0, 200, rows),
+        industry_efficiency=rng.uniform(0, 100, rows),
+        state_apparatus_efficiency=rng.integers(0, 120, rows),
+        contentment=rng.integers(0, 100, rows),
+        poor_level=rng.uniform(0, 40, rows),
+        jobless_level=rng.uniform(0, 40, rows),
+        control_balance=rng.uniform(-50, 50, rows),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    batch = _features(args.rows)
+    names = [item.name for item in fields(ForexFeatures)]
+    rows = [ForexFeatures(**dict(zip(names, values)))
+            for values in zip(*(getattr(batch, name).tolist() for name in names))]
+
+    scalar = min(timeit.repeat(
+        lambda: [TradeModels.calculate_forex_course(row) for row in rows],
+        number=1, repeat=args.repeat))
+    vectorized = min(timeit.repeat(
+        lambda: array_models.TradeModels.calculate_forex_course(batch),
+        number=1, repeat=args.repeat))
+
+    print(f"forex course for {args.rows} rows:")
+    print(f"  scalar loop : {scalar * 1e3:9.1f} ms")
+    print(f"  batch       : {vectorized * 1e3:9.1f} ms (x{scalar / vectorized:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark: label matching in `parse_pretty_text` on large pasted inputs.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_parse_pretty [--countries 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from stats.basic_stats import EconomyStats, InnerPoliticsStats
+from stats.pretty import (
+    _compiled_matcher,
+    _find_matches_in_line,
+    _normalize_lines,
+    _parse_specs,
+)
+from tests.factories import make_basic_bundle
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    bundle = make_basic_bundle()
+    for stats_class, stats in ((EconomyStats, bundle.economy),
+                               (InnerPoliticsStats, bundle.inner_politics)):
+        layout = stats_class._get_pretty_layout()
+        text = "\n".join([stats.debug()] * args.countries)
+        lines = _normalize_lines(text)
+        specs = _parse_specs(layout)
+        matcher = _compiled_matcher(layout)
+
+        reference = min(timeit.repeat(
+            lambda: [_find_matches_in_line(line, specs) for line in lines],
+            number=1, repeat=args.repeat))
+        compiled = min(timeit.repeat(
+            lambda: [matcher.find(line) for line in lines],
+            number=1, repeat=args.repeat))
+        full_parse = min(timeit.repeat(
+            lambda: stats_class.from_stats_text(text),
+            number=1, repeat=args.repeat))
+
+        print(f"{stats_class.__name__}: {len(lines)} lines, {len(specs)} specs")
+        print(f"  reference str.find : {reference * 1000:8.1f} ms")
+        print(f"  compiled matcher   : {compiled * 1000:8.1f} ms "
+              f"(x{reference / compiled:.1f})")
+        print(f"  from_stats_text    : {full_parse * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark: cached `StatsBase.render_pretty` versus a full layout walk.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_render_pretty [--countries 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from stats.pretty import render_pretty
+from tests.factories import make_basic_bundle
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    world = [make_basic_bundle() for _ in range(args.countries)]
+    stats_list = [stats for bundle in world
+                  for stats in (bundle.economy, bundle.industry,
+                                bundle.agriculture, bundle.inner_politics)]
+    layouts = [stats._get_pretty_layout() for stats in stats_list]
+
+    uncached = min(timeit.repeat(
+        lambda: [render_pretty(stats, layout)
+                 for stats, layout in zip(stats_list, layouts)],
+        number=1, repeat=args.repeat))
+    # The first pass fills the caches, later passes hit them.
+    [str(stats) for stats in stats_list]
+    cached = min(timeit.repeat(
+        lambda: [str(stats) for stats in stats_list],
+        number=1, repeat=args.repeat))
+
+    print(f"{len(stats_list)} stats objects")
+    print(f"  layout walk : {uncached * 1000:8.1f} ms")
+    print(f"  cached      : {cached * 1000:8.1f} ms (x{uncached / cached:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark: scaling of independent games over threads versus processes.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_threads [--games 64] [--turns 5] [--workers 1,2,4,8]
+
+On a standard CPython build the thread pool stays near one core because of
+the GIL; run the same command under a free-threaded build (``python3.13t``
+or later, GIL disabled) to see threads scale. Process timings include
+starting the pool and pickling the stats.
+
+Set ``WPI_LOG_LEVEL=WARNING`` to leave debug logging out of the timing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import platform
+import timeit
+
+from modules.run_start_skip import GameStats
+from modules.thread_runner import RunnerBackend, gil_enabled, run_games
+from tests.factories import make_basic_bundle
+
+
+def _stats(games: int) -> list[GameStats]:
+    bundle = make_basic_bundle()
+    stats = GameStats(
+        Economy=bundle.economy,
+        Industry=bundle.industry,
+        Agriculture=bundle.agriculture,
+        InnerPolitics=bundle.inner_politics,
+    )
+    return [stats] * games
+
+
+def _time(stats: list[GameStats], turns: int, workers: int,
+          backend: RunnerBackend, repeat: int) -> float:
+    def play() -> None:
+        run_games(stats, turns=turns, master_seed=0, workers=workers,
+                  backend=backend)
+
+    return min(timeit.repeat(play, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=64)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--workers", default="1,2,4,8",
+                        help="Comma-separated pool sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stats = _stats(args.games)
+    pool_sizes = [int(size) for size in args.workers.split(",")]
+    total_turns = args.games * args.turns
+
+    print(f"Python {platform.python_version()} "
+          f"({'GIL enabled' if gil_enabled() else 'free-threaded, no GIL'}), "
+          f"{total_turns} turns of the basic mode")
+    # workers=1 runs inline, the baseline of both backends
+    inline = _time(stats, args.turns, 1, RunnerBackend.THREAD, args.repeat)
+    print(f"  inline          : {inline * 1e6 / total_turns:8.1f} us/turn")
+    for backend in RunnerBackend:
+        for size in pool_sizes:
+            if size == 1:
+                continue
+            seconds = _time(stats, args.turns, size, backend, args.repeat)
+            print(f"  {backend.value:7} x{size:<3}   : "
+                  f"{seconds * 1e6 / total_turns:8.1f} us/turn "
+                  f"(x{inline / seconds:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark: `StatsBase.from_trusted` versus validated construction.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_trusted_construction [--count 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from tests.factories import make_basic_bundle
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    bundle = make_basic_bundle()
+    for stats in (bundle.economy, bundle.industry, bundle.agriculture,
+                  bundle.inner_politics):
+        stats_class = type(stats)
+        data = stats.model_dump()
+
+        validated = min(timeit.repeat(
+            lambda: stats_class.model_validate(data),
+            number=args.count, repeat=args.repeat))
+        trusted = min(timeit.repeat(
+            lambda: stats_class.from_trusted(data),
+            number=args.count, repeat=args.repeat))
+
+        per_call = 1e6 / args.count
+        print(f"{stats_class.__name__}:")
+        print(f"  model_validate : {validated * per_call:8.1f} us")
+        print(f"  from_trusted   : {trusted * per_call:8.1f} us "
+              f"(x{validated / trusted:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,63 +2,55 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
-from typing import List
-
-import numpy as np
+from typing import TYPE_CHECKING, List, Optional
 
 from functions.inbuilt import InbuiltFunctions
+from functions.piecewise import LinearInterpolation, StepFunction
+from functions.rng import resolve_rng
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @dataclass(frozen=True)
 class AdditionalWastesModel:
+    # Costs per worker for a security percent in (0, 20], (20, 40], ...
+    COSTS_PER_WORKER = StepFunction(
+        bounds=(0, 20, 40, 60, 80, 100),
+        values=(3, 0.5, 0.75, 1, 1.5, 2, 3),
+        closed="right",
+    )
+
     @staticmethod
     def calculate(security_percent: float) -> float:
-        calculation_rules = [
-            {"gt": 0, "le": 20, "count_per_worker": 0.5},
-            {"gt": 20, "le": 40, "count_per_worker": 0.75},
-            {"gt": 40, "le": 60, "count_per_worker": 1},
-            {"gt": 60, "le": 80, "count_per_worker": 1.5},
-            {"gt": 80, "le": 100, "count_per_worker": 2},
-            {"gt": 100, "le": float('inf'), "count_per_worker": 3},
-        ]
-        for rule in calculation_rules:
-            if rule["gt"] < security_percent <= rule["le"]:
-                return rule["count_per_worker"]
-        return 3
+        return AdditionalWastesModel.COSTS_PER_WORKER(security_percent)
 
 
 @dataclass(frozen=True)
 class WorkersCountModel:
+    BASE_WORKERS = LinearInterpolation(points=(
+        (0, 5_000),
+        (1_000_000, 5_000),
+        (10_000_000, 100_000),
+        (50_000_000, 275_000),
+        (125_000_000, 500_000),
+        (200_000_000, 1_000_000),
+        (400_000_000, 2_000_000),
+        (500_000_000, 2_500_000),
+    ))
+
     @staticmethod
     def calculate(
         population_count: int,
         workers_percent: float,
         workers_redistribution: float,
     ) -> int:
-        points = [
-            (0, 5_000),
-            (1_000_000, 5_000),
-            (10_000_000, 100_000),
-            (50_000_000, 275_000),
-            (125_000_000, 500_000),
-            (200_000_000, 1_000_000),
-            (400_000_000, 2_000_000),
-            (500_000_000, 2_500_000),
-            (float("inf"), 5_000_000),
-        ]
+        base_workers = WorkersCountModel.BASE_WORKERS(population_count)
+        if base_workers is None:
+            return 0
         redistribution_factor = 1 - workers_redistribution / 100
-        for i in range(len(points) - 1):
-            pop1, workers1 = points[i]
-            pop2, workers2 = points[i + 1]
-            if pop1 <= population_count <= pop2:
-                if pop2 == float("inf"):
-                    base_workers = workers1
-                else:
-                    t = (population_count - pop1) / (pop2 - pop1)
-                    base_workers = workers1 + (workers2 - workers1) * t
-                adjusted_workers = base_workers * redistribution_factor
-                return round(adjusted_workers * workers_percent)
-        return 0
+        adjusted_workers = base_workers * redistribution_factor
+        return round(adjusted_workers * workers_percent)
 
 
 @dataclass(frozen=True)
@@ -225,6 +217,7 @@ class FoodModel:
         food_security: float,
         biome_richness: float,
         death_probability: float = 0.36,
+        rng: Optional[np.random.Generator] = None,
     ) -> int:
         shortage = max(0.0, -food_security)
         if shortage <= 0:
@@ -233,8 +226,7 @@ class FoodModel:
         shortage_fraction = min(1.0, shortage / total_need)
         at_risk = int(math.ceil(population_count * shortage_fraction))
         reduction = 0.02 * (biome_richness / 10.0)
-        p_eff = float(np.clip(death_probability * (1.0 - reduction), 0.12, 0.36))
-        rng = np.random.default_rng()
-        deaths = int(rng.binomial(at_risk, p_eff))
+        p_eff = min(max(death_probability * (1.0 - reduction), 0.12), 0.36)
+        deaths = int(resolve_rng(rng).binomial(at_risk, p_eff))
         reduction = 0.05 * (biome_richness / 10.0)
         return max(0, round(deaths * (1.0 - reduction)))
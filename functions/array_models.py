@@ -0,0 +1,891 @@
+"""NumPy counterparts of the formula models in `functions/*_models.py`.
+
+Every class here has the name and the methods of its scalar model, but
+accepts arrays (or scalars) and broadcasts. List inputs such as
+`securities` or `gov_wastes` become arrays whose last axis holds the items.
+Threshold chains are expressed with ``np.select`` / ``np.where``.
+
+Stochastic models take a generator and an optional `size`. With the same
+seed they consume the stream in the order a loop over the scalar model
+would, so ``rng.uniform`` / ``rng.normal`` / ``rng.binomial`` results match
+element by element.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from functions import (
+    agriculture_models,
+    economy_models,
+    society_models,
+    trade_models,
+)
+from functions.industry_models import (
+    IndustryEstimator,
+    current_industry_estimator,
+)
+from functions.rng import resolve_rng
+from functions.trade_models import ForexFeatureBatch
+
+
+_INV_SQRT_2PI = 1 / np.sqrt(2 * np.pi)
+
+
+def _sigmoid(value: np.ndarray) -> np.ndarray:
+    return 1 / (1 + np.exp(-value))
+
+
+# --- economy_models ---------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class PopulationGrowthModel:
+    @staticmethod
+    def calculate(current_population_count: npt.ArrayLike) -> np.ndarray:
+        population = np.asarray(current_population_count, dtype=float)
+        growth_factor = economy_models.PopulationGrowthModel.GROWTH_FACTOR
+        return population * 10 ** -3 * growth_factor.evaluate(population)
+
+
+@dataclass(frozen=True)
+class TradePotentialModel:
+    @staticmethod
+    def calculate(trade_rank: npt.ArrayLike,
+                  trade_efficiency: npt.ArrayLike) -> np.ndarray:
+        trade_rank = np.asarray(trade_rank, dtype=float)
+        efficiency = np.asarray(trade_efficiency, dtype=float) / 100
+        return np.where(trade_rank >= 7,
+                        5 + 3 * (trade_rank - 6) * efficiency,
+                        3 + 2 * (trade_rank - 2) * efficiency)
+
+
+@dataclass(frozen=True)
+class BranchIncomeModel:
+    @staticmethod
+    def calculate(branches_count: npt.ArrayLike,
+                  branches_efficiency: npt.ArrayLike) -> np.ndarray:
+        return np.asarray(branches_count) * (
+                np.asarray(branches_efficiency) / 10)
+
+
+# --- income_models ----------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class TaxIncomeModel:
+    @staticmethod
+    def calculate(
+        universal_tax: npt.ArrayLike,
+        excise: npt.ArrayLike,
+        additions: npt.ArrayLike,
+        small_enterprise_tax: npt.ArrayLike,
+        large_enterprise_tax: npt.ArrayLike,
+        small_enterprise_percent: npt.ArrayLike,
+        large_enterprise_count: npt.ArrayLike,
+        population_count: npt.ArrayLike,
+    ) -> np.ndarray:
+        universal_tax = np.asarray(universal_tax, dtype=float)
+        excise = np.asarray(excise, dtype=float)
+        population_count = np.asarray(population_count, dtype=float)
+        universal_tax_income = 1.9882 * (universal_tax / ((8 + universal_tax) * 10)) * population_count / 1000
+        excise_income = excise / (excise + 100) * 2000
+        enterprises = population_count * small_enterprise_percent / 1000
+        coefficient = enterprises - enterprises * 0.4
+        small_enterprise_tax_income = small_enterprise_tax * coefficient / 3000
+        large_enterprise_tax_income = (np.asarray(large_enterprise_tax) / 10) * large_enterprise_count
+        return universal_tax_income + excise_income + small_enterprise_tax_income + large_enterprise_tax_income + additions
+
+
+@dataclass(frozen=True)
+class MoneyIncomeModel:
+    @staticmethod
+    def collaboration_factor(agriculture_efficiency: npt.ArrayLike,
+                             civil_efficiency: npt.ArrayLike) -> np.ndarray:
+        return 1 + ((np.asarray(agriculture_efficiency) / 1000)
+                    + (np.asarray(civil_efficiency) / 1000))
+
+    @staticmethod
+    def inflation_factor(inflation: npt.ArrayLike) -> np.ndarray:
+        return 1 - (np.asarray(inflation) / 100)
+
+    @staticmethod
+    def agriculture_factor(current_tax_income: npt.ArrayLike,
+                           agriculture_development: npt.ArrayLike,
+                           workers_count: npt.ArrayLike) -> np.ndarray:
+        workers_count = np.asarray(workers_count)
+        base_addition = (np.asarray(current_tax_income) / 100) * agriculture_development / 100
+        return np.where(workers_count < 1_000_000, base_addition,
+                        base_addition * (workers_count // 1_000_000))
+
+    @staticmethod
+    def boost(stability: npt.ArrayLike, poor_level: npt.ArrayLike,
+              jobless_level: npt.ArrayLike) -> np.ndarray:
+        stability = np.asarray(stability, dtype=float)
+        poor_level = np.asarray(poor_level)
+        jobless_level = np.asarray(jobless_level)
+        weight_80_90 = np.clip((stability - 80) / 10, 0.0, 1.0)
+        weight_above_90 = np.clip((stability - 90) / 10, 0.0, 1.0)
+
+        poor_jobless_weight = ((poor_level < 3) & (jobless_level < 10)).astype(float)
+        both_present = ((poor_level > 0) & (jobless_level > 0)).astype(float)
+        value_80_90 = 1.5 * poor_jobless_weight + 1.17 * (1 - poor_jobless_weight)
+        value_above_90 = 1.7 * (1 - both_present) + 1.18 * both_present
+        return (1 - weight_80_90 - weight_above_90) + weight_80_90 * value_80_90 + weight_above_90 * value_above_90
+
+    @staticmethod
+    def simple_boost(stability: npt.ArrayLike) -> np.ndarray:
+        stability = np.asarray(stability, dtype=float)
+        return np.where(stability < 20, 0.5,
+                        0.008 * np.minimum(stability, 100) + 0.493)
+
+
+@dataclass(frozen=True)
+class InfrastructureModel:
+    @staticmethod
+    def expected_wastes(population_count: npt.ArrayLike) -> np.ndarray:
+        return (np.asarray(population_count) // 10000) * 0.34
+
+
+@dataclass(frozen=True)
+class LogisticsModel:
+    @staticmethod
+    def expected_wastes(government_wastes: npt.ArrayLike) -> np.ndarray:
+        return np.sum(government_wastes, axis=-1) * 0.2
+
+
+# --- society_models ---------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CulturalCoefficientModel:
+    @staticmethod
+    def calculate(cultural_level: npt.ArrayLike,
+                  egocentrism_development: npt.ArrayLike) -> np.ndarray:
+        return np.maximum(0.0, 0.025 * np.asarray(cultural_level) - 0.105
+                          + (np.asarray(egocentrism_development) / 100))
+
+
+@dataclass(frozen=True)
+class ContentmentModel:
+    @staticmethod
+    def coefficients(contentment: npt.ArrayLike
+                     ) -> Tuple[np.ndarray, np.ndarray]:
+        contentment = np.asarray(contentment)
+        return 0.004 * contentment + 0.754, 0.005 * contentment + 0.528
+
+
+@dataclass(frozen=True)
+class SuccessChanceModel:
+    @staticmethod
+    def calculate(
+        knowledge_level: npt.ArrayLike,
+        education_level: npt.ArrayLike,
+        erudition_will: npt.ArrayLike,
+        rng: Optional[np.random.Generator] = None,
+        size: Optional[int | Tuple[int, ...]] = None,
+    ) -> np.ndarray:
+        safe_erudition_will = np.maximum(np.asarray(erudition_will, dtype=float), 1e-9)
+        draws = resolve_rng(rng).normal(
+            np.add(knowledge_level, education_level),
+            (safe_erudition_will / 10) ** -1, size)
+        return draws // 2
+
+
+@dataclass(frozen=True)
+class SocietyDeclineModel:
+    @staticmethod
+    def calculate(
+        contentment: npt.ArrayLike,
+        government_trust: npt.ArrayLike,
+        many_children_traditions: npt.ArrayLike,
+        sexual_asceticism: npt.ArrayLike,
+        egocentrism_development: npt.ArrayLike,
+        education_level: npt.ArrayLike,
+        erudition_will: npt.ArrayLike,
+        cultural_level: npt.ArrayLike,
+        violence_tendency: npt.ArrayLike,
+        unemployment_rate: npt.ArrayLike,
+        grace_of_the_highest: npt.ArrayLike,
+        commitment_to_cause: npt.ArrayLike,
+        departure_from_truths: npt.ArrayLike,
+    ) -> np.ndarray:
+        positive_factors = (
+            np.asarray(contentment) * 0.05
+            + np.asarray(government_trust) * 0.15
+            + np.asarray(many_children_traditions) * 0.05
+            + np.asarray(sexual_asceticism) * 0.25
+            + np.asarray(education_level) * 0.05
+            + np.asarray(erudition_will) * 0.075
+            + np.asarray(cultural_level) * 0.05
+            + np.asarray(grace_of_the_highest) * 0.7
+            + np.asarray(commitment_to_cause) * 0.15
+        )
+        negative_factors = (
+            np.asarray(violence_tendency) * 0.5
+            + np.asarray(egocentrism_development) * 0.3
+            + np.asarray(unemployment_rate) * 0.3
+            + np.asarray(departure_from_truths) * 1.1
+        )
+        societal_decline = np.minimum(
+            np.maximum(0.0, negative_factors - positive_factors), 100)
+        return np.round(societal_decline, 2)
+
+
+@dataclass(frozen=True)
+class StabilityModel:
+    @staticmethod
+    def coefficient(
+        poor_level: npt.ArrayLike,
+        jobless_level: npt.ArrayLike,
+        med_waste: npt.ArrayLike,
+        population: npt.ArrayLike,
+        rng: Optional[np.random.Generator] = None,
+        size: Optional[int | Tuple[int, ...]] = None,
+    ) -> np.ndarray:
+        population = np.asarray(population, dtype=float)
+        if np.any(population <= 0):
+            raise ValueError("Численность населения должна быть положительным числом.")
+        med_waste = np.asarray(med_waste, dtype=float)
+        med_waste_per_1000 = (med_waste / population) * 1000000
+        ranges = society_models.StabilityModel.RANGES
+        index = ranges.indices(med_waste_per_1000)
+        low, high = np.moveaxis(ranges.evaluate(med_waste_per_1000), -1, 0)
+        drawn = (index > 0) | (np.asarray(poor_level) < 56) | (med_waste < 36)
+
+        shape = np.broadcast(low, drawn).shape if size is None else size
+        low, high, drawn = (np.broadcast_to(a, shape) for a in (low, high, drawn))
+        # Collapsed elements skip the draw, as the scalar model does
+        result = np.full(shape, 0.01)
+        result[drawn] = resolve_rng(rng).uniform(low[drawn], high[drawn])
+        return np.round(result, 3)
+
+
+@dataclass(frozen=True)
+class IncomeModifierModel:
+    @staticmethod
+    def from_agriculture(food_security: npt.ArrayLike) -> np.ndarray:
+        food_security = np.asarray(food_security, dtype=float)
+        return np.select(
+            [food_security <= 100, food_security <= 150],
+            [0.45 + 0.55 * (food_security / 100) ** 2,
+             1 + 0.15 * ((food_security - 100) / 50) ** 2],
+            default=1.15,
+        )
+
+    @staticmethod
+    def from_social_decline(social_decline: npt.ArrayLike) -> np.ndarray:
+        return 1 - (np.asarray(social_decline) / 100)
+
+    @staticmethod
+    def from_panic_level(panic_level: npt.ArrayLike) -> np.ndarray:
+        return 1 - (np.asarray(panic_level) / 100)
+
+    @staticmethod
+    def from_food_diversity(food_diversity: npt.ArrayLike) -> np.ndarray:
+        x = -np.asarray(food_diversity, dtype=float) / 10
+        safe_x = np.where(x == 0, 1.0, x)
+        kernel = _INV_SQRT_2PI * np.exp(-((safe_x - 1) ** 2) / (2 * safe_x ** 2))
+        return np.where(x == 0, 0.0, kernel) * (1.9 / 0.4)
+
+
+@dataclass(frozen=True)
+class DemographyModel:
+    @staticmethod
+    def decrement_coefficient(decrement_coefficient: npt.ArrayLike) -> np.ndarray:
+        return -0.01 * np.asarray(decrement_coefficient) + 1
+
+
+@dataclass(frozen=True)
+class StateApparatusModel:
+    @staticmethod
+    def expected_size(population_count: npt.ArrayLike,
+                      apparatus_wastes: npt.ArrayLike) -> np.ndarray:
+        n = np.asarray(population_count) // 1000000
+        expected_value = np.asarray(apparatus_wastes) * n / 100
+        return np.round(_sigmoid(expected_value * 1000 // 13) * 100)
+
+
+@dataclass(frozen=True)
+class KnowledgeModel:
+    @staticmethod
+    def calculate(population_count: npt.ArrayLike,
+                  knowledge_wastes: npt.ArrayLike) -> np.ndarray:
+        population_count = np.asarray(population_count, dtype=float)
+        knowledge_wastes = np.asarray(knowledge_wastes, dtype=float)
+        populated = population_count > 0
+        safe_population = np.where(populated, population_count, 1.0)
+        expected_wastes = safe_population / 28000
+        per_capita = knowledge_wastes / safe_population
+        constant = per_capita * 1e4
+        minimal_knowledge = np.round(
+            per_capita * np.where(safe_population > 1e6, 1e6, 1e5))
+        knowledge = np.where(
+            expected_wastes >= knowledge_wastes,
+            np.tanh(constant) * 120,
+            _sigmoid(constant) * 100,
+        ) + minimal_knowledge
+        return np.where(populated, knowledge, 0.0)
+
+
+@dataclass(frozen=True)
+class IntegrityOfFaithModel:
+    @staticmethod
+    def factor(integrity_of_faith: npt.ArrayLike) -> np.ndarray:
+        return 1 + (np.asarray(integrity_of_faith) / 5000)
+
+
+@dataclass(frozen=True)
+class CorruptionModel:
+    @staticmethod
+    def apply(corruption_level: npt.ArrayLike) -> np.ndarray:
+        return -0.131 * np.asarray(corruption_level) + 1.077
+
+
+# --- agriculture_models -----------------------------------------------------
+
+
+@dataclass(frozen=True)
+class AdditionalWastesModel:
+    @staticmethod
+    def calculate(security_percent: npt.ArrayLike) -> np.ndarray:
+        costs = agriculture_models.AdditionalWastesModel.COSTS_PER_WORKER
+        return costs.evaluate(security_percent)
+
+    @classmethod
+    def total(cls, securities: npt.ArrayLike) -> np.ndarray:
+        """Sum over technology, fertilizer and tool securities."""
+        return cls.calculate(np.asarray(securities)[..., :3]).sum(axis=-1)
+
+
+@dataclass(frozen=True)
+class WorkersCountModel:
+    @staticmethod
+    def calculate(
+        population_count: npt.ArrayLike,
+        workers_percent: npt.ArrayLike,
+        workers_redistribution: npt.ArrayLike,
+    ) -> np.ndarray:
+        base_workers = agriculture_models.WorkersCountModel.BASE_WORKERS.evaluate(
+            population_count)
+        redistribution_factor = 1 - np.asarray(workers_redistribution) / 100
+        adjusted = np.round(base_workers * redistribution_factor * workers_percent)
+        return np.where(np.isnan(base_workers), 0.0, adjusted)
+
+
+@dataclass(frozen=True)
+class AgricultureWastesModel:
+    @staticmethod
+    def calculate(
+        workers_count: npt.ArrayLike,
+        securities: npt.ArrayLike,
+        husbandry: npt.ArrayLike,
+        livestock: npt.ArrayLike,
+        others: npt.ArrayLike,
+    ) -> np.ndarray:
+        workers_wastes = np.asarray(workers_count) * AdditionalWastesModel.total(securities) / 10000
+        workers_wastes = workers_wastes * (1 + np.asarray(husbandry) * 0.0028)
+        workers_wastes = workers_wastes * (1 + np.asarray(livestock) * 0.005)
+        workers_wastes = workers_wastes * (1 + np.asarray(others) * 0.0035)
+        return workers_wastes
+
+
+def _mean_security(securities: npt.ArrayLike) -> np.ndarray:
+    securities = np.asarray(securities, dtype=float)
+    if securities.shape[-1] == 0:
+        return np.zeros(securities.shape[:-1])
+    return securities.mean(axis=-1)
+
+
+def _balance_bonus(husbandry: npt.ArrayLike, livestock: npt.ArrayLike,
+                   others: npt.ArrayLike) -> np.ndarray:
+    deviation = (np.abs(np.asarray(husbandry) - 40)
+                 + np.abs(np.asarray(livestock) - 40)
+                 + np.abs(np.asarray(others) - 20)) / 3
+    return 1.0 / (1.0 + deviation / 30.0)
+
+
+@dataclass(frozen=True)
+class AgricultureDevelopmentModel:
+    @staticmethod
+    def calculate(
+        securities: npt.ArrayLike,
+        workers_count: npt.ArrayLike,
+        population_count: npt.ArrayLike,
+        biome_richness: npt.ArrayLike,
+        food_diversity: npt.ArrayLike,
+        husbandry: npt.ArrayLike,
+        livestock: npt.ArrayLike,
+        others: npt.ArrayLike,
+    ) -> np.ndarray:
+        s_score = np.tanh(_mean_security(securities) / 50)
+        balance_bonus = _balance_bonus(husbandry, livestock, others)
+        workers_ratio = np.asarray(workers_count) / np.maximum(population_count, 1)
+        diversity_bonus = np.maximum(0.0, food_diversity) / 100.0
+        current = s_score * balance_bonus * (1.0 + workers_ratio) * (1.0 + diversity_bonus)
+        max_possible = 1.0 * 1.0 * 1.3 * (1.0 + np.asarray(biome_richness) / 100.0)
+        ratio = np.divide(current, max_possible,
+                          out=np.zeros(np.broadcast(current, max_possible).shape),
+                          where=max_possible != 0)
+        return np.minimum(100.0, ratio * 100.0)
+
+    @staticmethod
+    def approximate_efficiency(securities: npt.ArrayLike) -> np.ndarray:
+        return _mean_security(securities)
+
+    @classmethod
+    def approximate_food_security(
+        cls,
+        biome_richness: npt.ArrayLike,
+        overproduction_effects: npt.ArrayLike,
+        securities: npt.ArrayLike,
+    ) -> np.ndarray:
+        agriculture_efficiency = cls.approximate_efficiency(securities)
+        stock = np.where(
+            agriculture_efficiency >= 75,
+            np.asarray(overproduction_effects) * 6 * (1 + np.asarray(biome_richness) / 1000),
+            0,
+        )
+        x = agriculture_efficiency / 10
+        return x ** 2 + 4 * x + 10 + stock
+
+    @classmethod
+    def approximate_development(
+        cls,
+        approximate_food_security: npt.ArrayLike,
+        securities: npt.ArrayLike,
+    ) -> np.ndarray:
+        agriculture_efficiency = cls.approximate_efficiency(securities)
+        value = (np.asarray(approximate_food_security) * agriculture_efficiency / 8) / 1000
+        sigmoid_result = _sigmoid(value) * 100
+        return np.where(
+            np.minimum(agriculture_efficiency, approximate_food_security) < 50,
+            sigmoid_result,
+            np.minimum(100.0, sigmoid_result * (100 / 77)),
+        )
+
+
+@dataclass(frozen=True)
+class AgricultureEfficiencyModel:
+    @staticmethod
+    def calculate(
+        securities: npt.ArrayLike,
+        biome_richness: npt.ArrayLike,
+        husbandry: npt.ArrayLike,
+        livestock: npt.ArrayLike,
+        others: npt.ArrayLike,
+        agriculture_deceases: npt.ArrayLike,
+        agriculture_natural_deceases: npt.ArrayLike,
+        workers_count: npt.ArrayLike,
+        population_count: npt.ArrayLike,
+    ) -> np.ndarray:
+        s_score = np.tanh(_mean_security(securities) / 50)
+        balance_bonus = _balance_bonus(husbandry, livestock, others)
+        p_land = (np.asarray(biome_richness) / 100.0) * balance_bonus * s_score
+        workers_ratio = np.asarray(workers_count) / np.maximum(population_count, 1)
+        r = 1.0 + workers_ratio * 2.0
+        d = (np.asarray(agriculture_deceases) + agriculture_natural_deceases) / 100.0
+        base_decay = 0.05
+        disease_factor = 0.95
+        e_star = (r * p_land) / (base_decay + disease_factor * d + 1e-9)
+        return np.minimum(100.0, e_star * 100.0)
+
+
+@dataclass(frozen=True)
+class FoodModel:
+    @staticmethod
+    def diversity(husbandry: npt.ArrayLike, livestock: npt.ArrayLike,
+                  others: npt.ArrayLike,
+                  biome_richness: npt.ArrayLike) -> np.ndarray:
+        standard_deviation = (np.abs(np.asarray(husbandry) - 40)
+                              + np.abs(np.asarray(livestock) - 40)
+                              + np.abs(np.asarray(others) - 20))
+        return biome_richness - standard_deviation / 3
+
+    @staticmethod
+    def income(
+        workers_count: npt.ArrayLike,
+        securities: npt.ArrayLike,
+        overprotective_effects: npt.ArrayLike,
+        agriculture_deceases: npt.ArrayLike,
+        agriculture_natural_deceases: npt.ArrayLike,
+        environmental_food: npt.ArrayLike,
+    ) -> np.ndarray:
+        base = 0.25
+        costs_per_workers = AdditionalWastesModel.total(securities) - base * 3
+        coefficient = (costs_per_workers / base) * 1.75
+        food_income = (np.asarray(workers_count) / 10000) * (coefficient + 10)
+        food_income = food_income * (1 + (np.asarray(overprotective_effects) / 100))
+        food_income = food_income * (1 - (np.asarray(agriculture_deceases) / 100))
+        food_income = food_income * (1 - (np.asarray(agriculture_natural_deceases) / 100))
+        return food_income + environmental_food
+
+    @staticmethod
+    def consumption(population_count: npt.ArrayLike,
+                    consumption_factor: npt.ArrayLike) -> np.ndarray:
+        return (np.asarray(population_count) / 10000) * (
+                2.5 + (0.1 * np.asarray(consumption_factor)))
+
+    @staticmethod
+    def security(food_income: npt.ArrayLike,
+                 food_consumption: npt.ArrayLike) -> np.ndarray:
+        return np.subtract(food_income, food_consumption)
+
+    @staticmethod
+    def supplies(
+        current_food_supplies: npt.ArrayLike,
+        food_security: npt.ArrayLike,
+        overstock_percent: npt.ArrayLike,
+        storages_upkeep: npt.ArrayLike,
+    ) -> np.ndarray:
+        food_security = np.asarray(food_security)
+        available_storage = np.asarray(storages_upkeep) * 39
+        food_supplies = current_food_supplies + np.maximum(
+            food_security - 400, food_security * overstock_percent)
+        return np.minimum(food_supplies, available_storage)
+
+    @staticmethod
+    def underfeed(
+        population_count: npt.ArrayLike,
+        food_security: npt.ArrayLike,
+        biome_richness: npt.ArrayLike,
+        death_probability: float = 0.36,
+        rng: Optional[np.random.Generator] = None,
+        size: Optional[int | Tuple[int, ...]] = None,
+    ) -> np.ndarray:
+        population_count = np.asarray(population_count, dtype=float)
+        biome_richness = np.asarray(biome_richness, dtype=float)
+        shortage = np.maximum(0.0, -np.asarray(food_security, dtype=float))
+        starving = shortage > 0
+        total_need = (population_count / 10000.0) * 2.5
+        safe_need = np.where(starving & (total_need > 0), total_need, 1.0)
+        shortage_fraction = np.minimum(1.0, shortage / safe_need)
+        at_risk = np.where(starving, np.ceil(population_count * shortage_fraction), 0)
+        p_eff = np.clip(death_probability * (1.0 - 0.02 * (biome_richness / 10.0)), 0.12, 0.36)
+        # n == 0 does not consume the stream, just like the scalar early exit
+        deaths = resolve_rng(rng).binomial(at_risk.astype(np.int64), p_eff, size)
+        survivors_factor = 1.0 - 0.05 * (biome_richness / 10.0)
+        return np.maximum(0, np.round(deaths * survivors_factor))
+
+
+# --- industry_models --------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class IndustryCoefficientModel:
+    @staticmethod
+    def calculate(
+        processing_production: npt.ArrayLike,
+        processing_usage: npt.ArrayLike,
+        processing_efficiency: npt.ArrayLike,
+        mean_score: npt.ArrayLike,
+    ) -> np.ndarray:
+        production = np.asarray(processing_production, dtype=float)
+        usage = np.asarray(processing_usage, dtype=float)
+        industry_coefficient_base = (np.asarray(mean_score) + processing_efficiency) / 2
+        industry_coefficient_loss = np.sqrt((100 - production) ** 2 + (100 - usage) ** 2) / 4
+        decrement = 1 - np.abs(production - usage) / np.maximum(production, usage)
+        return np.minimum((industry_coefficient_base - industry_coefficient_loss) * decrement, 100)
+
+
+@dataclass(frozen=True)
+class CivilUsageModel:
+    @staticmethod
+    def calculate(civil_security: npt.ArrayLike, tvr1: npt.ArrayLike,
+                  tvr2: npt.ArrayLike) -> np.ndarray:
+        return np.round((np.asarray(civil_security) + tvr1 + tvr2) / 3)
+
+
+@dataclass(frozen=True)
+class IndustryBasicStatsModel:
+    """Vectorized `industry_models.IndustryBasicStatsModel`.
+
+    The sampling estimators draw ``SAMPLES`` points per element, all
+    elements first and then one uniform per element. For a single element
+    this is the scalar stream; `LEGACY` uses the same scheme as `NUMPY`.
+    """
+
+    SAMPLES = 1000
+
+    @staticmethod
+    def _sampled_params(
+        mean_value: np.ndarray,
+        std_dev: np.ndarray,
+        rng: np.random.Generator,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        mean_value = mean_value[..., np.newaxis]
+        std_dev = std_dev[..., np.newaxis]
+        possible_values = rng.normal(
+            mean_value, std_dev,
+            mean_value.shape[:-1] + (IndustryBasicStatsModel.SAMPLES,))
+        weights = np.exp(-((possible_values - mean_value) ** 2) / (2 * std_dev ** 2))
+        total_density = weights.sum(axis=-1, keepdims=True)
+        weights = np.where(
+            total_density == 0, 1 / IndustryBasicStatsModel.SAMPLES,
+            weights / np.where(total_density == 0, 1.0, total_density))
+
+        payoff = (weights * possible_values).sum(axis=-1)
+        dispersion = (weights * (possible_values - payoff[..., np.newaxis]) ** 2).sum(axis=-1)
+        return payoff, dispersion
+
+    @staticmethod
+    def _shrink_dispersion(payoff: np.ndarray,
+                           dispersion: np.ndarray) -> np.ndarray:
+        dispersion = np.where(payoff <= 0, 0.0, dispersion)
+        # Halving is exact, so this repeats the scalar loop element-wise
+        while True:
+            shrink = payoff < dispersion
+            if not shrink.any():
+                return dispersion
+            dispersion = np.where(shrink, dispersion / 2, dispersion)
+
+    @staticmethod
+    def calculate(
+        industry_coefficient: npt.ArrayLike,
+        civil_usage: npt.ArrayLike,
+        standardization: npt.ArrayLike,
+        rng: Optional[np.random.Generator] = None,
+        estimator: Optional[IndustryEstimator] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        estimator = IndustryEstimator(estimator or current_industry_estimator())
+        industry_coefficient = np.asarray(industry_coefficient, dtype=float)
+        civil_usage = np.asarray(civil_usage, dtype=float)
+        mean_value = (industry_coefficient + civil_usage + (np.asarray(standardization) / 1.35)) / 2.5
+        std_dev = 100 / np.maximum(civil_usage, 1e-9) + 0.2
+        mean_value, std_dev = np.broadcast_arrays(mean_value, std_dev)
+
+        if estimator is IndustryEstimator.EXPECTED:
+            payoff = mean_value
+            dispersion = IndustryBasicStatsModel._shrink_dispersion(payoff, std_dev ** 2 / 2)
+            efficiency = payoff
+        else:
+            rng = resolve_rng(rng)
+            payoff, dispersion = IndustryBasicStatsModel._sampled_params(mean_value, std_dev, rng)
+            dispersion = IndustryBasicStatsModel._shrink_dispersion(payoff, dispersion)
+            efficiency = rng.uniform(payoff - dispersion, payoff + dispersion)
+
+        max_potential = (industry_coefficient + civil_usage) / 1.8
+        expected_wastes = payoff * 0.3
+
+        difference = civil_usage - max_potential
+        adjustment = np.maximum(0.0, np.minimum((difference // 5) * 2, 7))
+        return efficiency - adjustment, max_potential, expected_wastes
+
+
+@dataclass(frozen=True)
+class CivilEfficiencyLogisticModel:
+    @staticmethod
+    def calculate(logistic: npt.ArrayLike) -> np.ndarray:
+        logistic = np.asarray(logistic, dtype=float)
+        low = np.minimum(logistic, 30)
+        return np.where(logistic <= 30, 1 + np.log1p(low) / 10,
+                        1.3 + (logistic - 50) / 100)
+
+
+@dataclass(frozen=True)
+class IndustryIncomeModel:
+    @staticmethod
+    def calculate(
+        gov_wastes: npt.ArrayLike,
+        civil_usage: npt.ArrayLike,
+        max_potential: npt.ArrayLike,
+        expected_wastes: npt.ArrayLike,
+    ) -> np.ndarray:
+        gov_wastes = np.asarray(gov_wastes, dtype=float)
+        if gov_wastes.shape[-1] == 0:
+            return np.zeros(gov_wastes.shape[:-1])
+        adjusted_wastes = np.maximum(0.0, gov_wastes.mean(axis=-1) * 0.3 - expected_wastes)
+        return adjusted_wastes * (max_potential / np.maximum(civil_usage, 1e-9))
+
+
+@dataclass(frozen=True)
+class ConsumptionOfGoodsModel:
+    @staticmethod
+    def calculate(
+        population_count: npt.ArrayLike,
+        trade_usage: npt.ArrayLike,
+        trade_efficiency: npt.ArrayLike,
+        tvr1: npt.ArrayLike,
+        tvr2: npt.ArrayLike,
+        base_multiplier: float = 12.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        population_count = np.asarray(population_count, dtype=float)
+        goods_per_capita = np.add(tvr1, tvr2) / np.maximum(1, population_count) * 1000
+        tension_raw = (population_count / 1000) / np.maximum(1, trade_usage) * base_multiplier - goods_per_capita
+        tension = np.minimum(100.0, np.maximum(0.0, tension_raw))
+        base_consumption = population_count * (45.0 / 1000)
+        consumption = base_consumption * trade_efficiency * (1.0 + (tension / 200.0))
+        return np.round(consumption / 1000000, 2), np.round(tension, 1)
+
+
+@dataclass(frozen=True)
+class IndustryOverproductionModel:
+    @staticmethod
+    def calculate_change(
+        tvr1: npt.ArrayLike,
+        tvr2: npt.ArrayLike,
+        consumption: npt.ArrayLike,
+        trade_usage: npt.ArrayLike,
+    ) -> np.ndarray:
+        trade_usage = np.asarray(trade_usage, dtype=float)
+        sign = np.where(np.add(tvr1, tvr2) > consumption, 1.0, -1.0)
+        return np.where(trade_usage >= 40, -1 * (trade_usage / 100), sign * 0.5)
+
+
+@dataclass(frozen=True)
+class OverproductionModel:
+    @staticmethod
+    def tax_spotter(overproduction_coefficient: npt.ArrayLike) -> np.ndarray:
+        return 1 - (np.asarray(overproduction_coefficient) / 100)
+
+    @staticmethod
+    def trade_income_factor(overproduction_coefficient: npt.ArrayLike) -> np.ndarray:
+        return 1 - (np.asarray(overproduction_coefficient) / 50)
+
+
+# --- trade_models -----------------------------------------------------------
+
+
+class TradeModels:
+    """Vectorized forex course, trade income and allegorization factors.
+
+    The forex scorers take a `ForexFeatureBatch` instead of `ForexFeatures`.
+    """
+
+    @staticmethod
+    def _smoothstep(start: float, end: float,
+                    value: npt.ArrayLike) -> np.ndarray:
+        value = np.asarray(value, dtype=float)
+        if end <= start:
+            return np.where(value >= end, 1.0, 0.0)
+        x = np.clip((value - start) / (end - start), 0.0, 1.0)
+        return x * x * (3 - 2 * x)
+
+    @staticmethod
+    def _signed_log1p(value: npt.ArrayLike, scale: float) -> np.ndarray:
+        return np.copysign(np.log1p(np.abs(value) / max(scale, 1e-6)), value)
+
+    @staticmethod
+    def legacy_forex_score(features: ForexFeatureBatch) -> np.ndarray:
+        return trade_models.TradeModels.legacy_forex_score(features)
+
+    @classmethod
+    def normalized_forex_score(cls, features: ForexFeatureBatch) -> np.ndarray:
+        # A plain mean, while `fmean` rounds once: they differ in the last bit
+        macro_strength = (
+            features.stability / 100
+            + features.trade_efficiency / 100
+            + features.industry_efficiency / 100
+            + features.state_apparatus_efficiency / 100
+            + features.contentment / 100
+        ) / 5
+
+        social_drag = (
+            0.65 * np.clip(features.poor_level / 30, 0.0, 1.0)
+            + 0.35 * np.clip(features.jobless_level / 35, 0.0, 1.0)
+        )
+        control_bonus = np.clip(features.control_balance / 50, -1.0, 1.0)
+        trade_bonus = np.clip((features.trade_rank - 1) / 8, 0.0, 1.0)
+
+        budget_signal = cls._signed_log1p(features.budget, 1500)
+        income_signal = cls._signed_log1p(features.income, 120)
+        wastes_signal = cls._signed_log1p(features.wastes, 700)
+        macro_balance = income_signal - 0.85 * wastes_signal + 0.35 * budget_signal
+
+        overload_drag = np.clip(features.trade_overload / 180, 0.0, 1.2)
+
+        score = (
+            1.22
+            + 0.95 * macro_strength
+            + 0.34 * macro_balance
+            + 0.18 * trade_bonus
+            + 0.12 * control_bonus
+            - 0.58 * social_drag
+            - 0.22 * overload_drag
+        )
+        return np.clip(score, 1.0, 4.5)
+
+    @classmethod
+    def calculate_forex_course(cls, features: ForexFeatureBatch) -> np.ndarray:
+        raw_legacy_score = cls.legacy_forex_score(features)
+        legacy_score = np.maximum(raw_legacy_score, 1.0)
+        normalized_score = cls.normalized_forex_score(features)
+
+        scale_pressure = np.maximum(
+            cls._smoothstep(300, 2000, np.abs(features.income)),
+            cls._smoothstep(1500, 10000, np.abs(features.budget)),
+        )
+        floor_pressure = cls._smoothstep(0.0, 2.5, 1.0 - raw_legacy_score)
+        normalized_weight = 0.75 + 0.15 * scale_pressure + 0.10 * floor_pressure
+        normalized_weight = np.clip(normalized_weight, 0.75, 0.97)
+        legacy_weight = 1.0 - normalized_weight
+
+        result = legacy_score * legacy_weight + normalized_score * normalized_weight
+        return np.round(np.clip(result, 1.0, 5.0), 4)
+
+    @staticmethod
+    def _check_allegorization(allegorization_percent: np.ndarray) -> None:
+        invalid = ~((allegorization_percent >= 0) & (allegorization_percent <= 100))
+        if np.any(invalid):
+            raise ValueError(
+                f"Процент должен быть в диапазоне [0, 100], получен: "
+                f"{allegorization_percent[invalid].flat[0]}"
+            )
+
+    @classmethod
+    def calculate_allegorization_trade_factor(
+            cls, allegorization_percent: npt.ArrayLike) -> np.ndarray:
+        x = np.asarray(allegorization_percent, dtype=float)
+        cls._check_allegorization(x)
+        return trade_models.TradeModels.ALLEGORIZATION_TRADE_FACTOR.evaluate(x)
+
+    @classmethod
+    def calculate_allegorization_economy_factor(
+            cls, allegorization_percent: npt.ArrayLike) -> np.ndarray:
+        x = np.asarray(allegorization_percent, dtype=float)
+        cls._check_allegorization(x)
+        return trade_models.TradeModels.ALLEGORIZATION_ECONOMY_FACTOR.evaluate(x)
+
+    @classmethod
+    def calculate_trade_income(
+        cls,
+        trade_potential: npt.ArrayLike,
+        trade_usage: npt.ArrayLike,
+        trade_efficiency: npt.ArrayLike,
+        trade_wastes: npt.ArrayLike,
+        high_quality_percent: npt.ArrayLike,
+        mid_quality_percent: npt.ArrayLike,
+        low_quality_percent: npt.ArrayLike,
+        forex: npt.ArrayLike,
+        valgery: npt.ArrayLike,
+    ) -> np.ndarray:
+        forex = np.asarray(forex, dtype=float)
+        trade_potential = np.maximum(trade_potential, 1.0)
+        trade_usage = np.maximum(np.trunc(trade_usage), 0)
+        trade_efficiency = np.maximum(trade_efficiency, 0.0)
+        trade_wastes = np.maximum(trade_wastes, 0.0)
+        valgery_factor = np.clip(np.asarray(valgery) / 100.0, 0.0, 1.0)
+        safe_forex = np.maximum(np.where(forex == 0, 1.0, forex), 0.2)
+
+        load_ratio = trade_usage / trade_potential
+        overload_blend = cls._smoothstep(0.95, 1.35, load_ratio)
+        overload_ratio = np.maximum(0.0, load_ratio - 1.0)
+
+        quality_normal = 2.6 * np.asarray(high_quality_percent) + 1.8 * np.asarray(mid_quality_percent) + low_quality_percent
+        quality_overloaded = 2.25 * np.asarray(high_quality_percent) + 1.55 * np.asarray(mid_quality_percent) + 0.72 * np.asarray(low_quality_percent)
+        quality_factor = quality_normal * (1 - overload_blend) + quality_overloaded * overload_blend
+
+        route_component = trade_usage / (38.0 + 20.0 * overload_blend)
+        efficiency_factor = trade_efficiency / (100.0 + 45.0 * overload_blend)
+        base_income = route_component + quality_factor * efficiency_factor - trade_wastes
+
+        overload_penalty = 1.0 / (1.0 + 0.85 * overload_ratio)
+        currency_factor = valgery_factor + (1.0 / safe_forex) * (1.0 - valgery_factor)
+        forex_blend = cls._smoothstep(0.0, 0.6, overload_ratio)
+        overloaded_income = base_income * (overload_penalty * (1.0 + (currency_factor - 1.0) * forex_blend))
+        base_income = np.where(overload_ratio > 0, overloaded_income, base_income)
+        return np.round(np.maximum(base_income, 0.0), 4)
@@ -1,4 +1,6 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from functions.agriculture_models import (
     AdditionalWastesModel,
@@ -206,9 +208,11 @@ class BasicInMoveFunctions(BaseInMoveFunctions):
             poor_level: float,
             jobless_level: float,
             med_waste: float,
-            population: int
+            population: int,
+            rng: Optional[np.random.Generator] = None
     ) -> float:
-        return StabilityModel.coefficient(poor_level, jobless_level, med_waste, population)
+        return StabilityModel.coefficient(poor_level, jobless_level, med_waste,
+                                          population, rng)
 
     @staticmethod
     def calculate_income_coefficient_based_on_agriculture(
@@ -242,13 +246,15 @@ class BasicInMoveFunctions(BaseInMoveFunctions):
             population_count: int,
             food_security: float,
             biome_richness: float,
-            death_probability: float = 0.36
+            death_probability: float = 0.36,
+            rng: Optional[np.random.Generator] = None
     ) -> int:
         return FoodModel.underfeed(
             population_count,
             food_security,
             biome_richness,
             death_probability,
+            rng,
         )
 
     @staticmethod
@@ -1,8 +1,11 @@
-from typing import Tuple, List
+from typing import Tuple, List, Optional
+
+import numpy as np
 
 from functions.agriculture_models import AgricultureDevelopmentModel
 from functions.economy_models import BranchIncomeModel, PopulationGrowthModel, TradePotentialModel
-from functions.industry_models import CivilEfficiencyLogisticModel, CivilUsageModel, IndustryBasicStatsModel, IndustryCoefficientModel
+from functions.industry_models import CivilEfficiencyLogisticModel, CivilUsageModel, IndustryBasicStatsModel, IndustryCoefficientModel, \
+    IndustryEstimator
 from functions.society_models import SocietyDeclineModel, SuccessChanceModel
 
 
@@ -39,12 +42,16 @@ class BasicStatsFunctions:
     @staticmethod
     def calculate_industry_basic_stats(industry_coefficient: float,
                                        civil_usage: float,
-                                       standardization: float) -> \
+                                       standardization: float,
+                                       rng: Optional[np.random.Generator] = None,
+                                       estimator: Optional[IndustryEstimator] = None) -> \
             Tuple[float, float, float]:
         return IndustryBasicStatsModel.calculate(
             industry_coefficient,
             civil_usage,
             standardization,
+            rng,
+            estimator,
         )
 
     @staticmethod
@@ -57,12 +64,14 @@ class BasicStatsFunctions:
     def calculate_success_chance(
             knowledge_level: float,
             education_level: float,
-            erudition_will: float
+            erudition_will: float,
+            rng: Optional[np.random.Generator] = None
     ) -> float:
         return SuccessChanceModel.calculate(
             knowledge_level,
             education_level,
             erudition_will,
+            rng,
         )
 
     @staticmethod
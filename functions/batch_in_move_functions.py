@@ -0,0 +1,432 @@
+"""Vectorized counterparts of :class:`BasicInMoveFunctions`.
+
+Every method mirrors the scalar method with the same name, but accepts NumPy
+arrays (one element per country / scenario) and broadcasts. Like the scalar
+class, it delegates to the formula models, here to their array versions in
+:mod:`functions.array_models`, so whole worlds can be evaluated in a single
+call by :mod:`modules.batch_skip_move`.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from functions.array_models import (
+    AdditionalWastesModel,
+    AgricultureDevelopmentModel,
+    AgricultureEfficiencyModel,
+    AgricultureWastesModel,
+    ConsumptionOfGoodsModel,
+    ContentmentModel,
+    CulturalCoefficientModel,
+    DemographyModel,
+    FoodModel,
+    IncomeModifierModel,
+    IndustryIncomeModel,
+    IndustryOverproductionModel,
+    InfrastructureModel,
+    IntegrityOfFaithModel,
+    KnowledgeModel,
+    LogisticsModel,
+    MoneyIncomeModel,
+    OverproductionModel,
+    SocietyDeclineModel,
+    StabilityModel,
+    StateApparatusModel,
+    SuccessChanceModel,
+    TaxIncomeModel,
+    TradeModels,
+    WorkersCountModel,
+)
+from functions.trade_models import ForexFeatureBatch
+
+
+class BatchInMoveFunctions:
+
+    @staticmethod
+    def calculate_expected_logistic_wastes(
+            government_wastes: np.ndarray) -> np.ndarray:
+        return LogisticsModel.expected_wastes(government_wastes)
+
+    @staticmethod
+    def calculate_cultural_coefficient(
+            cultural_level: np.ndarray,
+            egocentrism_development: np.ndarray
+    ) -> np.ndarray:
+        return CulturalCoefficientModel.calculate(cultural_level,
+                                                  egocentrism_development)
+
+    @staticmethod
+    def calculate_contentment_coefficients(
+            contentment: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return ContentmentModel.coefficients(contentment)
+
+    @staticmethod
+    def calculate_expected_infrastructure_wastes(
+            population_count: np.ndarray) -> np.ndarray:
+        return InfrastructureModel.expected_wastes(population_count)
+
+    @staticmethod
+    def calculate_workers_count(
+            population_count: np.ndarray,
+            workers_percent: np.ndarray,
+            workers_redistribution: np.ndarray
+    ) -> np.ndarray:
+        return WorkersCountModel.calculate(population_count, workers_percent,
+                                           workers_redistribution)
+
+    @staticmethod
+    def calculate_additional_wastes(
+            security_percent: np.ndarray) -> np.ndarray:
+        return AdditionalWastesModel.calculate(security_percent)
+
+    @staticmethod
+    def calculate_agriculture_wastes(
+            workers_count: np.ndarray,
+            securities: np.ndarray,
+            husbandry: np.ndarray,
+            livestock: np.ndarray,
+            others: np.ndarray
+    ) -> np.ndarray:
+        return AgricultureWastesModel.calculate(
+            workers_count, securities, husbandry, livestock, others)
+
+    @staticmethod
+    def calculate_agriculture_development(
+            securities: np.ndarray,
+            workers_count: np.ndarray,
+            population_count: np.ndarray,
+            biome_richness: np.ndarray,
+            food_diversity: np.ndarray,
+            husbandry: np.ndarray,
+            livestock: np.ndarray,
+            others: np.ndarray,
+    ) -> np.ndarray:
+        return AgricultureDevelopmentModel.calculate(
+            securities, workers_count, population_count, biome_richness,
+            food_diversity, husbandry, livestock, others)
+
+    @staticmethod
+    def calculate_agriculture_efficiency(
+            securities: np.ndarray,
+            biome_richness: np.ndarray,
+            husbandry: np.ndarray,
+            livestock: np.ndarray,
+            others: np.ndarray,
+            agriculture_deceases: np.ndarray,
+            agriculture_natural_deceases: np.ndarray,
+            workers_count: np.ndarray,
+            population_count: np.ndarray,
+    ) -> np.ndarray:
+        return AgricultureEfficiencyModel.calculate(
+            securities, biome_richness, husbandry, livestock, others,
+            agriculture_deceases, agriculture_natural_deceases,
+            workers_count, population_count)
+
+    @staticmethod
+    def calculate_food_diversity(
+            husbandry: np.ndarray,
+            livestock: np.ndarray,
+            others: np.ndarray,
+            biome_richness: np.ndarray
+    ) -> np.ndarray:
+        return FoodModel.diversity(husbandry, livestock, others,
+                                   biome_richness)
+
+    @staticmethod
+    def calculate_food_income(
+            workers_count: np.ndarray,
+            securities: np.ndarray,
+            overprotective_effects: np.ndarray,
+            agriculture_deceases: np.ndarray,
+            agriculture_natural_deceases: np.ndarray,
+            environmental_food: np.ndarray
+    ) -> np.ndarray:
+        return FoodModel.income(
+            workers_count, securities, overprotective_effects,
+            agriculture_deceases, agriculture_natural_deceases,
+            environmental_food)
+
+    @staticmethod
+    def calculate_food_consumption(
+            population_count: np.ndarray,
+            consumption_factor: np.ndarray,
+    ) -> np.ndarray:
+        return FoodModel.consumption(population_count, consumption_factor)
+
+    @staticmethod
+    def calculate_food_security(
+            food_income: np.ndarray,
+            food_consumption: np.ndarray,
+    ) -> np.ndarray:
+        return FoodModel.security(food_income, food_consumption)
+
+    @staticmethod
+    def calculate_food_supplies(
+            current_food_supplies: np.ndarray,
+            food_security: np.ndarray,
+            overstock_percent: np.ndarray,
+            storages_upkeep: np.ndarray
+    ) -> np.ndarray:
+        return FoodModel.supplies(current_food_supplies, food_security,
+                                  overstock_percent, storages_upkeep)
+
+    @staticmethod
+    def calculate_goods_coefficient(goods_count: np.ndarray) -> np.ndarray:
+        return np.where(goods_count >= 100, 1.1, 0.004 * goods_count + 0.66)
+
+    @staticmethod
+    def calculate_stability_coefficient(
+            poor_level: np.ndarray,
+            jobless_level: np.ndarray,
+            med_waste: np.ndarray,
+            population: np.ndarray,
+            rng: np.random.Generator,
+    ) -> np.ndarray:
+        return StabilityModel.coefficient(poor_level, jobless_level,
+                                          med_waste, population, rng=rng)
+
+    @staticmethod
+    def calculate_income_coefficient_based_on_agriculture(
+            food_security: np.ndarray) -> np.ndarray:
+        return IncomeModifierModel.from_agriculture(food_security)
+
+    @staticmethod
+    def calculate_income_coefficient_based_on_social_decline(
+            social_decline: np.ndarray) -> np.ndarray:
+        return IncomeModifierModel.from_social_decline(social_decline)
+
+    @staticmethod
+    def calculate_income_coefficient_based_on_panic_level(
+            panic_level: np.ndarray) -> np.ndarray:
+        return IncomeModifierModel.from_panic_level(panic_level)
+
+    @staticmethod
+    def calculate_income_coefficient_based_on_food_diversity(
+            food_diversity: np.ndarray) -> np.ndarray:
+        return IncomeModifierModel.from_food_diversity(food_diversity)
+
+    @staticmethod
+    def calculate_population_decrement_coefficient(
+            decrement_coefficient: np.ndarray) -> np.ndarray:
+        return DemographyModel.decrement_coefficient(decrement_coefficient)
+
+    @staticmethod
+    def calculate_population_underfeed(
+            population_count: np.ndarray,
+            food_security: np.ndarray,
+            biome_richness: np.ndarray,
+            rng: np.random.Generator,
+            death_probability: float = 0.36
+    ) -> np.ndarray:
+        return FoodModel.underfeed(population_count, food_security,
+                                   biome_richness, death_probability, rng=rng)
+
+    @staticmethod
+    def calculate_industry_income(
+            gov_wastes: np.ndarray,
+            civil_usage: np.ndarray,
+            max_potential: np.ndarray,
+            expected_wastes: np.ndarray
+    ) -> np.ndarray:
+        return IndustryIncomeModel.calculate(gov_wastes, civil_usage,
+                                             max_potential, expected_wastes)
+
+    @staticmethod
+    def calculate_tax_income(
+            universal_tax: np.ndarray,
+            excise: np.ndarray,
+            additions: np.ndarray,
+            small_enterprise_tax: np.ndarray,
+            large_enterprise_tax: np.ndarray,
+            small_enterprise_percent: np.ndarray,
+            large_enterprise_count: np.ndarray,
+            population_count: np.ndarray
+    ) -> np.ndarray:
+        return TaxIncomeModel.calculate(
+            universal_tax, excise, additions, small_enterprise_tax,
+            large_enterprise_tax, small_enterprise_percent,
+            large_enterprise_count, population_count)
+
+    @staticmethod
+    def calculate_integrity_of_faith_factor(
+            integrity_of_faith: np.ndarray) -> np.ndarray:
+        return IntegrityOfFaithModel.factor(integrity_of_faith)
+
+    @staticmethod
+    def calculate_forex_course(
+            stability: np.ndarray,
+            income: np.ndarray,
+            wastes: np.ndarray,
+            budget: np.ndarray,
+            trade_rank: np.ndarray,
+            trade_efficiency: np.ndarray,
+            trade_overload: np.ndarray,
+            industry_efficiency: np.ndarray,
+            state_apparatus_efficiency: np.ndarray,
+            contentment: np.ndarray,
+            poor_level: np.ndarray,
+            jobless_level: np.ndarray,
+            control_data: np.ndarray
+    ) -> np.ndarray:
+        control = (control_data[:, 0] + control_data[:, 1]
+                   - control_data[:, 2] - control_data[:, 3])
+        features = ForexFeatureBatch(
+            stability=stability,
+            income=income,
+            wastes=wastes,
+            budget=budget,
+            trade_rank=trade_rank,
+            trade_efficiency=trade_efficiency,
+            trade_overload=trade_overload,
+            industry_efficiency=industry_efficiency,
+            state_apparatus_efficiency=state_apparatus_efficiency,
+            contentment=contentment,
+            poor_level=poor_level,
+            jobless_level=jobless_level,
+            control_balance=control,
+        )
+        return TradeModels.calculate_forex_course(features)
+
+    @staticmethod
+    def calculate_trade_income(
+            trade_potential: np.ndarray,
+            trade_usage: np.ndarray,
+            trade_efficiency: np.ndarray,
+            trade_wastes: np.ndarray,
+            high_quality_percent: np.ndarray,
+            mid_quality_percent: np.ndarray,
+            low_quality_percent: np.ndarray,
+            forex: np.ndarray,
+            valgery: np.ndarray
+    ) -> np.ndarray:
+        return TradeModels.calculate_trade_income(
+            trade_potential, trade_usage, trade_efficiency, trade_wastes,
+            high_quality_percent, mid_quality_percent, low_quality_percent,
+            forex, valgery)
+
+    @staticmethod
+    def calculate_inflation_factor(inflation: np.ndarray) -> np.ndarray:
+        return MoneyIncomeModel.inflation_factor(inflation)
+
+    @staticmethod
+    def calculate_agriculture_factor(
+            current_tax_income: np.ndarray,
+            agriculture_development: np.ndarray,
+            workers_count: np.ndarray
+    ) -> np.ndarray:
+        return MoneyIncomeModel.agriculture_factor(
+            current_tax_income, agriculture_development, workers_count)
+
+    @staticmethod
+    def expected_state_apparatus(
+            population_count: np.ndarray,
+            apparatus_wastes: np.ndarray) -> np.ndarray:
+        return StateApparatusModel.expected_size(population_count,
+                                                 apparatus_wastes)
+
+    @staticmethod
+    def calculate_money_income_boost(
+            stability: np.ndarray,
+            poor_level: np.ndarray,
+            jobless_level: np.ndarray
+    ) -> np.ndarray:
+        return MoneyIncomeModel.boost(stability, poor_level, jobless_level)
+
+    @staticmethod
+    def calculate_money_income_simple_boost(
+            stability: np.ndarray) -> np.ndarray:
+        return MoneyIncomeModel.simple_boost(stability)
+
+    @staticmethod
+    def calculate_knowledge(
+            population_count: np.ndarray,
+            knowledge_wastes: np.ndarray
+    ) -> np.ndarray:
+        return KnowledgeModel.calculate(population_count, knowledge_wastes)
+
+    @staticmethod
+    def calculate_military_equipment_coefficient(
+            war_efficiency: np.ndarray) -> np.ndarray:
+        return war_efficiency / 50
+
+    @staticmethod
+    def calculate_consumption_of_goods(
+            population_count: np.ndarray,
+            trade_usage: np.ndarray,
+            trade_efficiency: np.ndarray,
+            tvr1: np.ndarray,
+            tvr2: np.ndarray,
+            base_multiplier: float = 12.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        return ConsumptionOfGoodsModel.calculate(
+            population_count, trade_usage, trade_efficiency, tvr1, tvr2,
+            base_multiplier)
+
+    @staticmethod
+    def calculate_industry_overproduction_change(
+            tvr1: np.ndarray,
+            tvr2: np.ndarray,
+            consumption: np.ndarray,
+            trade_usage: np.ndarray
+    ) -> np.ndarray:
+        return IndustryOverproductionModel.calculate_change(
+            tvr1, tvr2, consumption, trade_usage)
+
+    @staticmethod
+    def calculate_allegorization_trade_factor(
+            allegorization_percent: np.ndarray) -> np.ndarray:
+        return TradeModels.calculate_allegorization_trade_factor(
+            allegorization_percent)
+
+    @staticmethod
+    def calculate_allegorization_economy_factor(
+            allegorization_percent: np.ndarray) -> np.ndarray:
+        return TradeModels.calculate_allegorization_economy_factor(
+            allegorization_percent)
+
+    @staticmethod
+    def calculate_overproduction_tax_spotter(
+            overproduction_coefficient: np.ndarray) -> np.ndarray:
+        return OverproductionModel.tax_spotter(overproduction_coefficient)
+
+    @staticmethod
+    def calculate_overproduction_trade_income(
+            overproduction_coefficient: np.ndarray) -> np.ndarray:
+        return OverproductionModel.trade_income_factor(
+            overproduction_coefficient)
+
+    @staticmethod
+    def calculate_society_decline(
+            contentment: np.ndarray,
+            government_trust: np.ndarray,
+            many_children_traditions: np.ndarray,
+            sexual_asceticism: np.ndarray,
+            egocentrism_development: np.ndarray,
+            education_level: np.ndarray,
+            erudition_will: np.ndarray,
+            cultural_level: np.ndarray,
+            violence_tendency: np.ndarray,
+            unemployment_rate: np.ndarray,
+            grace_of_the_highest: np.ndarray,
+            commitment_to_cause: np.ndarray,
+            departure_from_truths: np.ndarray,
+    ) -> np.ndarray:
+        return SocietyDeclineModel.calculate(
+            contentment, government_trust, many_children_traditions,
+            sexual_asceticism, egocentrism_development, education_level,
+            erudition_will, cultural_level, violence_tendency,
+            unemployment_rate, grace_of_the_highest, commitment_to_cause,
+            departure_from_truths)
+
+    @staticmethod
+    def calculate_success_chance(
+            knowledge_level: np.ndarray,
+            education_level: np.ndarray,
+            erudition_will: np.ndarray,
+            rng: np.random.Generator,
+    ) -> np.ndarray:
+        return SuccessChanceModel.calculate(knowledge_level, education_level,
+                                            erudition_will, rng=rng)
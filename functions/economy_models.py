@@ -2,22 +2,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from functions.piecewise import StepFunction, strictly_above
+
 
 @dataclass(frozen=True)
 class PopulationGrowthModel:
+    # Growth per thousand people by population count
+    GROWTH_FACTOR = StepFunction(
+        bounds=(10 ** 6, 2.5 * 10 ** 6, 5.5 * 10 ** 6, strictly_above(8 * 10 ** 6)),
+        values=(6.87, 9.87, 11.77, 9.87, 8.77),
+    )
+
     @staticmethod
     def calculate(current_population_count: int) -> float:
         population_in_thousands = current_population_count * 10 ** -3
-
-        if current_population_count > 8 * 10 ** 6:
-            return population_in_thousands * 8.77
-        if current_population_count >= 5.5 * 10 ** 6:
-            return population_in_thousands * 9.87
-        if current_population_count >= 2.5 * 10 ** 6:
-            return population_in_thousands * 11.77
-        if current_population_count >= 10 ** 6:
-            return population_in_thousands * 9.87
-        return population_in_thousands * 6.87
+        return population_in_thousands * PopulationGrowthModel.GROWTH_FACTOR(current_population_count)
 
 
 @dataclass(frozen=True)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from enum import StrEnum
 import math
-import random
-from typing import Tuple
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
 
 from functions.inbuilt import InbuiltFunctions
+from functions.rng import resolve_rng
 
 
 @dataclass(frozen=True)
@@ -35,19 +40,53 @@ class CivilUsageModel:
         return round((civil_security + tvr1 + tvr2) / 3)
 
 
+class IndustryEstimator(StrEnum):
+    """How `IndustryBasicStatsModel` estimates payoff and dispersion."""
+
+    LEGACY = "legacy"      # original pure-Python loop over 1000 samples
+    NUMPY = "numpy"        # the same sampling scheme, vectorized
+    EXPECTED = "expected"  # analytic expectation, no sampling at all
+
+
+_industry_estimator: ContextVar[IndustryEstimator] = ContextVar(
+    "industry_estimator", default=IndustryEstimator.NUMPY)
+
+
+def current_industry_estimator() -> IndustryEstimator:
+    """The estimator selected by the innermost `use_industry_estimator`."""
+    return _industry_estimator.get()
+
+
+@contextmanager
+def use_industry_estimator(estimator: IndustryEstimator | str) -> Iterator[None]:
+    """Selects the industry estimator for everything run inside the block."""
+    token = _industry_estimator.set(IndustryEstimator(estimator))
+    try:
+        yield
+    finally:
+        _industry_estimator.reset(token)
+
+
 @dataclass(frozen=True)
 class IndustryBasicStatsModel:
-    @staticmethod
-    def calculate(
-        industry_coefficient: float,
-        civil_usage: float,
-        standardization: float,
-    ) -> Tuple[float, float, float]:
-        mean_value = (industry_coefficient + civil_usage + (standardization / 1.35)) / 2.5
-        safe_civil_usage = max(float(civil_usage), 1e-9)
-        std_dev = 100 / safe_civil_usage + 0.2
+    """Industry efficiency, max potential and expected wastes.
+
+    Samples are drawn from N(mean, std) and weighted by their own density, so
+    the weighted points follow N(mean, std**2 / 2): the payoff estimates
+    `mean` and the dispersion estimates `std**2 / 2`. The `EXPECTED` estimator
+    uses these values directly and returns the mean efficiency instead of a
+    uniform draw.
+    """
+
+    SAMPLES = 1000
 
-        possible_values = [random.gauss(mean_value, std_dev) for _ in range(1000)]
+    @staticmethod
+    def _legacy_params(
+        mean_value: float,
+        std_dev: float,
+        rng: np.random.Generator,
+    ) -> Tuple[float, float]:
+        possible_values = rng.normal(mean_value, std_dev, IndustryBasicStatsModel.SAMPLES).tolist()
         probabilities = [
             InbuiltFunctions.pdf_manual(possible_value, mean_value, std_dev)
             for possible_value in possible_values
@@ -59,13 +98,63 @@ class IndustryBasicStatsModel:
         else:
             normalized_probabilities = [p / total_density for p in probabilities]
 
-        payoff, dispersion = InbuiltFunctions.count_proba_params(
+        return InbuiltFunctions.count_proba_params(
             possible_values, normalized_probabilities
         )
+
+    @staticmethod
+    def _numpy_params(
+        mean_value: float,
+        std_dev: float,
+        rng: np.random.Generator,
+    ) -> Tuple[float, float]:
+        possible_values = rng.normal(mean_value, std_dev, IndustryBasicStatsModel.SAMPLES)
+        # The normalization constant of the density cancels out
+        weights = np.exp(-((possible_values - mean_value) ** 2) / (2 * std_dev ** 2))
+        total_density = weights.sum()
+        if total_density == 0:
+            weights = np.full_like(possible_values, 1 / len(possible_values))
+        else:
+            weights = weights / total_density
+
+        payoff = float(weights @ possible_values)
+        dispersion = float(weights @ (possible_values - payoff) ** 2)
+        return payoff, dispersion
+
+    @staticmethod
+    def _shrink_dispersion(payoff: float, dispersion: float) -> float:
+        if payoff <= 0:
+            return 0.0
         while payoff < dispersion:
             dispersion /= 2
+        return dispersion
+
+    @staticmethod
+    def calculate(
+        industry_coefficient: float,
+        civil_usage: float,
+        standardization: float,
+        rng: Optional[np.random.Generator] = None,
+        estimator: Optional[IndustryEstimator] = None,
+    ) -> Tuple[float, float, float]:
+        estimator = IndustryEstimator(estimator or current_industry_estimator())
+        mean_value = (industry_coefficient + civil_usage + (standardization / 1.35)) / 2.5
+        safe_civil_usage = max(float(civil_usage), 1e-9)
+        std_dev = 100 / safe_civil_usage + 0.2
+
+        if estimator is IndustryEstimator.EXPECTED:
+            payoff = mean_value
+            dispersion = IndustryBasicStatsModel._shrink_dispersion(payoff, std_dev ** 2 / 2)
+            efficiency = payoff
+        else:
+            rng = resolve_rng(rng)
+            if estimator is IndustryEstimator.LEGACY:
+                payoff, dispersion = IndustryBasicStatsModel._legacy_params(mean_value, std_dev, rng)
+            else:
+                payoff, dispersion = IndustryBasicStatsModel._numpy_params(mean_value, std_dev, rng)
+            dispersion = IndustryBasicStatsModel._shrink_dispersion(payoff, dispersion)
+            efficiency = float(rng.uniform(payoff - dispersion, payoff + dispersion))
 
-        efficiency = random.uniform(payoff - dispersion, payoff + dispersion)
         max_potential = (industry_coefficient + civil_usage) / 1.8
         expected_wastes = payoff * 0.3
 
@@ -0,0 +1,170 @@
+"""Breakpoint tables for the threshold chains of the formula models.
+
+A table is declared once at import and serves both the scalar models (a
+`bisect` lookup) and their array versions in :mod:`functions.array_models`
+(``np.searchsorted`` / ``np.piecewise``).
+
+`closed` says which end of an interval a breakpoint belongs to:
+
+* ``"left"``: intervals ``[b_i, b_i+1)``, i.e. an ``x >= bound`` chain;
+* ``"right"``: intervals ``(b_i, b_i+1]``, i.e. an ``x > bound`` chain.
+
+A strict ``x > bound`` test inside a left-closed table is written as
+``strictly_above(bound)``. NaN falls into the first interval, as it fails
+every comparison of the chain it replaces.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+import math
+from typing import Any, Callable, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+
+Closed = Literal["left", "right"]
+
+
+def strictly_above(bound: float) -> float:
+    """Breakpoint of an ``x > bound`` test in a left-closed table."""
+    return math.nextafter(bound, math.inf)
+
+
+@dataclass(frozen=True)
+class _Breakpoints:
+    bounds: Tuple[float, ...]
+    closed: Closed = "left"
+    _bisect: Callable[[Sequence[float], float], int] = field(
+        init=False, repr=False, compare=False)
+    _array_bounds: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.closed not in ("left", "right"):
+            raise ValueError(f"Неизвестная граница интервала: {self.closed!r}")
+        if any(a >= b for a, b in zip(self.bounds, self.bounds[1:])):
+            raise ValueError("Точки разбиения должны строго возрастать.")
+        object.__setattr__(self, "bounds", tuple(self.bounds))
+        object.__setattr__(self, "_bisect", bisect_right
+                           if self.closed == "left" else bisect_left)
+        object.__setattr__(self, "_array_bounds",
+                           np.array(self.bounds, dtype=float))
+
+    def index(self, x: float) -> int:
+        """Interval of `x`: 0 below the first breakpoint."""
+        if x != x:
+            return 0
+        return self._bisect(self.bounds, x)
+
+    def indices(self, x: npt.ArrayLike) -> np.ndarray:
+        """Vectorized `index`."""
+        x = np.asarray(x, dtype=float)
+        side = "right" if self.closed == "left" else "left"
+        indices = np.searchsorted(self._array_bounds, x, side=side)
+        return np.where(np.isnan(x), 0, indices)
+
+
+@dataclass(frozen=True)
+class StepFunction(_Breakpoints):
+    """Constant `values[i]` on interval `i`; one more value than bounds.
+
+    Values may be tuples, in which case `evaluate` adds a trailing axis.
+    """
+
+    values: Tuple[Any, ...] = ()
+    _array_values: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if len(self.values) != len(self.bounds) + 1:
+            raise ValueError("Значений должно быть на одно больше, чем точек разбиения.")
+        object.__setattr__(self, "values", tuple(self.values))
+        object.__setattr__(self, "_array_values", np.array(self.values))
+
+    def __call__(self, x: float) -> Any:
+        if x != x:
+            return self.values[0]
+        return self.values[self._bisect(self.bounds, x)]
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        return self._array_values[self.indices(x)]
+
+
+@dataclass(frozen=True)
+class PiecewiseFunction(_Breakpoints):
+    """`pieces[i](x)` on interval `i`; a piece may also be a constant.
+
+    Pieces must work on floats and on arrays alike, so both evaluators run
+    the very same expressions.
+    """
+
+    pieces: Tuple[Any, ...] = ()
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if len(self.pieces) != len(self.bounds) + 1:
+            raise ValueError("Участков должно быть на одно больше, чем точек разбиения.")
+        object.__setattr__(self, "pieces", tuple(self.pieces))
+
+    def __call__(self, x: float) -> Any:
+        piece = self.pieces[self.index(x)]
+        return piece(x) if callable(piece) else piece
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        indices = self.indices(x)
+        return np.piecewise(
+            x, [indices == i for i in range(len(self.pieces))], self.pieces)
+
+
+@dataclass(frozen=True)
+class LinearInterpolation:
+    """Linear interpolation through `points`, flat past the last one.
+
+    Below the first point, and for NaN, there is no value: the scalar
+    lookup returns ``None`` and `evaluate` returns NaN.
+    """
+
+    points: Tuple[Tuple[float, float], ...]
+    _xs: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _ys: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _array_xs: np.ndarray = field(init=False, repr=False, compare=False)
+    _array_ys: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        points = tuple((x, y) for x, y in self.points)
+        if len(points) < 2:
+            raise ValueError("Для интерполяции нужны хотя бы две точки.")
+        xs, ys = zip(*points)
+        if any(a >= b for a, b in zip(xs, xs[1:])):
+            raise ValueError("Точки интерполяции должны строго возрастать.")
+        object.__setattr__(self, "points", points)
+        object.__setattr__(self, "_xs", xs)
+        object.__setattr__(self, "_ys", ys)
+        object.__setattr__(self, "_array_xs", np.array(xs, dtype=float))
+        object.__setattr__(self, "_array_ys", np.array(ys, dtype=float))
+
+    def __call__(self, x: float) -> Optional[float]:
+        xs, ys = self._xs, self._ys
+        segment = bisect_right(xs, x) - 1
+        if segment < 0 or x != x:
+            return None
+        if segment >= len(xs) - 1:
+            return ys[-1]
+        x1, x2 = xs[segment], xs[segment + 1]
+        y1, y2 = ys[segment], ys[segment + 1]
+        t = (x - x1) / (x2 - x1)
+        return y1 + (y2 - y1) * t
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        xs, ys = self._array_xs, self._array_ys
+        segment = np.searchsorted(xs, x, side="right") - 1
+        inner = np.clip(segment, 0, len(xs) - 2)
+        x1, x2 = xs[inner], xs[inner + 1]
+        y1, y2 = ys[inner], ys[inner + 1]
+        t = (x - x1) / (x2 - x1)
+        values = np.where(segment >= len(xs) - 1, ys[-1], y1 + (y2 - y1) * t)
+        return np.where((segment < 0) | np.isnan(x), np.nan, values)
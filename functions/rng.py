@@ -0,0 +1,50 @@
+"""Random number generators for the stochastic models.
+
+Every random draw in the models goes through an explicit
+:class:`numpy.random.Generator`. Callers that do not pass one get the
+thread-local fallback generator, so threads never share a stream.
+
+Engines own their generator (see :class:`SkipMoverBase`) and spawn independent
+child streams for workers with :func:`spawn_rngs`.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+
+_local = threading.local()
+
+
+def default_rng() -> np.random.Generator:
+    """Thread-local fallback generator."""
+    rng = getattr(_local, "rng", None)
+    if rng is None:
+        rng = _local.rng = np.random.default_rng()
+    return rng
+
+
+def seed_default_rng(seed: Optional[int]) -> None:
+    """Re-seeds the fallback generator of the current thread."""
+    _local.rng = np.random.default_rng(seed)
+
+
+def resolve_rng(rng: Optional[np.random.Generator]) -> np.random.Generator:
+    return default_rng() if rng is None else rng
+
+
+def new_rng() -> np.random.Generator:
+    """An independent stream derived from the fallback generator.
+
+    Seeding the fallback with :func:`seed_default_rng` therefore makes every
+    engine created afterwards reproducible.
+    """
+    return default_rng().spawn(1)[0]
+
+
+def spawn_rngs(rng: np.random.Generator, n: int) -> List[np.random.Generator]:
+    """`n` statistically independent child streams of `rng`."""
+    return rng.spawn(n)
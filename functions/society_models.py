@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import random
+from typing import Optional
+
+import numpy as np
 
 from functions.inbuilt import InbuiltFunctions
+from functions.piecewise import StepFunction
+from functions.rng import resolve_rng
 
 
 @dataclass(frozen=True)
@@ -23,9 +27,15 @@ class ContentmentModel:
 @dataclass(frozen=True)
 class SuccessChanceModel:
     @staticmethod
-    def calculate(knowledge_level: float, education_level: float, erudition_will: float) -> float:
+    def calculate(
+        knowledge_level: float,
+        education_level: float,
+        erudition_will: float,
+        rng: Optional[np.random.Generator] = None,
+    ) -> float:
         safe_erudition_will = max(float(erudition_will), 1e-9)
-        return random.gauss(knowledge_level + education_level, (safe_erudition_will / 10) ** -1) // 2
+        return float(resolve_rng(rng).normal(
+            knowledge_level + education_level, (safe_erudition_will / 10) ** -1)) // 2
 
 
 @dataclass(frozen=True)
@@ -70,27 +80,39 @@ class SocietyDeclineModel:
 
 @dataclass(frozen=True)
 class StabilityModel:
+    # (low, high) bounds of the coefficient by medicine wastes per million;
+    # the first range is the fallback for underfunded medicine
+    RANGES = StepFunction(
+        bounds=(5, 10, 20, 30, 40, 45, 70, 80),
+        values=(
+            (0.4, 0.56),
+            (0.1, 0.2),
+            (0.60, 0.71),
+            (0.72, 0.79),
+            (0.80, 0.87),
+            (0.88, 0.91),
+            (0.92, 0.94),
+            (0.95, 1.00),
+            (1.1, 1.1),
+        ),
+    )
+
     @staticmethod
-    def coefficient(poor_level: float, jobless_level: float, med_waste: float, population: int) -> float:
+    def coefficient(
+        poor_level: float,
+        jobless_level: float,
+        med_waste: float,
+        population: int,
+        rng: Optional[np.random.Generator] = None,
+    ) -> float:
         if population <= 0:
             raise ValueError("Численность населения должна быть положительным числом.")
         med_waste_per_1000 = (med_waste / population) * 1000000
-        stability_ranges = [
-            (3, 80, 1.1, 1.1),
-            (3, 70, 0.95, 1.00),
-            (4, 45, 0.92, 0.94),
-            (6, 40, 0.88, 0.91),
-            (8, 30, 0.80, 0.87),
-            (10, 20, 0.72, 0.79),
-            (13, 10, 0.60, 0.71),
-            (float('inf'), 5, 0.1, 0.2),
-        ]
-        for max_jobless, min_waste, min_val, max_val in stability_ranges:
-            if med_waste_per_1000 >= min_waste and (
-                jobless_level <= max_jobless or med_waste_per_1000 >= min_waste or poor_level <= max_jobless * 1.3
-            ):
-                return round(random.uniform(min_val, max_val), 3)
-        return round(random.uniform(0.4, 0.56), 3) if poor_level < 56 or med_waste < 36 else 0.01
+        index = StabilityModel.RANGES.index(med_waste_per_1000)
+        if index == 0 and not (poor_level < 56 or med_waste < 36):
+            return 0.01
+        min_val, max_val = StabilityModel.RANGES.values[index]
+        return round(float(resolve_rng(rng).uniform(min_val, max_val)), 3)
 
 
 @dataclass(frozen=True)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 import math
 from statistics import fmean
+from typing import Sequence
+
+import numpy as np
+
+from functions.piecewise import PiecewiseFunction, strictly_above
 
 
 @dataclass(frozen=True)
@@ -22,6 +27,52 @@ class ForexFeatures:
     control_balance: float
 
 
+@dataclass(frozen=True)
+class ForexFeatureBatch:
+    """`ForexFeatures` as columns: one float array per feature.
+
+    All columns are broadcast to a common shape, one element per country
+    or scenario.
+    """
+
+    stability: np.ndarray
+    income: np.ndarray
+    wastes: np.ndarray
+    budget: np.ndarray
+    trade_rank: np.ndarray
+    trade_efficiency: np.ndarray
+    trade_overload: np.ndarray
+    industry_efficiency: np.ndarray
+    state_apparatus_efficiency: np.ndarray
+    contentment: np.ndarray
+    poor_level: np.ndarray
+    jobless_level: np.ndarray
+    control_balance: np.ndarray
+
+    def __post_init__(self) -> None:
+        names = [item.name for item in fields(self)]
+        columns = np.broadcast_arrays(*(
+            np.asarray(getattr(self, name), dtype=float) for name in names))
+        for name, column in zip(names, columns):
+            object.__setattr__(self, name, column)
+
+    @classmethod
+    def from_features(cls, features: Sequence[ForexFeatures]) -> ForexFeatureBatch:
+        names = [item.name for item in fields(ForexFeatures)]
+        return cls(**{
+            name: np.fromiter((getattr(row, name) for row in features),
+                              dtype=float, count=len(features))
+            for name in names
+        })
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.stability.shape
+
+    def __len__(self) -> int:
+        return len(self.stability)
+
+
 class TradeModels:
     """Trade-related helper models.
 
@@ -34,6 +85,26 @@ class TradeModels:
     important trade signals.
     """
 
+    # Allegorization factors for 0, (0, 21), [21, 81) and [81, 100] percent
+    ALLEGORIZATION_TRADE_FACTOR = PiecewiseFunction(
+        bounds=(strictly_above(0), 21, 81),
+        pieces=(
+            0.97,
+            lambda x: 1 + x / 200,
+            lambda x: 1 + (x - 20) / 100,
+            lambda x: 1 + (x - 20) / 75,
+        ),
+    )
+    ALLEGORIZATION_ECONOMY_FACTOR = PiecewiseFunction(
+        bounds=(strictly_above(0), 21, 81),
+        pieces=(
+            1.03,
+            1,
+            lambda x: 1 - (1.8 + (x - 21) * 0.1) / 100,
+            lambda x: 1 + (x - 20) / 500,
+        ),
+    )
+
     @staticmethod
     def _clip(value: float, low: float, high: float) -> float:
         return max(low, min(high, value))
@@ -50,13 +121,20 @@ class TradeModels:
         scale = max(scale, 1e-6)
         return math.copysign(math.log1p(abs(value) / scale), value)
 
-    @staticmethod
-    def legacy_forex_score(features: ForexFeatures) -> float:
-        weights = [-0.0033199, -0.00146846, 0.00220264, -0.00107506,
-                   -0.00397517, 0.00255309, 0.00551992, 0.00351142,
-                   0.00120634, 0.00119143, -0.00035796, -0.00049678,
-                   -0.00304799]
-        bias = 0.7665364725212972
+    # Weights of the legacy linear forex formula, in `ForexFeatures` order
+    LEGACY_FOREX_WEIGHTS = (
+        -0.0033199, -0.00146846, 0.00220264, -0.00107506,
+        -0.00397517, 0.00255309, 0.00551992, 0.00351142,
+        0.00120634, 0.00119143, -0.00035796, -0.00049678,
+        -0.00304799,
+    )
+    LEGACY_FOREX_BIAS = 0.7665364725212972
+
+    @classmethod
+    def legacy_forex_score(cls, features: ForexFeatures | ForexFeatureBatch) -> float | np.ndarray:
+        """Also takes a `ForexFeatureBatch`, the sum is the same per element."""
+        weights = cls.LEGACY_FOREX_WEIGHTS
+        bias = cls.LEGACY_FOREX_BIAS
         return (
             features.stability * weights[0]
             + features.income * weights[1]
@@ -131,41 +209,22 @@ class TradeModels:
         result = legacy_score * legacy_weight + normalized_score * normalized_weight
         return round(cls._clip(result, 1.0, 5.0), 4)
 
-
     @staticmethod
-    def calculate_allegorization_trade_factor(allegorization_percent: float) -> float:
+    def _check_allegorization(allegorization_percent: float) -> None:
         if not 0 <= allegorization_percent <= 100:
             raise ValueError(
                 f"Процент должен быть в диапазоне [0, 100], получен: {allegorization_percent}"
             )
-        rules = [
-            (lambda x: x == 0, lambda x: 0.97),
-            (lambda x: x < 21, lambda x: 1 + x / 200),
-            (lambda x: x < 81, lambda x: 1 + (x - 20) / 100),
-            (lambda x: True, lambda x: 1 + (x - 20) / 75),
-        ]
-        for condition, calculation in rules:
-            if condition(allegorization_percent):
-                return calculation(allegorization_percent)
-        raise AssertionError("Unreachable allegorization branch")
 
-    @staticmethod
-    def calculate_allegorization_economy_factor(allegorization_percent: float) -> float:
-        if not 0 <= allegorization_percent <= 100:
-            raise ValueError(
-                f"Процент должен быть в диапазоне [0, 100], "
-                f"получен: {allegorization_percent}"
-            )
-        rules = [
-            (lambda x: x == 0, lambda x: 1.03),
-            (lambda x: x < 21, lambda x: 1),
-            (lambda x: x < 81, lambda x: 1 - (1.8 + (x - 21) * 0.1) / 100),
-            (lambda x: True, lambda x: 1 + (x - 20) / 500),
-        ]
-        for condition, calculation in rules:
-            if condition(allegorization_percent):
-                return calculation(allegorization_percent)
-        raise AssertionError("Unreachable allegorization branch")
+    @classmethod
+    def calculate_allegorization_trade_factor(cls, allegorization_percent: float) -> float:
+        cls._check_allegorization(allegorization_percent)
+        return cls.ALLEGORIZATION_TRADE_FACTOR(allegorization_percent)
+
+    @classmethod
+    def calculate_allegorization_economy_factor(cls, allegorization_percent: float) -> float:
+        cls._check_allegorization(allegorization_percent)
+        return cls.ALLEGORIZATION_ECONOMY_FACTOR(allegorization_percent)
 
     @classmethod
     def calculate_trade_income(
@@ -0,0 +1,114 @@
+"""asyncio runner for the skip-move engine.
+
+:func:`run_turn_async` plays one turn of any :class:`SkipMoverBase` engine
+for a player behind an :class:`AsyncUserIO`. The calculation steps of the
+turn (:meth:`SkipMoverBase.play_turn`) run in an executor, a thread pool by
+default; player decisions such as a credit are awaited on the event loop, so
+a session that waits for its player holds no thread and many sessions
+multiplex on one loop::
+
+    async with asyncio.TaskGroup() as group:
+        for engine, io in sessions:
+            group.create_task(run_turn_async(engine, io, executor=pool))
+
+Messages the engine prints during the turn are forwarded to ``io`` after
+each step. Cancelling a session while it waits for its player abandons the
+turn: the stats models and the random generators are put back to where they
+were when the turn started, so the turn can be played again.
+
+Context variables (e.g. ``use_industry_estimator``) are carried into the
+executor; the per-thread fallback generator of :mod:`functions.rng` is not,
+so for reproducible sessions the models should draw their derived fields
+from the engine's ``rng`` (``engine.recalculate_derived_fields()``).
+
+The executor must run the steps in this process (threads): the turn is a
+suspended generator, which cannot be pickled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from concurrent.futures import Executor
+from typing import AsyncIterator, Generator, Optional, Union
+
+from modules.run_skip_move import SkipMoverBase
+from modules.skip_move_types import CreditRequest, SkipMoveReport
+from utils.user_io import AsyncUserIO, HeadlessIO
+
+
+_Turn = Generator[CreditRequest, Optional[float], SkipMoveReport]
+
+
+def _advance(turn: _Turn, decision: Optional[float]
+             ) -> Union[CreditRequest, SkipMoveReport]:
+    try:
+        return turn.send(decision)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def _in_executor(executor: Optional[Executor],
+                       context: contextvars.Context, func, *args):
+    """Runs `func` in `executor`; when cancelled, waits for it to finish
+    before re-raising, so the turn is never touched from two threads."""
+    future = asyncio.get_running_loop().run_in_executor(
+        executor, context.run, func, *args)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait([future])
+        raise
+
+
+async def _forward(buffer: HeadlessIO, io: AsyncUserIO) -> None:
+    messages, buffer.printed[:] = list(buffer.printed), []
+    for message in messages:
+        await io.print(message)
+
+
+async def run_turn_async(
+        engine: SkipMoverBase,
+        io: AsyncUserIO,
+        *,
+        executor: Optional[Executor] = None,
+) -> SkipMoveReport:
+    """Plays one turn of `engine`, asking the player through `io`.
+
+    `engine.io` is replaced for the duration of the turn.
+    """
+    context = contextvars.copy_context()
+    buffer = HeadlessIO()
+    engine_io, engine.io = engine.io, buffer
+    turn = engine.play_turn()
+    try:
+        decision = None
+        while True:
+            step = await _in_executor(executor, context, _advance, turn,
+                                      decision)
+            await _forward(buffer, io)
+            if not isinstance(step, CreditRequest):
+                return step
+            decision = await io.request_credit(step.deficit)
+    finally:
+        turn.close()
+        engine.io = engine_io
+
+
+async def simulate_async(
+        engine: SkipMoverBase,
+        io: AsyncUserIO,
+        turns: int,
+        *,
+        executor: Optional[Executor] = None,
+) -> AsyncIterator[SkipMoveReport]:
+    """Async :meth:`SkipMoverBase.simulate`: yields each turn's report."""
+    if turns < 0:
+        raise ValueError("Количество ходов не может быть отрицательным")
+
+    context = contextvars.copy_context()
+    for turn in range(turns):
+        if turn:
+            await _in_executor(executor, context,
+                               engine.recalculate_derived_fields)
+        yield await run_turn_async(engine, io, executor=executor)
@@ -0,0 +1,787 @@
+"""Batched (struct-of-arrays) skip-move engine for the base mode.
+
+:class:`BasicSkipMove` works on one set of pydantic stats at a time. This module
+runs the very same step order (``_perform_basic_calculations`` →
+``_calculate_income_and_expenses`` → ``_finalize_calculations``) on NumPy
+columns, one element per country / scenario, so a whole world is processed in a
+handful of vectorized operations.
+
+Tolerance
+---------
+Every deterministic value of the report matches the scalar engine within
+``REPORT_RTOL`` (relative) / ``REPORT_ATOL`` (absolute). The differences come
+only from transcendental functions (``exp``/``tanh``/``log1p``) and summation
+order, which NumPy and :mod:`math` may round differently in the last ulp.
+
+The stochastic steps (stability coefficient, underfeed deaths and the success
+chance draw) use ``rng`` of the batch engine, so they match the scalar engine in
+distribution, not draw by draw. The stability coefficient only affects
+``Economy.income``, and underfeed only happens on negative food security, so
+reports of well-fed countries are deterministic.
+
+Credit is never requested: ``budget_final`` equals ``budget_after_boost``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from types import SimpleNamespace
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from functions.batch_in_move_functions import BatchInMoveFunctions
+from functions.rng import new_rng
+from modules.skip_move_types import (
+    CalculationResults,
+    LogisticParams,
+    SkipMoveReport,
+)
+from utils.logger_manager import get_logger
+
+
+logger = get_logger("Batch Skip Move")
+
+REPORT_RTOL = 1e-9
+REPORT_ATOL = 1e-9
+
+
+class StatsColumns(SimpleNamespace):
+    """Struct-of-arrays view of one stats domain.
+
+    Scalar fields become 1-D ``float64`` arrays of shape ``(n,)``; list fields
+    (``gov_wastes``, ``securities``, ``control``...) become 2-D arrays of shape
+    ``(n, k)``. Missing optional values are stored as ``nan``.
+    """
+
+    @classmethod
+    def from_arrays(cls, **columns: Any) -> StatsColumns:
+        return cls(**{
+            name: np.array(values, dtype=float)
+            for name, values in columns.items()
+        })
+
+    @classmethod
+    def from_models(cls, models: Sequence[Any]) -> StatsColumns:
+        if not models:
+            raise ValueError("Нужна хотя бы одна модель для сборки колонок")
+
+        columns: dict[str, np.ndarray] = {}
+        for name in type(models[0]).model_fields:
+            values = [getattr(model, name) for model in models]
+            if any(isinstance(value, (list, tuple)) for value in values):
+                width = max(len(value or ()) for value in values)
+                matrix = np.zeros((len(values), width))
+                for row, value in enumerate(values):
+                    matrix[row, :len(value or ())] = value or ()
+                columns[name] = matrix
+            elif all(value is None or isinstance(value, (int, float))
+                     for value in values):
+                columns[name] = np.array(
+                    [np.nan if value is None else value for value in values],
+                    dtype=float,
+                )
+        columns["is_negative_food_security"] = np.array([
+            bool(getattr(model, "_is_negative_food_security", False))
+            for model in models
+        ])
+        return cls(**columns)
+
+    def __len__(self) -> int:
+        for value in vars(self).values():
+            return len(value)
+        return 0
+
+    def require(self, names: Iterable[str], domain: str) -> None:
+        missing = [name for name in names if not hasattr(self, name)]
+        if missing:
+            raise ValueError(
+                f"{domain}: отсутствуют колонки {', '.join(missing)}")
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Returns one country as plain Python values."""
+        result: dict[str, Any] = {}
+        for name, values in vars(self).items():
+            value = values[index]
+            result[name] = value.tolist() if isinstance(value, np.ndarray) \
+                else value.item()
+        return result
+
+
+@dataclass
+class BatchSkipMoveReport:
+    """Columnar equivalent of :class:`SkipMoveReport`."""
+
+    mode: str
+    budget_before: np.ndarray
+
+    logistic_wastes: np.ndarray
+    total_wastes: np.ndarray
+    logistic_discount: np.ndarray
+
+    tax_income: np.ndarray
+    trade_income: np.ndarray
+    branches_income: np.ndarray
+    industry_income: np.ndarray
+    science_income: np.ndarray
+
+    money_income: np.ndarray
+
+    budget_after_raw: np.ndarray
+    stability_after: np.ndarray
+    income_boost: np.ndarray
+    budget_after_boost: np.ndarray
+
+    credit_taken: np.ndarray
+    credit_amount: np.ndarray
+    budget_final: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.budget_before)
+
+    def row(self, index: int) -> SkipMoveReport:
+        values = {
+            f.name: getattr(self, f.name)[index].item()
+            for f in fields(self) if f.name != "mode"
+        }
+        return SkipMoveReport(mode=self.mode, **values)
+
+    def to_reports(self) -> list[SkipMoveReport]:
+        return [self.row(index) for index in range(len(self))]
+
+
+class BatchBasicRules:
+    """Vectorized :class:`BasicSkipMoveRules`."""
+
+    @staticmethod
+    def get_state_apparatus_budget_spent(engine: BatchSkipMove) -> np.ndarray:
+        return engine.Economy.gov_wastes[:, 2]
+
+    @staticmethod
+    def calculate_logistic_params(
+            engine: BatchSkipMove,
+            logistic_wastes: np.ndarray
+    ) -> LogisticParams:
+        economy, inner = engine.Economy, engine.InnerPolitics
+        expected_logistic = engine.InMoveFunctions.calculate_expected_logistic_wastes(
+            economy.gov_wastes)
+        covered = expected_logistic <= logistic_wastes
+
+        discount = np.where(covered, economy.gov_wastes[:, 0] * 0.1, 0.0)
+        tax_income_coefficient = np.where(covered, 0.0, 0.1)
+
+        salt_security = inner.salt_security
+        headroom = 100 - inner.contentment
+        contentment_spotter = np.select(
+            [
+                (salt_security >= 0) & (salt_security < 50),
+                salt_security >= 100,
+            ],
+            [
+                -(salt_security // 5),
+                np.minimum(np.minimum(salt_security, 150) // 15, headroom),
+            ],
+            default=0.0,
+        )
+
+        total_control = inner.control[:, 0] + inner.control[:, 1]
+        controlled = total_control >= 90
+        contentment_spotter = np.where(
+            controlled,
+            np.minimum(contentment_spotter + 5, headroom),
+            contentment_spotter - 5,
+        )
+        tax_income_coefficient = np.where(
+            controlled,
+            tax_income_coefficient - 0.05,
+            tax_income_coefficient
+            + (inner.control[:, 2] + inner.control[:, 3]) / 400,
+        )
+
+        return LogisticParams(
+            discount=discount,
+            tax_income_coefficient=tax_income_coefficient,
+            contentment_spotter=contentment_spotter,
+        )
+
+    @staticmethod
+    def calculate_tax_income(
+            engine: BatchSkipMove,
+            results: CalculationResults,
+            logistic_wastes: np.ndarray,
+    ) -> np.ndarray:
+        economy, industry, inner = (engine.Economy, engine.Industry,
+                                    engine.InnerPolitics)
+        in_move = engine.InMoveFunctions
+        small_enterprise_tax_spotter = np.where(
+            economy.gov_wastes[:, 0] > results.expected_infrastructure_waste,
+            1.1, 0.85)
+
+        tax_income = in_move.calculate_tax_income(
+            economy.universal_tax * results.culture_coefficient,
+            economy.excise * in_move.calculate_goods_coefficient(industry.tvr2),
+            economy.additions,
+            economy.small_enterprise_tax * small_enterprise_tax_spotter,
+            economy.large_enterprise_tax,
+            inner.small_enterprise_percent,
+            inner.large_enterprise_count,
+            economy.population_count,
+        )
+
+        modifiers = [
+            results.contentment_coefficient_2,
+            (1 - results.logistic_params.tax_income_coefficient),
+            in_move.calculate_integrity_of_faith_factor(
+                inner.integrity_of_faith),
+            in_move.calculate_income_coefficient_based_on_panic_level(
+                inner.panic_level),
+            in_move.calculate_overproduction_tax_spotter(
+                industry.overproduction_coefficient),
+        ]
+        for m in modifiers:
+            tax_income = tax_income * m
+
+        return tax_income
+
+
+@dataclass(kw_only=True)
+class BatchSkipMove:
+    """Vectorized :class:`BasicSkipMove` over :class:`StatsColumns`.
+
+    The columns are updated in place, exactly like the scalar engine mutates
+    its pydantic models.
+    """
+
+    Economy: StatsColumns
+    Industry: StatsColumns
+    Agriculture: StatsColumns
+    InnerPolitics: StatsColumns
+    waste: float = 0.0
+
+    InMoveFunctions: BatchInMoveFunctions = field(
+        default_factory=BatchInMoveFunctions)
+    Rules: BatchBasicRules = field(default_factory=BatchBasicRules)
+    rng: np.random.Generator = field(default_factory=new_rng)
+
+    mode_name: str = "basic"
+
+    last_report: BatchSkipMoveReport | None = None
+
+    REQUIRED_COLUMNS = {
+        "Economy": (
+            "population_count", "decrement_coefficient", "inflation",
+            "current_budget", "stability", "universal_tax", "excise",
+            "additions", "small_enterprise_tax", "large_enterprise_tax",
+            "gov_wastes", "med_wastes", "other_wastes", "war_wastes",
+            "trade_rank", "trade_usage", "trade_efficiency", "trade_wastes",
+            "high_quality_percent", "mid_quality_percent",
+            "low_quality_percent", "valgery", "allegorization", "income",
+            "trade_potential", "branches_income",
+        ),
+        "Industry": (
+            "tvr1", "tvr2", "overproduction_coefficient",
+            "war_production_efficiency", "civil_usage", "civil_efficiency",
+            "max_potential", "expected_wastes",
+        ),
+        "Agriculture": (
+            "husbandry", "livestock", "others", "biome_richness",
+            "overprotective_effects", "securities", "workers_percent",
+            "workers_redistribution", "storages_upkeep", "consumption_factor",
+            "environmental_food", "agriculture_deceases",
+            "agriculture_natural_deceases", "income_from_resources",
+            "overstock_percent", "food_supplies",
+        ),
+        "InnerPolitics": (
+            "state_apparatus_size", "state_apparatus_efficiency",
+            "knowledge_level", "many_children_propoganda",
+            "integrity_of_faith", "salt_security", "poor_level",
+            "jobless_level", "income_from_scientific",
+            "small_enterprise_percent", "large_enterprise_count",
+            "provinces_count", "provinces_waste", "military_equipment",
+            "control", "contentment", "government_trust",
+            "many_children_traditions", "sexual_asceticism",
+            "egocentrism_development", "education_level", "erudition_will",
+            "cultural_level", "violence_tendency", "panic_level",
+            "unemployment_rate", "grace_of_the_highest",
+            "commitment_to_cause", "departure_from_truths", "society_decline",
+        ),
+    }
+
+    def __post_init__(self) -> None:
+        for domain, names in self.REQUIRED_COLUMNS.items():
+            getattr(self, domain).require(names, domain)
+        sizes = {len(getattr(self, domain)) for domain in self.REQUIRED_COLUMNS}
+        if len(sizes) != 1:
+            raise ValueError(f"Колонки разной длины: {sorted(sizes)}")
+
+    @classmethod
+    def from_stats(cls, stats: Sequence[Any], **kwargs: Any) -> BatchSkipMove:
+        """Builds an engine from objects with Economy/Industry/... attributes
+        (e.g. :class:`GameStats`)."""
+        return cls(
+            Economy=StatsColumns.from_models([s.Economy for s in stats]),
+            Industry=StatsColumns.from_models([s.Industry for s in stats]),
+            Agriculture=StatsColumns.from_models(
+                [s.Agriculture for s in stats]),
+            InnerPolitics=StatsColumns.from_models(
+                [s.InnerPolitics for s in stats]),
+            **kwargs,
+        )
+
+    def __len__(self) -> int:
+        return len(self.Economy)
+
+    def run(self) -> BatchSkipMoveReport:
+        try:
+            budget_before = self.Economy.current_budget.copy()
+            logistic_wastes = self._calculate_logistic_wastes()
+            results = self._perform_basic_calculations(logistic_wastes)
+
+            self._calculate_income_and_expenses(results, logistic_wastes)
+
+            total_wastes = self._calculate_total_wastes(logistic_wastes)
+
+            report = self._finalize_calculations(
+                budget_before=budget_before,
+                logistic_discount=results.logistic_params.discount,
+                total_wastes=total_wastes,
+                contentment_coefficient_2=results.contentment_coefficient_2,
+            )
+
+            self.last_report = report
+            return report
+
+        except Exception as e:
+            logger.error(f"Ошибка при пакетном пропуске хода: {e}")
+            raise
+
+    def _calculate_logistic_wastes(self) -> np.ndarray:
+        return (self.Economy.gov_wastes[:, 1]
+                + self.InnerPolitics.provinces_count
+                * self.InnerPolitics.provinces_waste)
+
+    def _calculate_total_wastes(self, logistic_wastes: np.ndarray) -> np.ndarray:
+        return (
+                self.Economy.med_wastes.sum(axis=1)
+                + self.Economy.gov_wastes.sum(axis=1)
+                + self.Economy.war_wastes.sum(axis=1)
+                + self.Economy.other_wastes.sum(axis=1)
+                + logistic_wastes
+                + self.waste
+                + self.Agriculture.expected_wastes
+                - self.Agriculture.income_from_resources
+        )
+
+    def _perform_basic_calculations(
+            self,
+            logistic_wastes: np.ndarray
+    ) -> CalculationResults:
+        logistic_params = self.Rules.calculate_logistic_params(
+            self, logistic_wastes)
+
+        cultural_coefficient = self.InMoveFunctions.calculate_cultural_coefficient(
+            self.InnerPolitics.cultural_level,
+            self.InnerPolitics.egocentrism_development,
+        )
+        contentment_coefficient_1, contentment_coefficient_2 = \
+            self.InMoveFunctions.calculate_contentment_coefficients(
+                self.InnerPolitics.contentment
+                + logistic_params.contentment_spotter
+            )
+        expected_infrastructure_waste = \
+            self.InMoveFunctions.calculate_expected_infrastructure_wastes(
+                self.Economy.population_count)
+        workers_count = self.InMoveFunctions.calculate_workers_count(
+            self.Economy.population_count,
+            self.Agriculture.workers_percent,
+            self.Agriculture.workers_redistribution,
+        )
+
+        return CalculationResults(
+            logistic_params=logistic_params,
+            culture_coefficient=cultural_coefficient,
+            contentment_coefficient_1=contentment_coefficient_1,
+            contentment_coefficient_2=contentment_coefficient_2,
+            expected_infrastructure_waste=expected_infrastructure_waste,
+            workers_count=workers_count,
+        )
+
+    def _calculate_income_and_expenses(
+            self,
+            results: CalculationResults,
+            logistic_wastes: np.ndarray
+    ) -> None:
+        self._calculate_agriculture_stats(results)
+        self._calculate_base_income(results)
+        self._calculate_industry_stats()
+        self._calculate_tax_income(results, logistic_wastes)
+        self._calculate_trade_income(logistic_wastes)
+        self._calculate_total_income(results, logistic_wastes)
+
+    def _calculate_agriculture_stats(self, results: CalculationResults) -> None:
+        agriculture, economy = self.Agriculture, self.Economy
+        in_move = self.InMoveFunctions
+
+        agriculture.expected_wastes = in_move.calculate_agriculture_wastes(
+            results.workers_count,
+            agriculture.securities,
+            agriculture.husbandry,
+            agriculture.livestock,
+            agriculture.others,
+        )
+        agriculture.food_diversity = in_move.calculate_food_diversity(
+            agriculture.husbandry,
+            agriculture.livestock,
+            agriculture.others,
+            agriculture.biome_richness,
+        )
+        agriculture.agriculture_efficiency = \
+            in_move.calculate_agriculture_efficiency(
+                agriculture.securities,
+                agriculture.biome_richness,
+                agriculture.husbandry,
+                agriculture.livestock,
+                agriculture.others,
+                agriculture.agriculture_deceases,
+                agriculture.agriculture_natural_deceases,
+                results.workers_count,
+                economy.population_count,
+            )
+        agriculture.agriculture_development = \
+            in_move.calculate_agriculture_development(
+                agriculture.securities,
+                results.workers_count,
+                economy.population_count,
+                agriculture.biome_richness,
+                agriculture.food_diversity,
+                agriculture.husbandry,
+                agriculture.livestock,
+                agriculture.others,
+            )
+        food_income = np.round(in_move.calculate_food_income(
+            results.workers_count,
+            agriculture.securities,
+            agriculture.overprotective_effects,
+            agriculture.agriculture_deceases,
+            agriculture.agriculture_natural_deceases,
+            agriculture.environmental_food,
+        ))
+        food_consumption = np.round(in_move.calculate_food_consumption(
+            economy.population_count,
+            agriculture.consumption_factor,
+        ))
+        food_security = np.round(
+            in_move.calculate_food_security(food_income, food_consumption))
+
+        food_supplies = np.round(in_move.calculate_food_supplies(
+            agriculture.food_supplies,
+            np.maximum(0., food_security),
+            agriculture.overstock_percent,
+            agriculture.storages_upkeep,
+        ))
+
+        deficit = 1 - (food_supplies / food_consumption)
+        pending = np.ones(len(self), dtype=bool)
+        for d, target in [(0.30, 150), (0.15, 100), (0.08, 50)]:
+            applies = pending & (deficit > d) & (food_security < target)
+            taken = np.minimum(target - food_security, food_supplies)
+            food_supplies = np.where(applies, food_supplies - taken,
+                                     food_supplies)
+            food_security = np.where(applies, food_security + taken,
+                                     food_security)
+            pending &= ~applies
+
+        results.real_food_security = food_security
+        negative = food_security < 0
+        agriculture.is_negative_food_security = (
+                agriculture.is_negative_food_security | negative)
+        agriculture.food_security = np.where(negative, 0.0, food_security)
+        agriculture.food_supplies = food_supplies
+
+    def _calculate_base_income(self, results: CalculationResults) -> None:
+        economy, inner, agriculture = (self.Economy, self.InnerPolitics,
+                                       self.Agriculture)
+        in_move = self.InMoveFunctions
+
+        income_multipliers = [
+            in_move.calculate_goods_coefficient(self.Industry.tvr1),
+            (
+                    in_move.calculate_stability_coefficient(
+                        inner.poor_level,
+                        inner.jobless_level,
+                        economy.med_wastes.sum(axis=1),
+                        economy.population_count,
+                        self.rng,
+                    )
+                    * results.contentment_coefficient_1
+                    * (0.015 * inner.many_children_propoganda + 1)
+            ),
+            in_move.calculate_income_coefficient_based_on_agriculture(
+                agriculture.food_security),
+            in_move.calculate_income_coefficient_based_on_social_decline(
+                inner.society_decline),
+            in_move.calculate_income_coefficient_based_on_food_diversity(
+                agriculture.food_diversity),
+        ]
+        for multiplier in income_multipliers:
+            economy.income = economy.income * multiplier
+
+        economy.population_count = (
+                economy.population_count
+                * in_move.calculate_population_decrement_coefficient(
+                    economy.decrement_coefficient)
+        )
+        economy.population_count = (
+                economy.population_count
+                - in_move.calculate_population_underfeed(
+                    economy.population_count,
+                    results.real_food_security,
+                    agriculture.biome_richness,
+                    self.rng,
+                )
+        )
+
+    def _calculate_industry_stats(self) -> None:
+        industry, economy = self.Industry, self.Economy
+        in_move = self.InMoveFunctions
+
+        industry.consumption_of_goods = in_move.calculate_consumption_of_goods(
+            economy.population_count,
+            economy.trade_usage,
+            economy.trade_efficiency,
+            industry.tvr1,
+            industry.tvr2,
+        )[0]
+        industry.overproduction_coefficient = (
+                industry.overproduction_coefficient
+                + in_move.calculate_industry_overproduction_change(
+                    industry.tvr1,
+                    industry.tvr2,
+                    industry.consumption_of_goods,
+                    economy.trade_usage,
+                )
+        )
+        industry.industry_income = in_move.calculate_industry_income(
+            economy.gov_wastes,
+            industry.civil_usage,
+            industry.max_potential,
+            industry.expected_wastes,
+        )
+
+    def _calculate_tax_income(
+            self,
+            results: CalculationResults,
+            logistic_wastes: np.ndarray
+    ) -> None:
+        self.Economy.tax_income = self.Rules.calculate_tax_income(
+            self, results, logistic_wastes)
+
+    def _trade_usage_load(self) -> np.ndarray:
+        potential = np.nan_to_num(self.Economy.trade_potential)
+        safe_potential = np.where(potential == 0, 1.0, potential)
+        return np.where(
+            potential == 0, 0.0,
+            np.round(self.Economy.trade_usage / safe_potential * 100))
+
+    def _calculate_trade_income(self, logistic_wastes: np.ndarray) -> None:
+        economy, industry, inner = (self.Economy, self.Industry,
+                                    self.InnerPolitics)
+        in_move = self.InMoveFunctions
+
+        economy.forex = in_move.calculate_forex_course(
+            economy.stability,
+            economy.tax_income,
+            self._calculate_total_wastes(logistic_wastes),
+            economy.current_budget,
+            economy.trade_rank,
+            economy.trade_efficiency,
+            self._trade_usage_load(),
+            industry.civil_efficiency,
+            inner.state_apparatus_efficiency,
+            inner.contentment,
+            inner.poor_level,
+            inner.jobless_level,
+            inner.control,
+        )
+        economy.trade_income = in_move.calculate_trade_income(
+            economy.trade_potential,
+            economy.trade_usage,
+            economy.trade_efficiency,
+            economy.trade_wastes,
+            economy.high_quality_percent,
+            economy.mid_quality_percent,
+            economy.low_quality_percent,
+            economy.forex,
+            economy.valgery,
+        ) * in_move.calculate_overproduction_trade_income(
+            industry.overproduction_coefficient)
+
+    def _calculate_total_income(
+            self,
+            results: CalculationResults,
+            logistic_wastes: np.ndarray
+    ) -> None:
+        economy, industry = self.Economy, self.Industry
+        in_move = self.InMoveFunctions
+        total_wastes = self._calculate_total_wastes(logistic_wastes)
+
+        allegorization_trade_factor = \
+            in_move.calculate_allegorization_trade_factor(
+                economy.allegorization)
+        allegorization_economy_factor = \
+            in_move.calculate_allegorization_economy_factor(
+                economy.allegorization)
+        agriculture_summarizing_factor = in_move.calculate_agriculture_factor(
+            economy.tax_income,
+            self.Agriculture.agriculture_development,
+            results.workers_count,
+        )
+
+        economy.trade_income = economy.trade_income * allegorization_trade_factor
+        economy.branches_income = (economy.branches_income
+                                   * allegorization_trade_factor)
+        economy.tax_income = (economy.tax_income * allegorization_economy_factor
+                              + agriculture_summarizing_factor)
+        industry.industry_income = (industry.industry_income
+                                    * allegorization_economy_factor)
+
+        economy.money_income = (
+                economy.tax_income
+                + economy.trade_income
+                + economy.branches_income
+                + industry.industry_income
+                + self._science_income()
+                - total_wastes
+        ) * in_move.calculate_inflation_factor(economy.inflation)
+
+    def _science_income(self) -> np.ndarray:
+        return np.nan_to_num(self.InnerPolitics.income_from_scientific)
+
+    def _update_stability(
+            self,
+            contentment_coefficient_2: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        economy, inner = self.Economy, self.InnerPolitics
+        in_move = self.InMoveFunctions
+
+        expected_size = in_move.expected_state_apparatus(
+            economy.population_count,
+            self.Rules.get_state_apparatus_budget_spent(self),
+        )
+        stability = economy.stability
+        buffed_stability = np.select(
+            [
+                expected_size > inner.state_apparatus_size,
+                (inner.state_apparatus_efficiency > 60) & (stability < 100),
+            ],
+            [stability - 10, np.minimum(stability + 5, 99)],
+            default=stability,
+        )
+
+        max_boost = (
+                (buffed_stability >= 80) & (buffed_stability <= 99)
+                & (inner.poor_level < 6)
+                & (inner.jobless_level < 12)
+                & (contentment_coefficient_2 > 0.8)
+        )
+        boost = np.where(
+            max_boost,
+            in_move.calculate_money_income_boost(
+                buffed_stability, inner.poor_level, inner.jobless_level),
+            in_move.calculate_money_income_simple_boost(buffed_stability),
+        )
+        return buffed_stability, boost
+
+    def _update_education(self) -> None:
+        economy, inner = self.Economy, self.InnerPolitics
+        in_move = self.InMoveFunctions
+
+        expected_knowledge = np.minimum(
+            in_move.calculate_knowledge(
+                economy.population_count,
+                economy.med_wastes[:, 0] + economy.med_wastes[:, 4],
+            ),
+            100,
+        )
+        education = inner.education_level
+        knowledge_diff = expected_knowledge - education
+        reduced = np.round(np.maximum(
+            expected_knowledge, education - np.abs(knowledge_diff) // 8))
+        increased = education + np.abs(knowledge_diff) / np.maximum(
+            education, 1)
+        inner.education_level = np.where(knowledge_diff < 0, reduced,
+                                         increased)
+
+        inner.society_decline = in_move.calculate_society_decline(
+            inner.contentment,
+            inner.government_trust,
+            inner.many_children_traditions,
+            inner.sexual_asceticism,
+            inner.egocentrism_development,
+            inner.education_level,
+            inner.erudition_will,
+            inner.cultural_level,
+            inner.violence_tendency,
+            inner.unemployment_rate,
+            inner.grace_of_the_highest,
+            inner.commitment_to_cause,
+            inner.departure_from_truths,
+        )
+        inner.success_chance = in_move.calculate_success_chance(
+            inner.knowledge_level,
+            inner.education_level,
+            inner.erudition_will,
+            self.rng,
+        )
+
+    def _update_military_equipment(self) -> None:
+        self.InnerPolitics.military_equipment = (
+                self.InnerPolitics.military_equipment
+                + self.Economy.war_wastes[:, 1]
+                * self.InMoveFunctions.calculate_military_equipment_coefficient(
+                    self.Industry.war_production_efficiency)
+        )
+
+    def _finalize_calculations(
+            self,
+            *,
+            budget_before: np.ndarray,
+            logistic_discount: np.ndarray,
+            total_wastes: np.ndarray,
+            contentment_coefficient_2: np.ndarray,
+    ) -> BatchSkipMoveReport:
+        self.Economy.prev_budget = budget_before
+
+        budget_after_raw = (budget_before + self.Economy.money_income
+                            + logistic_discount)
+        stability_after, boost = self._update_stability(
+            contentment_coefficient_2)
+        budget_after_boost = budget_after_raw * boost
+
+        self.Economy.current_budget = budget_after_boost
+
+        self._update_education()
+        self._update_military_equipment()
+
+        size = len(self)
+        return BatchSkipMoveReport(
+            mode=self.mode_name,
+            budget_before=budget_before,
+            logistic_wastes=self._calculate_logistic_wastes(),
+            total_wastes=total_wastes,
+            logistic_discount=np.broadcast_to(
+                logistic_discount, (size,)).astype(float),
+            tax_income=np.nan_to_num(self.Economy.tax_income),
+            trade_income=np.nan_to_num(self.Economy.trade_income),
+            branches_income=np.nan_to_num(self.Economy.branches_income),
+            industry_income=np.nan_to_num(self.Industry.industry_income),
+            science_income=self._science_income(),
+            money_income=np.nan_to_num(self.Economy.money_income),
+            budget_after_raw=budget_after_raw,
+            stability_after=stability_after.astype(float),
+            income_boost=boost,
+            budget_after_boost=budget_after_boost,
+            credit_taken=np.zeros(size, dtype=bool),
+            credit_amount=np.zeros(size),
+            budget_final=budget_after_boost.copy(),
+        )
@@ -0,0 +1,54 @@
+"""Credit policies for non-interactive runs.
+
+Interactive runs ask the player about a credit through `UserIO`. Simulations
+and batch runs decide with a policy object instead. A policy receives the
+deficit (a positive number) and returns the desired final budget, or ``None``
+to refuse the credit; the engine then takes ``deficit + final budget``.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+
+class CreditPolicy(ABC):
+    """Decides whether to take a credit when the budget is negative."""
+
+    @abstractmethod
+    def desired_final_budget(self, deficit: float) -> Optional[float]:
+        """Returns the budget after the credit or None to refuse it."""
+
+
+@dataclass(frozen=True)
+class NeverCredit(CreditPolicy):
+    """Never takes a credit: the budget stays negative."""
+
+    def desired_final_budget(self, deficit: float) -> Optional[float]:
+        return None
+
+
+@dataclass(frozen=True)
+class FixedTargetCredit(CreditPolicy):
+    """Always borrows enough to end the turn with `target` in the treasury."""
+
+    target: float
+
+    def desired_final_budget(self, deficit: float) -> Optional[float]:
+        return float(self.target)
+
+
+@dataclass(frozen=True)
+class CoverDeficitCredit(CreditPolicy):
+    """Borrows the deficit plus `margin` (absolute) plus `margin_ratio` of it."""
+
+    margin: float = 0.0
+    margin_ratio: float = 0.0
+
+    def __post_init__(self):
+        if self.margin < 0 or self.margin_ratio < 0:
+            raise ValueError("Запас по кредиту не может быть отрицательным")
+
+    def desired_final_budget(self, deficit: float) -> Optional[float]:
+        return float(self.margin + deficit * self.margin_ratio)
@@ -0,0 +1,182 @@
+"""Monte Carlo ensemble of skip-move turns.
+
+A single turn is random (industry efficiency, stability coefficient, underfeed
+deaths, success chance), so one run of the engine says little about the likely
+budget. :func:`run_ensemble` plays the same turn ``replicas`` times on
+independent copies of the stats and summarizes every numeric
+:class:`SkipMoveReport` field as p5/p50/p95 bands.
+
+Replica ``i`` is always seeded with the ``i``-th child of
+``SeedSequence(master_seed)``, so the result depends only on the master seed and
+never on the number of workers.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from functions.industry_models import IndustryEstimator, use_industry_estimator
+from modules.mode_spec import GameMode, ModeRegistry
+from modules.run_skip_move import BasicSkipMove
+from modules.run_start_skip import GameStats
+from modules.skip_move_types import SkipMoveReport
+from utils.logger_manager import get_logger
+from utils.user_io import HeadlessIO
+
+
+logger = get_logger("Ensemble")
+
+PERCENTILES = (5, 50, 95)
+
+
+@dataclass(frozen=True)
+class PercentileBand:
+    p5: float
+    p50: float
+    p95: float
+
+
+@dataclass
+class EnsembleResult:
+    """Percentile bands of every numeric report field."""
+
+    mode: str
+    master_seed: int
+    bands: Dict[str, PercentileBand]
+    reports: List[SkipMoveReport]
+
+    @property
+    def replicas(self) -> int:
+        return len(self.reports)
+
+
+def numeric_report_fields() -> List[str]:
+    return [
+        f.name for f in fields(SkipMoveReport)
+        if f.name not in ("mode", "credit_taken", "income_factors")
+    ]
+
+
+def replica_seeds(master_seed: int, replicas: int) -> List[int]:
+    children = np.random.SeedSequence(master_seed).spawn(replicas)
+    return [int(child.generate_state(1, dtype=np.uint64)[0])
+            for child in children]
+
+
+def run_replica(
+        mode: GameMode,
+        stats: GameStats,
+        seed: int,
+        waste: float = 0.0,
+        industry_estimator: IndustryEstimator = IndustryEstimator.NUMPY,
+) -> SkipMoveReport:
+    """Plays one turn on a copy of `stats` with a fixed seed."""
+    with use_industry_estimator(industry_estimator):
+        return _run_replica(mode, stats, seed, waste)
+
+
+def _run_replica(
+        mode: GameMode,
+        stats: GameStats,
+        seed: int,
+        waste: float,
+) -> SkipMoveReport:
+    return replica_engine(mode, stats, np.random.default_rng(seed),
+                          waste).run()
+
+
+def replica_engine(
+        mode: GameMode,
+        stats: GameStats,
+        rng: np.random.Generator,
+        waste: float = 0.0,
+) -> BasicSkipMove:
+    """An engine on a private copy of `stats` drawing only from `rng`.
+
+    Shares nothing mutable with the caller or with other replicas, so
+    replicas can run in any thread.
+    """
+    spec = ModeRegistry.get(mode)
+
+    replica = GameStats(
+        Economy=stats.Economy.model_copy(deep=True),
+        Industry=stats.Industry.model_copy(deep=True),
+        Agriculture=stats.Agriculture.model_copy(deep=True),
+        InnerPolitics=stats.InnerPolitics.model_copy(deep=True),
+    )
+    # Derived fields contain random draws too (industry efficiency).
+    for block in (replica.Economy, replica.Industry, replica.Agriculture,
+                  replica.InnerPolitics):
+        block.recalculate_derived_fields(rng=rng)
+
+    return BasicSkipMove(
+        Economy=replica.Economy,
+        Industry=replica.Industry,
+        Agriculture=replica.Agriculture,
+        InnerPolitics=replica.InnerPolitics,
+        waste=waste,
+        InMoveFunctions=spec.in_move_functions_factory(),
+        Rules=spec.rules_factory(),
+        io=HeadlessIO(),
+        rng=rng,
+        mode_name=spec.mode.value,
+    )
+
+
+def _run_replica_task(task: tuple) -> SkipMoveReport:
+    return run_replica(*task)
+
+
+def summarize(reports: Sequence[SkipMoveReport]) -> Dict[str, PercentileBand]:
+    bands = {}
+    for name in numeric_report_fields():
+        values = np.array(
+            [float(getattr(report, name) or 0.0) for report in reports])
+        p5, p50, p95 = np.percentile(values, PERCENTILES)
+        bands[name] = PercentileBand(p5=float(p5), p50=float(p50),
+                                     p95=float(p95))
+    return bands
+
+
+def run_ensemble(
+        stats: GameStats,
+        *,
+        mode: GameMode = GameMode.BASIC,
+        replicas: int = 200,
+        master_seed: int = 0,
+        workers: Optional[int] = None,
+        waste: float = 0.0,
+        industry_estimator: IndustryEstimator = IndustryEstimator.NUMPY,
+) -> EnsembleResult:
+    """Runs `replicas` independent turns and returns percentile bands.
+
+    `workers=1` runs inline; otherwise replicas are spread over a process pool
+    (`None` means one process per CPU).
+    """
+    if replicas < 1:
+        raise ValueError("Количество реплик должно быть положительным")
+
+    tasks = [(mode, stats, seed, waste, industry_estimator)
+             for seed in replica_seeds(master_seed, replicas)]
+    logger.info(f"Ансамбль: {replicas} реплик, режим {mode.value}")
+
+    if workers == 1:
+        reports = [_run_replica_task(task) for task in tasks]
+    else:
+        pool_size = workers or os.cpu_count() or 1
+        chunksize = max(1, replicas // (4 * pool_size))
+        with ProcessPoolExecutor(max_workers=pool_size) as pool:
+            reports = list(pool.map(_run_replica_task, tasks,
+                                    chunksize=chunksize))
+
+    return EnsembleResult(
+        mode=mode.value,
+        master_seed=master_seed,
+        bands=summarize(reports),
+        reports=reports,
+    )
@@ -2,36 +2,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import Callable, Dict
-
-from functions.atterium_in_move_functions import AtteriumInMoveFunctions
-from functions.basic_in_move_functions import BasicInMoveFunctions
-from functions.isf_in_move_functions import IsfInMoveFunctions
-from modules.run_start_skip import StatsConfig
-from modules.skip_move_rules import (
-    AtteriumSkipMoveRules,
-    BasicSkipMoveRules,
-    IsfSkipMoveRules,
-    SkipMoveRules,
-)
-from stats.atterium_stats import (
-    AtteriumAgricultureStats,
-    AtteriumEconomyStats,
-    AtteriumIndustrialStats,
-    AtteriumInnerPoliticsStats,
-)
-from stats.basic_stats import (
-    AgricultureStats,
-    EconomyStats,
-    IndustrialStats,
-    InnerPoliticsStats
-)
-from stats.isf_stats import (
-    IsfAgricultureStats,
-    IsfEconomyStats,
-    IsfIndustrialStats,
-    IsfInnerPoliticsStats,
-)
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+if TYPE_CHECKING:
+    from modules.run_start_skip import StatsConfig
+    from modules.skip_move_rules import SkipMoveRules
+
+
+def load_object(path: str) -> Any:
+    """Imports ``"package.module:Name"`` and returns the named object."""
+    module_name, _, name = path.partition(":")
+    # `__import__` rather than `importlib`: shows up in `-X importtime`
+    return getattr(__import__(module_name, fromlist=[name]), name)
 
 
 class GameMode(StrEnum):
@@ -50,14 +33,39 @@ class ModeSpec:
       - which Stats models to use
       - which formulas (InMoveFunctions) to use
       - which policy/rules (SkipMoveRules) to use
+
+    Classes are given as ``"module:Name"`` paths and imported on first use,
+    so listing the modes loads none of them.
     """
 
     mode: GameMode
     name: str
     description: str
-    stats_config: StatsConfig
-    in_move_functions_factory: Callable[[], object]
-    rules_factory: Callable[[], SkipMoveRules]
+    economy_class: str
+    industry_class: str
+    agriculture_class: str
+    inner_politics_class: str
+    in_move_functions_class: str
+    rules_class: str
+
+    @cached_property
+    def stats_config(self) -> StatsConfig:
+        from modules.run_start_skip import StatsConfig
+
+        return StatsConfig(
+            economy_class=load_object(self.economy_class),
+            industry_class=load_object(self.industry_class),
+            agriculture_class=load_object(self.agriculture_class),
+            inner_politics_class=load_object(self.inner_politics_class),
+        )
+
+    @cached_property
+    def in_move_functions_factory(self) -> Callable[[], object]:
+        return load_object(self.in_move_functions_class)
+
+    @cached_property
+    def rules_factory(self) -> Callable[[], SkipMoveRules]:
+        return load_object(self.rules_class)
 
 
 class ModeRegistry:
@@ -68,40 +76,38 @@ class ModeRegistry:
             mode=GameMode.BASIC,
             name="Базовый",
             description="Стандартные правила",
-            stats_config=StatsConfig(
-                economy_class=EconomyStats,
-                industry_class=IndustrialStats,
-                agriculture_class=AgricultureStats,
-                inner_politics_class=InnerPoliticsStats,
-            ),
-            in_move_functions_factory=BasicInMoveFunctions,
-            rules_factory=BasicSkipMoveRules,
+            economy_class="stats.basic_stats:EconomyStats",
+            industry_class="stats.basic_stats:IndustrialStats",
+            agriculture_class="stats.basic_stats:AgricultureStats",
+            inner_politics_class="stats.basic_stats:InnerPoliticsStats",
+            in_move_functions_class=(
+                "functions.basic_in_move_functions:BasicInMoveFunctions"),
+            rules_class="modules.skip_move_rules:BasicSkipMoveRules",
         ),
         GameMode.ATTERIUM: ModeSpec(
             mode=GameMode.ATTERIUM,
             name="Atterium",
             description="Правила Аттериума",
-            stats_config=StatsConfig(
-                economy_class=AtteriumEconomyStats,
-                industry_class=AtteriumIndustrialStats,
-                agriculture_class=AtteriumAgricultureStats,
-                inner_politics_class=AtteriumInnerPoliticsStats,
-            ),
-            in_move_functions_factory=AtteriumInMoveFunctions,
-            rules_factory=AtteriumSkipMoveRules,
+            economy_class="stats.atterium_stats:AtteriumEconomyStats",
+            industry_class="stats.atterium_stats:AtteriumIndustrialStats",
+            agriculture_class="stats.atterium_stats:AtteriumAgricultureStats",
+            inner_politics_class=(
+                "stats.atterium_stats:AtteriumInnerPoliticsStats"),
+            in_move_functions_class=(
+                "functions.atterium_in_move_functions:AtteriumInMoveFunctions"),
+            rules_class="modules.skip_move_rules:AtteriumSkipMoveRules",
         ),
         GameMode.ISF: ModeSpec(
             mode=GameMode.ISF,
             name="ISF",
             description="Правила Империи Серебряного Феникса",
-            stats_config=StatsConfig(
-                economy_class=IsfEconomyStats,
-                industry_class=IsfIndustrialStats,
-                agriculture_class=IsfAgricultureStats,
-                inner_politics_class=IsfInnerPoliticsStats,
-            ),
-            in_move_functions_factory=IsfInMoveFunctions,
-            rules_factory=IsfSkipMoveRules,
+            economy_class="stats.isf_stats:IsfEconomyStats",
+            industry_class="stats.isf_stats:IsfIndustrialStats",
+            agriculture_class="stats.isf_stats:IsfAgricultureStats",
+            inner_politics_class="stats.isf_stats:IsfInnerPoliticsStats",
+            in_move_functions_class=(
+                "functions.isf_in_move_functions:IsfInMoveFunctions"),
+            rules_class="modules.skip_move_rules:IsfSkipMoveRules",
         ),
     }
 
@@ -0,0 +1,567 @@
+"""Spending optimizer: the skip-move engine as a black-box objective.
+
+:func:`optimize` searches a box of field values (``gov_wastes``,
+``med_wastes[2]``, ``universal_tax``...) for the best value of one report
+metric, ``budget_final`` by default, under constraints such as::
+
+    stability_after >= 80
+    Agriculture.food_security >= 100
+    spend <= 5000
+
+Metrics are numeric :class:`SkipMoveReport` fields, stats fields read after
+the turn, and ``spend``, the sum of all decision variables. A whole list
+field is shorthand for one variable per item. From the command line::
+
+    python -m modules.optimizer --input country.txt --var gov_wastes=0:2000 \\
+        --var med_wastes=0:2000 --constraint "spend<=5000" --output best.txt
+
+Both searches (:func:`nelder_mead`, :func:`cma_es`) are plain NumPy and run
+in the unit cube of the variable ranges. Every candidate is played on the
+same ``replicas`` seeds (common random numbers), so two candidates differ
+only by their values and a repeated candidate is served from the cache.
+Candidates of one batch (the initial simplex, a CMA-ES generation) run in a
+process pool. Infeasible candidates rank after every feasible one, ordered
+by their scaled constraint violation. Credit is never taken.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from enum import StrEnum
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from modules.ensemble import numeric_report_fields, replica_seeds
+from modules.mode_spec import GameMode, ModeRegistry
+from modules.run_start_skip import GameStats, InputSection, \
+    parse_skipper_sections
+from modules.sweep import DOMAINS, SweepAxis, parse_path, point_stats, \
+    resolve_axes, run_turn
+from utils.logger_manager import get_logger
+
+
+logger = get_logger("Optimizer")
+
+SPEND = "spend"
+INFEASIBLE = 1e12
+
+BatchObjective = Callable[[np.ndarray], np.ndarray]
+
+_CONSTRAINT_PATTERN = re.compile(
+    r"^\s*(?P<metric>[\w.\[\]]+)\s*(?P<op>>=|<=)\s*(?P<bound>[-+\d.eE]+)\s*$")
+_OPERATORS = (">=", "<=")
+
+
+class OptimizerMethod(StrEnum):
+    NELDER_MEAD = "nelder-mead"
+    CMA_ES = "cma-es"
+
+
+@dataclass(frozen=True)
+class Variable:
+    """One decision variable in ``[low, high]``."""
+
+    field: str
+    low: float
+    high: float
+    domain: Optional[str] = None
+    index: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if not self.low < self.high:
+            raise ValueError(
+                f"Пустой диапазон {self.low}:{self.high} для поля {self.field}")
+
+    @property
+    def axis(self) -> SweepAxis:
+        return SweepAxis(field=self.field, values=(self.low, self.high),
+                         domain=self.domain, index=self.index)
+
+    @property
+    def name(self) -> str:
+        return self.axis.name
+
+    @classmethod
+    def parse(cls, spec: str) -> Variable:
+        """``path=low:high``."""
+        path, sep, bounds = spec.partition("=")
+        try:
+            low, high = (float(part) for part in bounds.split(":"))
+        except ValueError:
+            sep = ""
+        if not sep:
+            raise ValueError(f"Ожидается 'поле=мин:макс', получено: {spec!r}")
+        domain, name, index = parse_path(path)
+        return cls(field=name, low=low, high=high, domain=domain, index=index)
+
+
+@dataclass(frozen=True)
+class Constraint:
+    """``metric >= bound`` or ``metric <= bound``."""
+
+    metric: str
+    op: str
+    bound: float
+
+    def __post_init__(self) -> None:
+        if self.op not in _OPERATORS:
+            raise ValueError(f"Неизвестное сравнение: {self.op}")
+
+    @classmethod
+    def parse(cls, spec: str) -> Constraint:
+        match = _CONSTRAINT_PATTERN.match(spec)
+        try:
+            bound = float(match["bound"]) if match else None
+        except ValueError:
+            bound = None
+        if bound is None:
+            raise ValueError(
+                f"Ожидается 'метрика>=число' или 'метрика<=число', получено: {spec!r}")
+        return cls(metric=match["metric"], op=match["op"], bound=bound)
+
+    def violation(self, value: float) -> float:
+        """How far `value` is outside the constraint, relative to the bound."""
+        gap = self.bound - value if self.op == ">=" else value - self.bound
+        return max(0.0, gap) / max(1.0, abs(self.bound))
+
+    def __str__(self) -> str:
+        return f"{self.metric} {self.op} {self.bound:g}"
+
+
+@dataclass
+class OptimizationResult:
+    method: str
+    objective: str
+    values: Dict[str, float]
+    metrics: Dict[str, float]
+    feasible: bool
+    evaluations: int
+    cache_hits: int
+    history: List[float] = field(default_factory=list)
+
+
+def nelder_mead(
+        evaluate: BatchObjective,
+        x0: np.ndarray,
+        *,
+        max_evaluations: int,
+        initial_step: float = 0.1,
+        tolerance: float = 1e-6,
+) -> Tuple[np.ndarray, float]:
+    """Minimizes `evaluate` over the unit cube starting from `x0`.
+
+    `evaluate` takes an ``(n, d)`` array of points and returns ``n`` values;
+    points outside the cube are rejected without evaluation.
+    """
+    x0 = np.clip(np.asarray(x0, dtype=float), 0.0, 1.0)
+    dim = len(x0)
+    steps = np.where(x0 + initial_step <= 1.0, initial_step, -initial_step)
+    simplex = np.vstack([x0, x0 + np.diag(steps)])
+    values = np.asarray(evaluate(simplex), dtype=float)
+    used = dim + 1
+
+    def point(x: np.ndarray) -> Tuple[np.ndarray, float]:
+        # Extreme barrier: a point outside the cube is worse than any inside,
+        # which keeps the simplex from collapsing onto a face
+        nonlocal used
+        if ((x < 0.0) | (x > 1.0)).any():
+            return x, np.inf
+        used += 1
+        return x, float(evaluate(x[None])[0])
+
+    while used < max_evaluations:
+        order = np.argsort(values, kind="stable")
+        simplex, values = simplex[order], values[order]
+        if (values[-1] - values[0] <= tolerance * (1 + abs(values[0]))
+                and np.abs(simplex[1:] - simplex[0]).max() <= tolerance):
+            break
+
+        centroid = simplex[:-1].mean(axis=0)
+        worst = simplex[-1]
+        xr, fr = point(2 * centroid - worst)
+        if fr < values[0]:
+            xe, fe = point(3 * centroid - 2 * worst)
+            simplex[-1], values[-1] = (xe, fe) if fe < fr else (xr, fr)
+        elif fr < values[-2]:
+            simplex[-1], values[-1] = xr, fr
+        else:
+            if fr < values[-1]:
+                xc, fc = point(centroid + 0.5 * (xr - centroid))
+            else:
+                xc, fc = point(centroid + 0.5 * (worst - centroid))
+            if fc < min(fr, values[-1]):
+                simplex[-1], values[-1] = xc, fc
+            else:
+                simplex[1:] = simplex[0] + 0.5 * (simplex[1:] - simplex[0])
+                values[1:] = evaluate(simplex[1:])
+                used += dim
+
+    best = int(np.argmin(values))
+    return simplex[best], float(values[best])
+
+
+def cma_es(
+        evaluate: BatchObjective,
+        x0: np.ndarray,
+        *,
+        max_evaluations: int,
+        rng: np.random.Generator,
+        sigma: float = 0.3,
+        population: Optional[int] = None,
+        tolerance: float = 1e-6,
+) -> Tuple[np.ndarray, float]:
+    """(mu/mu_w, lambda) CMA-ES over the unit cube starting from `x0`.
+
+    Samples are clipped before evaluation; the distance to the cube is added
+    to their rank value so the mean drifts back inside.
+    """
+    mean = np.clip(np.asarray(x0, dtype=float), 0.0, 1.0)
+    dim = len(mean)
+    lam = population or 4 + int(3 * np.log(dim))
+    mu = lam // 2
+    weights = np.log(mu + 0.5) - np.log(np.arange(1, mu + 1))
+    weights /= weights.sum()
+    mueff = 1 / np.sum(weights ** 2)
+
+    cc = (4 + mueff / dim) / (dim + 4 + 2 * mueff / dim)
+    cs = (mueff + 2) / (dim + mueff + 5)
+    c1 = 2 / ((dim + 1.3) ** 2 + mueff)
+    cmu = min(1 - c1, 2 * (mueff - 2 + 1 / mueff) / ((dim + 2) ** 2 + mueff))
+    damps = 1 + 2 * max(0.0, np.sqrt((mueff - 1) / (dim + 1)) - 1) + cs
+    chi_n = np.sqrt(dim) * (1 - 1 / (4 * dim) + 1 / (21 * dim ** 2))
+
+    pc = np.zeros(dim)
+    ps = np.zeros(dim)
+    basis = np.eye(dim)
+    scales = np.ones(dim)
+    cov = np.eye(dim)
+    best_x, best_f = mean, float(evaluate(mean[None])[0])
+    used = 1
+    generation = 0
+
+    while used + lam <= max_evaluations:
+        generation += 1
+        steps = rng.standard_normal((lam, dim)) @ (basis * scales).T
+        samples = mean + sigma * steps
+        clipped = np.clip(samples, 0.0, 1.0)
+        values = np.asarray(evaluate(clipped), dtype=float)
+        used += lam
+
+        leader = int(np.argmin(values))
+        if values[leader] < best_f:
+            best_x, best_f = clipped[leader], float(values[leader])
+
+        ranking = values + np.abs(samples - clipped).sum(axis=1)
+        selected = steps[np.argsort(ranking, kind="stable")[:mu]]
+        step = weights @ selected
+        mean = mean + sigma * step
+
+        ps = (1 - cs) * ps + np.sqrt(cs * (2 - cs) * mueff) * (
+            basis @ ((basis.T @ step) / scales))
+        norm = np.linalg.norm(ps)
+        hsig = norm / np.sqrt(1 - (1 - cs) ** (2 * generation)) / chi_n \
+            < 1.4 + 2 / (dim + 1)
+        pc = (1 - cc) * pc + hsig * np.sqrt(cc * (2 - cc) * mueff) * step
+        cov = ((1 - c1 - cmu) * cov
+               + c1 * (np.outer(pc, pc) + (1 - hsig) * cc * (2 - cc) * cov)
+               + cmu * (selected.T * weights) @ selected)
+        sigma *= np.exp((cs / damps) * (norm / chi_n - 1))
+
+        cov = np.triu(cov) + np.triu(cov, 1).T
+        eigenvalues, basis = np.linalg.eigh(cov)
+        scales = np.sqrt(np.maximum(eigenvalues, 1e-20))
+        if sigma * scales.max() < tolerance:
+            break
+
+    return best_x, best_f
+
+
+def _evaluate_candidate(task: tuple) -> Dict[str, float]:
+    """Mean metrics of one candidate over the common seeds."""
+    mode, base, axes, point, seeds, waste, stat_metrics = task
+    totals: Dict[str, float] = {}
+    for seed in seeds:
+        rng = np.random.default_rng(seed)
+        stats = point_stats(mode, base, axes, point, rng)
+        report = run_turn(mode, stats, rng, waste)
+        metrics = {name: float(getattr(report, name) or 0.0)
+                   for name in numeric_report_fields()}
+        for metric in stat_metrics:
+            value = getattr(getattr(stats, metric.domain), metric.field)
+            if metric.index is not None:
+                value = value[metric.index]
+            metrics[metric.name] = float(value or 0.0)
+        for name, value in metrics.items():
+            totals[name] = totals.get(name, 0.0) + value
+    means = {name: value / len(seeds) for name, value in totals.items()}
+    means[SPEND] = float(sum(point))
+    return means
+
+
+class _Problem:
+    """Maps unit-cube batches to fitness values, with a candidate cache."""
+
+    def __init__(self, mode: GameMode, stats: GameStats,
+                 variables: Sequence[Variable], objective: str, maximize: bool,
+                 constraints: Sequence[Constraint], seeds: Sequence[int],
+                 waste: float, pool: Optional[Executor]):
+        self.mode = mode
+        self.base = {domain: getattr(stats, domain).model_dump()
+                     for domain in DOMAINS}
+        self.variables = list(variables)
+        self.axes = [variable.axis for variable in self.variables]
+        self.low = np.array([variable.low for variable in self.variables])
+        self.high = np.array([variable.high for variable in self.variables])
+        self.integer = np.array([
+            variable.index is None and isinstance(
+                self.base[variable.domain][variable.field], int)
+            for variable in self.variables
+        ])
+        self.constraints = list(constraints)
+        self.seeds = list(seeds)
+        self.waste = waste
+        self.pool = pool
+        self.sign = -1.0 if maximize else 1.0
+
+        names = [objective] + [c.metric for c in self.constraints]
+        self.metric_keys = {name: _resolve_metric(mode, stats, name)
+                            for name in names}
+        self.stat_metrics = [
+            metric for metric in self.metric_keys.values()
+            if isinstance(metric, SweepAxis)
+        ]
+        self.objective = self._key(objective)
+
+        self.cache: Dict[Tuple[float, ...], Dict[str, float]] = {}
+        self.cache_hits = 0
+        self.history: List[float] = []
+
+    def _key(self, name: str) -> str:
+        metric = self.metric_keys[name]
+        return metric.name if isinstance(metric, SweepAxis) else metric
+
+    def point(self, unit: np.ndarray) -> Tuple[float, ...]:
+        values = self.low + np.clip(unit, 0.0, 1.0) * (self.high - self.low)
+        values = np.where(self.integer, np.round(values), values)
+        return tuple(float(v) for v in np.round(values, 9))
+
+    def unit(self, point: Sequence[float]) -> np.ndarray:
+        return np.clip((np.asarray(point) - self.low) / (self.high - self.low),
+                       0.0, 1.0)
+
+    def metrics(self, points: Sequence[Tuple[float, ...]]) -> List[Dict[str, float]]:
+        missing = list(dict.fromkeys(p for p in points if p not in self.cache))
+        self.cache_hits += len(points) - len(missing)
+        tasks = [(self.mode, self.base, self.axes, point, self.seeds,
+                  self.waste, self.stat_metrics) for point in missing]
+        if self.pool is None or len(tasks) < 2:
+            outputs = [_evaluate_candidate(task) for task in tasks]
+        else:
+            outputs = list(self.pool.map(_evaluate_candidate, tasks))
+        self.cache.update(zip(missing, outputs))
+        return [self.cache[point] for point in points]
+
+    def violation(self, metrics: Dict[str, float]) -> float:
+        return sum(c.violation(metrics[self._key(c.metric)])
+                   for c in self.constraints)
+
+    def fitness(self, metrics: Dict[str, float]) -> float:
+        violation = self.violation(metrics)
+        if violation > 0:
+            return INFEASIBLE * (1 + violation)
+        return self.sign * metrics[self.objective]
+
+    def __call__(self, units: np.ndarray) -> np.ndarray:
+        points = [self.point(unit) for unit in np.atleast_2d(units)]
+        values = np.array([self.fitness(m) for m in self.metrics(points)])
+        best = float(values.min())
+        self.history.append(min(best, self.history[-1]) if self.history else best)
+        return values
+
+
+def _resolve_metric(mode: GameMode, stats: GameStats, name: str):
+    if name == SPEND or name in numeric_report_fields():
+        return name
+    domain, field_name, index = parse_path(name)
+    return resolve_axes(mode, stats, [SweepAxis(
+        field=field_name, values=(), domain=domain, index=index)])[0]
+
+
+def resolve_variables(mode: GameMode, stats: GameStats,
+                      variables: Sequence[Variable]) -> List[Variable]:
+    """Expands whole list fields into items and fills in the domains."""
+    expanded = []
+    for variable in variables:
+        if variable.index is None:
+            lists = [
+                domain for domain in DOMAINS
+                if variable.domain in (None, domain) and isinstance(
+                    getattr(getattr(stats, domain), variable.field, None), list)
+            ]
+            if len(lists) == 1:
+                size = len(getattr(getattr(stats, lists[0]), variable.field))
+                expanded.extend(replace(variable, domain=lists[0], index=i)
+                                for i in range(size))
+                continue
+        expanded.append(variable)
+    axes = resolve_axes(mode, stats, [variable.axis for variable in expanded])
+    return [replace(variable, domain=axis.domain)
+            for variable, axis in zip(expanded, axes)]
+
+
+def optimize(
+        stats: GameStats,
+        variables: Sequence[Variable],
+        *,
+        mode: GameMode = GameMode.BASIC,
+        objective: str = "budget_final",
+        maximize: bool = True,
+        constraints: Sequence[Constraint] = (),
+        method: OptimizerMethod = OptimizerMethod.CMA_ES,
+        max_evaluations: int = 400,
+        replicas: int = 4,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+        waste: float = 0.0,
+) -> OptimizationResult:
+    """Searches `variables` for the best `objective` under `constraints`.
+
+    `max_evaluations` bounds the number of candidates the search asks for;
+    each new candidate costs `replicas` turns. `workers=1` runs inline.
+    """
+    if not variables:
+        raise ValueError("Нужна хотя бы одна переменная")
+    if replicas < 1 or max_evaluations < 1:
+        raise ValueError("Число повторов и оценок должно быть положительным")
+    method = OptimizerMethod(method)
+    variables = resolve_variables(mode, stats, variables)
+    master = seed if seed is not None else int(
+        np.random.SeedSequence().generate_state(1)[0])
+    seeds = replica_seeds(master, replicas)
+    logger.info(f"Оптимизация {objective}: {len(variables)} переменных, "
+                f"метод {method.value}, до {max_evaluations} оценок")
+
+    pool = None
+    if workers != 1:
+        pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+    try:
+        problem = _Problem(mode, stats, variables, objective, maximize,
+                           constraints, seeds, waste, pool)
+        x0 = problem.unit([
+            problem.base[v.domain][v.field][v.index] if v.index is not None
+            else problem.base[v.domain][v.field]
+            for v in variables
+        ])
+        if method is OptimizerMethod.NELDER_MEAD:
+            best, _ = nelder_mead(problem, x0, max_evaluations=max_evaluations)
+        else:
+            best, _ = cma_es(problem, x0, max_evaluations=max_evaluations,
+                             rng=np.random.default_rng(master))
+        point = problem.point(best)
+        metrics = problem.metrics([point])[0]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    result = OptimizationResult(
+        method=method.value,
+        objective=problem.objective,
+        values={v.name: value for v, value in zip(variables, point)},
+        metrics=metrics,
+        feasible=problem.violation(metrics) == 0,
+        evaluations=len(problem.cache),
+        cache_hits=problem.cache_hits,
+        history=problem.history,
+    )
+    logger.info(f"Оптимизация завершена: {result.objective} = "
+                f"{metrics[result.objective]:.2f}, оценок {result.evaluations}")
+    return result
+
+
+def apply_values(mode: GameMode, stats: GameStats, values: Dict[str, float],
+                 rng: Optional[np.random.Generator] = None) -> GameStats:
+    """Copy of `stats` with `values` (as in :class:`OptimizationResult`)."""
+    axes = [SweepAxis(field=f, values=(), domain=d, index=i)
+            for d, f, i in map(parse_path, values)]
+    base = {domain: getattr(stats, domain).model_dump() for domain in DOMAINS}
+    return point_stats(mode, base, axes, list(values.values()),
+                       rng or np.random.default_rng())
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Подбор расходов по результату пропуска хода")
+    parser.add_argument("--mode", type=GameMode, choices=list(GameMode),
+                        default=GameMode.BASIC)
+    parser.add_argument("--input", required=True, type=Path,
+                        help="Файл со статами страны")
+    parser.add_argument("--var", required=True, action="append",
+                        type=Variable.parse, dest="variables",
+                        help="поле=мин:макс; список целиком - по элементу на "
+                             "переменную, элемент - поле[0]")
+    parser.add_argument("--constraint", action="append", default=[],
+                        type=Constraint.parse, dest="constraints",
+                        help="метрика>=число или метрика<=число; "
+                             f"{SPEND} - сумма переменных")
+    parser.add_argument("--objective", default="budget_final")
+    parser.add_argument("--minimize", action="store_true",
+                        help="Минимизировать цель вместо максимизации")
+    parser.add_argument("--method", type=OptimizerMethod,
+                        choices=list(OptimizerMethod),
+                        default=OptimizerMethod.CMA_ES)
+    parser.add_argument("--evaluations", type=int, default=400)
+    parser.add_argument("--replicas", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Количество процессов (по умолчанию - по CPU)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Файл для статов с найденными значениями")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    spec = ModeRegistry.get(args.mode)
+    rng = np.random.default_rng(args.seed)
+    stats = parse_skipper_sections(
+        spec.stats_config,
+        InputSection.split_text(args.input.read_text(encoding="utf-8")),
+        rng=rng)
+    try:
+        result = optimize(
+            stats, args.variables, mode=args.mode, objective=args.objective,
+            maximize=not args.minimize, constraints=args.constraints,
+            method=args.method, max_evaluations=args.evaluations,
+            replicas=args.replicas, seed=args.seed, workers=args.workers)
+    except ValueError as e:
+        print(f"Ошибка: {e}")
+        return 1
+
+    for name, value in result.values.items():
+        print(f"{name} = {value:g}")
+    print(f"{result.objective} = {result.metrics[result.objective]:.2f}")
+    for constraint in args.constraints:
+        metric = _resolve_metric(args.mode, stats, constraint.metric)
+        key = metric.name if isinstance(metric, SweepAxis) else metric
+        print(f"{constraint}: {result.metrics[key]:.2f}")
+    if not result.feasible:
+        print("Допустимое решение не найдено")
+    print(f"Оценок: {result.evaluations}, из кэша: {result.cache_hits}")
+
+    if args.output is not None:
+        best = apply_values(args.mode, stats, result.values, rng)
+        args.output.write_text(InputSection.render_text(best), encoding="utf-8")
+        print(f"Статы сохранены в {args.output}")
+    return 0 if result.feasible else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""Line-delimited JSON filter around the skip-move engine.
+
+Reads one JSON object per line from stdin and writes one per line to
+stdout, flushing after every record, so it can sit in a Unix pipeline::
+
+    cat countries.jsonl | python -m modules.pipe --workers 8 > turns.jsonl
+
+An input record::
+
+    {"mode": "basic", "stats": {"Economy": {...}, "Industry": {...},
+     "Agriculture": {...}, "InnerPolitics": {...}}, "turns": 1, "seed": 7}
+
+``stats`` may be replaced by ``text`` in the ``InputSection`` format; every
+key except the stats is optional (``id`` is echoed back). The output record
+holds the ``index`` of the input line, the ``reports`` of every turn and the
+``stats`` after the last one, or an ``error``. A record without ``seed``
+gets one derived from ``--seed`` and its index, so the output does not
+depend on the number of workers. Credit is never taken.
+
+At most ``window`` records are in flight at once, so memory stays bounded
+however long the stream is. With ``--order input`` records come out in
+input order; with ``--order completed`` as soon as they are done.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, \
+    wait
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, TextIO
+
+import numpy as np
+
+from modules.credit_policy import NeverCredit
+from modules.mode_spec import GameMode, ModeRegistry
+from modules.run_skip_move import BasicSkipMove
+from modules.run_start_skip import InputSection, parse_skipper_sections, \
+    stats_from_dict, stats_to_dict
+from utils.logger_manager import get_logger
+from utils.user_io import HeadlessIO
+
+
+logger = get_logger("Pipe")
+
+MAX_TURNS = 1000
+
+
+class PipeOrder(StrEnum):
+    INPUT = "input"
+    COMPLETED = "completed"
+
+
+@dataclass
+class PipeSummary:
+    records: int = 0
+    errors: int = 0
+
+
+def process_record(index: int, line: str, master_seed: Optional[int],
+                   default_mode: GameMode = GameMode.BASIC) -> Dict[str, Any]:
+    """Plays the turns of one input line; failures become an error record."""
+    output: Dict[str, Any] = {"index": index}
+    try:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("Запись должна быть JSON-объектом")
+        if "id" in record:
+            output["id"] = record["id"]
+
+        mode = GameMode(record.get("mode", default_mode))
+        turns = int(record.get("turns", 1))
+        if not 0 <= turns <= MAX_TURNS:
+            raise ValueError(f"Количество ходов должно быть от 0 до {MAX_TURNS}")
+        seed = record.get("seed")
+        rng = np.random.default_rng(
+            np.random.SeedSequence(master_seed, spawn_key=(index,))
+            if seed is None else seed)
+
+        spec = ModeRegistry.get(mode)
+        if "stats" in record:
+            stats = stats_from_dict(spec.stats_config, record["stats"], rng=rng)
+        elif isinstance(record.get("text"), str):
+            stats = parse_skipper_sections(
+                spec.stats_config, InputSection.split_text(record["text"]),
+                rng=rng)
+        else:
+            raise ValueError("Нужно поле 'stats' или 'text'")
+
+        engine = BasicSkipMove(
+            Economy=stats.Economy,
+            Industry=stats.Industry,
+            Agriculture=stats.Agriculture,
+            InnerPolitics=stats.InnerPolitics,
+            waste=float(record.get("waste", 0.0)),
+            InMoveFunctions=spec.in_move_functions_factory(),
+            Rules=spec.rules_factory(),
+            io=HeadlessIO(),
+            rng=rng,
+            credit_policy=NeverCredit(),
+            mode_name=spec.mode.value,
+        )
+        output["mode"] = mode.value
+        output["reports"] = [asdict(report)
+                             for report in engine.simulate(turns)]
+        output["stats"] = stats_to_dict(stats)
+    except Exception as e:
+        output["error"] = f"{type(e).__name__}: {e}"
+    return output
+
+
+def _process_task(task: tuple) -> Dict[str, Any]:
+    return process_record(*task)
+
+
+def iter_pipe(
+        lines: Iterable[str],
+        *,
+        workers: Optional[int] = None,
+        window: Optional[int] = None,
+        order: PipeOrder = PipeOrder.INPUT,
+        seed: Optional[int] = None,
+        default_mode: GameMode = GameMode.BASIC,
+) -> Iterator[Dict[str, Any]]:
+    """Output records for `lines`; blank lines are skipped but counted.
+
+    `workers=1` runs inline. Otherwise at most `window` records (by default
+    four per worker) are read ahead of the output.
+    """
+    order = PipeOrder(order)
+    master_seed = seed if seed is not None else int(
+        np.random.SeedSequence().generate_state(1)[0])
+    tasks = ((index, line, master_seed, default_mode)
+             for index, line in enumerate(lines) if line.strip())
+
+    if workers == 1:
+        for task in tasks:
+            yield _process_task(task)
+        return
+
+    pool_size = workers or os.cpu_count() or 1
+    window = window or 4 * pool_size
+    if window < 1:
+        raise ValueError("Окно должно быть положительным")
+
+    with ProcessPoolExecutor(max_workers=pool_size) as pool:
+        if order is PipeOrder.INPUT:
+            queue: deque[Future] = deque()
+            for task in tasks:
+                queue.append(pool.submit(_process_task, task))
+                if len(queue) >= window:
+                    yield queue.popleft().result()
+            while queue:
+                yield queue.popleft().result()
+        else:
+            pending: set[Future] = set()
+            for task in tasks:
+                pending.add(pool.submit(_process_task, task))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in wait(pending).done:
+                yield future.result()
+
+
+def run_pipe(source: TextIO, sink: TextIO, **kwargs: Any) -> PipeSummary:
+    """Streams `source` through :func:`iter_pipe` into `sink` line by line."""
+    summary = PipeSummary()
+    for output in iter_pipe(source, **kwargs):
+        summary.records += 1
+        if "error" in output:
+            summary.errors += 1
+            logger.warning(f"Запись {output['index']}: {output['error']}")
+        sink.write(json.dumps(output, ensure_ascii=False) + "\n")
+        sink.flush()
+    return summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Пропуск хода для JSON-записей из stdin, по строке на "
+                    "запись")
+    parser.add_argument("--mode", type=GameMode, choices=list(GameMode),
+                        default=GameMode.BASIC,
+                        help="Режим для записей без поля mode")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Количество процессов (по умолчанию - по CPU)")
+    parser.add_argument("--window", type=int, default=None,
+                        help="Сколько записей обрабатывается одновременно "
+                             "(по умолчанию - 4 на процесс)")
+    parser.add_argument("--order", type=PipeOrder, choices=list(PipeOrder),
+                        default=PipeOrder.INPUT,
+                        help="input - в порядке ввода, completed - по "
+                             "готовности")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    try:
+        summary = run_pipe(sys.stdin, sys.stdout, workers=args.workers,
+                           window=args.window, order=args.order,
+                           seed=args.seed, default_mode=args.mode)
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`)
+        sys.stderr.close()
+        return 0
+    return 0 if not summary.errors else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""Headless batch entry point.
+
+Processes many country stat files (the pretty text format with
+``=== ЭКОНОМИКА ===``-style section headers) in a process pool::
+
+    python -m modules.run_batch --mode basic --input stats/ --workers 8 --output out/
+
+For every input file ``<name>.txt`` the rendered stats after the turn are
+written to ``<output>/<name>.txt`` (readable back by this CLI), and all turn
+reports go to ``<output>/report.json``. ``<name>`` is the input path relative
+to the common directory of all inputs, so ``eu/france.txt`` and
+``asia/france.txt`` do not overwrite each other. A broken file is reported and does not
+stop the batch. Credit is never taken.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from modules.credit_policy import NeverCredit
+from modules.mode_spec import GameMode, ModeRegistry
+from modules.run_skip_move import BasicSkipMove
+from modules.run_start_skip import InputSection, parse_skipper_sections
+from modules.skip_move_types import SkipMoveReport
+from utils.logger_manager import get_logger
+from utils.user_io import HeadlessIO
+
+
+logger = get_logger("Run Batch")
+
+REPORT_FILE = "report.json"
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one input file."""
+
+    name: str
+    source: str
+    rendered: Optional[str] = None
+    report: Optional[SkipMoveReport] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def collect_inputs(pattern: str) -> List[Path]:
+    """A directory (all *.txt inside) or a glob pattern."""
+    path = Path(pattern)
+    if path.is_dir():
+        return sorted(path.glob("*.txt"))
+    return sorted(Path(p) for p in glob.glob(pattern) if Path(p).is_file())
+
+
+def output_names(paths: Sequence[Path]) -> List[str]:
+    """Names of `paths` relative to their common directory, without suffix.
+
+    Raises ValueError if two paths get the same name.
+    """
+    if not paths:
+        return []
+    absolute = [Path(os.path.abspath(path)) for path in paths]
+    root = os.path.commonpath([path.parent for path in absolute])
+    names = [path.relative_to(root).with_suffix("").as_posix()
+             for path in absolute]
+
+    duplicates = sorted(name for name, count in Counter(names).items()
+                        if count > 1)
+    if duplicates:
+        raise ValueError(f"Одинаковые имена у разных входных файлов: "
+                         f"{', '.join(duplicates)}")
+    return names
+
+
+def process_text(
+        mode: GameMode,
+        text: str,
+        seed: Optional[int] = None,
+        waste: float = 0.0,
+) -> tuple[str, SkipMoveReport]:
+    """Parses one country, plays a turn and returns (rendered text, report)."""
+    spec = ModeRegistry.get(mode)
+    rng = np.random.default_rng(seed)
+    stats = parse_skipper_sections(
+        spec.stats_config, InputSection.split_text(text), rng=rng)
+
+    engine = BasicSkipMove(
+        Economy=stats.Economy,
+        Industry=stats.Industry,
+        Agriculture=stats.Agriculture,
+        InnerPolitics=stats.InnerPolitics,
+        waste=waste,
+        InMoveFunctions=spec.in_move_functions_factory(),
+        Rules=spec.rules_factory(),
+        io=HeadlessIO(),
+        rng=rng,
+        credit_policy=NeverCredit(),
+        mode_name=spec.mode.value,
+    )
+    report = engine.run()
+    return InputSection.render_text(stats), report
+
+
+def _process_file(task: tuple) -> BatchItemResult:
+    mode, path, name, seed = task
+    path = Path(path)
+    try:
+        rendered, report = process_text(
+            mode, path.read_text(encoding="utf-8"), seed)
+        return BatchItemResult(name=name, source=str(path),
+                               rendered=rendered, report=report)
+    except Exception as e:
+        logger.error(f"Ошибка обработки {path}: {e}")
+        return BatchItemResult(name=name, source=str(path),
+                               error=f"{type(e).__name__}: {e}")
+
+
+def run_batch(
+        mode: GameMode,
+        paths: Sequence[Path],
+        *,
+        workers: Optional[int] = None,
+        seed: Optional[int] = None,
+) -> List[BatchItemResult]:
+    """Processes `paths` and returns results in input order.
+
+    Results are named by `output_names`, so paths that would share an
+    output raise ValueError before any work is done.
+    """
+    names = output_names(paths)
+    children = np.random.SeedSequence(seed).spawn(len(paths))
+    tasks = [(mode, str(path), name, child)
+             for path, name, child in zip(paths, names, children)]
+
+    if workers == 1 or len(tasks) <= 1:
+        return [_process_file(task) for task in tasks]
+
+    pool_size = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=pool_size) as pool:
+        return list(pool.map(_process_file, tasks))
+
+
+def write_outputs(results: Sequence[BatchItemResult], output: Path) -> Path:
+    output.mkdir(parents=True, exist_ok=True)
+    for result in results:
+        if result.ok:
+            path = output / f"{result.name}.txt"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(result.rendered, encoding="utf-8")
+
+    report_path = output / REPORT_FILE
+    payload = [
+        {
+            "name": result.name,
+            "source": result.source,
+            "ok": result.ok,
+            "report": asdict(result.report) if result.report else None,
+            "error": result.error,
+        }
+        for result in results
+    ]
+    report_path.write_text(
+        json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    return report_path
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Пакетный пропуск хода для набора стран")
+    parser.add_argument("--mode", type=GameMode, choices=list(GameMode),
+                        default=GameMode.BASIC)
+    parser.add_argument("--input", required=True,
+                        help="Папка с *.txt или glob-шаблон")
+    parser.add_argument("--output", required=True, type=Path)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Количество процессов (по умолчанию - по CPU)")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    paths = collect_inputs(args.input)
+    if not paths:
+        print(f"Не найдено файлов: {args.input}")
+        return 1
+
+    try:
+        results = run_batch(args.mode, paths, workers=args.workers,
+                            seed=args.seed)
+    except ValueError as e:
+        print(f"Ошибка: {e}")
+        return 1
+    report_path = write_outputs(results, args.output)
+
+    failed = [r for r in results if not r.ok]
+    print(f"Обработано {len(results) - len(failed)} из {len(results)}, "
+          f"отчет - {report_path}")
+    for result in failed:
+        print(f"  {result.source}: {result.error}")
+    return 0 if not failed else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
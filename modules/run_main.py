@@ -5,9 +5,6 @@ from enum import StrEnum
 from typing import Optional
 
 from modules.mode_spec import GameMode, ModeRegistry
-from modules.run_finalize import PrintFinalizer
-from modules.run_skip_move import BasicSkipMove
-from modules.run_start_skip import make_start_skip_move
 from utils.logger_manager import get_logger
 from utils.user_io import ConsoleIO, UserIO
 
@@ -86,6 +83,11 @@ class RunMain:
     def run(self) -> Status:
         try:
             mode = self.mode or ModeSelector.select_mode()
+            # The engine and the models load only once a mode is chosen
+            from modules.run_finalize import PrintFinalizer
+            from modules.run_skip_move import BasicSkipMove
+            from modules.run_start_skip import make_start_skip_move
+
             spec = ModeRegistry.get(mode)
             logger.info(f"Запуск: {spec.name} ({spec.mode.value})")
 
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, List, \
+    Optional, Tuple
+
+import numpy as np
 
-from functions.atterium_in_move_functions import AtteriumInMoveFunctions
 from functions.base import BaseInMoveFunctions
-from functions.basic_in_move_functions import BasicInMoveFunctions
-from functions.isf_in_move_functions import IsfInMoveFunctions
+from functions.rng import new_rng, spawn_rngs
+from modules.credit_policy import CreditPolicy
+from modules.mode_spec import GameMode, ModeRegistry
 from modules.skip_move_rules import (
     AtteriumSkipMoveRules,
     BasicSkipMoveRules,
@@ -16,35 +20,48 @@ from modules.skip_move_rules import (
 )
 from modules.skip_move_types import (
     CalculationResults,
+    CreditRequest,
     LogisticParams,
     SkipMoveContext,
     SkipMoveReport,
+    TurnLedger,
 )
-from stats.atterium_stats import (
-    AtteriumAgricultureStats,
-    AtteriumEconomyStats,
-    AtteriumIndustrialStats,
-    AtteriumInnerPoliticsStats,
-)
-from stats.basic_stats import (
-    AgricultureStats,
-    EconomyStats,
-    IndustrialStats,
-    InnerPoliticsStats
-)
-from stats.isf_stats import (
-    IsfAgricultureStats,
-    IsfEconomyStats,
-    IsfIndustrialStats,
-    IsfInnerPoliticsStats
-)
+from stats.stats_base import StatsBase
 from utils.logger_manager import get_logger
 from utils.user_io import ConsoleIO, UserIO
 
+if TYPE_CHECKING:
+    from functions.atterium_in_move_functions import AtteriumInMoveFunctions
+    from functions.basic_in_move_functions import BasicInMoveFunctions
+    from functions.isf_in_move_functions import IsfInMoveFunctions
+    from stats.atterium_stats import (
+        AtteriumAgricultureStats,
+        AtteriumEconomyStats,
+        AtteriumIndustrialStats,
+        AtteriumInnerPoliticsStats,
+    )
+    from stats.basic_stats import (
+        AgricultureStats,
+        EconomyStats,
+        IndustrialStats,
+        InnerPoliticsStats
+    )
+    from stats.isf_stats import (
+        IsfAgricultureStats,
+        IsfEconomyStats,
+        IsfIndustrialStats,
+        IsfInnerPoliticsStats
+    )
+
 
 logger = get_logger("Run Skip Move")
 
 
+def _in_move_functions(mode: GameMode) -> Callable[[], Any]:
+    """Default factory that imports the mode's formulas on first use."""
+    return lambda: ModeRegistry.get(mode).in_move_functions_factory()
+
+
 @dataclass
 class SkipMoverBase(ABC):
     """Base class for skip-move with shared utility methods.
@@ -52,7 +69,12 @@ class SkipMoverBase(ABC):
     The engine is intentionally mode-agnostic. Differences between modes are
     expressed via `InMoveFunctions` (formulas) and `Rules` (policy decisions).
 
-    For testability, all user interaction goes through `io`.
+    For testability, all user interaction goes through `io`. Every random
+    draw of the turn comes from `rng`, which the engine owns. When
+    `credit_policy` is set, credit decisions come from it instead of `io`.
+
+    A turn updates the stats models in place. Intermediate values of the
+    turn are kept in the context's `TurnLedger`.
     """
 
     Economy: Any
@@ -66,11 +88,17 @@ class SkipMoverBase(ABC):
     Rules: SkipMoveRules = field(default_factory=BasicSkipMoveRules)
 
     io: UserIO = field(default_factory=ConsoleIO)
+    rng: np.random.Generator = field(default_factory=new_rng)
+    credit_policy: Optional[CreditPolicy] = None
     mode_name: str = "unknown"
 
     last_report: SkipMoveReport | None = None
+    _turn_ctx: SkipMoveContext | None = field(
+        default=None, init=False, repr=False, compare=False)
 
     def _ctx(self) -> SkipMoveContext:
+        if self._turn_ctx is not None:
+            return self._turn_ctx
         return SkipMoveContext(
             economy=self.Economy,
             industry=self.Industry,
@@ -78,16 +106,114 @@ class SkipMoverBase(ABC):
             inner_politics=self.InnerPolitics,
             waste=self.waste,
             in_move=self.InMoveFunctions,
+            ledger=TurnLedger(),
         )
 
+    def _logistic_wastes(self) -> float:
+        ledger = self._ctx().ledger
+        if ledger.logistic_wastes is None:
+            ledger.logistic_wastes = self._calculate_logistic_wastes()
+        return ledger.logistic_wastes
+
+    def _total_wastes(self) -> float:
+        """Total expenses; every input is final after the agriculture step."""
+        ledger = self._ctx().ledger
+        if ledger.total_wastes is None:
+            ledger.total_wastes = self._calculate_total_wastes(
+                self._logistic_wastes())
+        return ledger.total_wastes
+
+    def spawn_rngs(self, n: int) -> List[np.random.Generator]:
+        """Independent child streams, e.g. one per worker."""
+        return spawn_rngs(self.rng, n)
+
     # Backwards compatible entrypoint used by run_main
     def skip_move(self) -> None:
         self.run()
 
-    @abstractmethod
     def run(self) -> SkipMoveReport:
+        """Plays one turn; credit is decided by `credit_policy` or `io`."""
+        turn = self.play_turn()
+        decision = None
+        while True:
+            try:
+                request = turn.send(decision)
+            except StopIteration as stop:
+                return stop.value
+            decision = self.io.request_credit(request.deficit)
+
+    @abstractmethod
+    def play_turn(self) -> Generator[CreditRequest, Optional[float],
+                                     SkipMoveReport]:
+        """One turn as a generator, for callers that ask the player
+        themselves (see :mod:`modules.async_skip_move`).
+
+        Without a `credit_policy`, a turn whose budget ends negative yields a
+        `CreditRequest` and expects the desired final budget (or None to
+        refuse) to be sent back. Returns the report. Closing the generator
+        at the request abandons the turn: the models and the generators are
+        put back to where they were when it started (see `_checkpoint`).
+        """
         raise NotImplementedError
 
+    def simulate(
+            self,
+            turns: int,
+            credit_policy: Optional[CreditPolicy] = None,
+    ) -> Iterator[SkipMoveReport]:
+        """Plays `turns` consecutive turns, yielding each report as it is done.
+
+        State is carried over from turn to turn; derived fields are
+        recalculated before every turn after the first one. `credit_policy`
+        overrides the engine's policy for the duration of the simulation.
+        """
+        if turns < 0:
+            raise ValueError("Количество ходов не может быть отрицательным")
+
+        previous_policy = self.credit_policy
+        if credit_policy is not None:
+            self.credit_policy = credit_policy
+        try:
+            for turn in range(turns):
+                if turn:
+                    self.recalculate_derived_fields()
+                logger.debug(f"Симуляция: ход {turn + 1} из {turns}")
+                yield self.run()
+        finally:
+            self.credit_policy = previous_policy
+
+    @contextmanager
+    def _turn(self) -> Iterator[None]:
+        """Builds the turn context once for the block."""
+        self._turn_ctx = None
+        self._turn_ctx = self._ctx()
+        try:
+            yield
+        finally:
+            self._turn_ctx = None
+
+    def _checkpoint(self) -> tuple:
+        """State of the stats models and of `rng` for `_rollback`."""
+        models = [model for model in (self.Economy, self.Industry,
+                                      self.Agriculture, self.InnerPolitics)
+                  if isinstance(model, StatsBase)]
+        return (self.rng.bit_generator.state,
+                [(model, model.checkpoint()) for model in models])
+
+    def _rollback(self, checkpoint: tuple) -> None:
+        """Undoes everything done to the models and `rng` since
+        `_checkpoint`, random draws included."""
+        rng_state, models = checkpoint
+        for model, model_checkpoint in models:
+            model.rollback(model_checkpoint)
+        self.rng.bit_generator.state = rng_state
+
+    def recalculate_derived_fields(self) -> None:
+        """Recomputes the derived fields of all models with `rng`."""
+        for stats in (self.Economy, self.Industry, self.Agriculture,
+                      self.InnerPolitics):
+            stats.recalculate_derived_fields(rng=self.rng)
+
     def _calculate_logistic_wastes(self) -> float:
         """
         Logistic expenses:
@@ -112,8 +238,10 @@ class SkipMoverBase(ABC):
             - self.Agriculture.income_from_resources
         )
 
-    def _apply_credit_if_needed(self) -> tuple[bool, float | None, float]:
-        """Ask the user about a credit if the budget is negative.
+    def _apply_credit_if_needed(self) -> Generator[
+            CreditRequest, Optional[float], tuple[bool, float | None, float]]:
+        """Ask the player (or the credit policy) about a credit if the budget
+        is negative; the player is asked by yielding a `CreditRequest`.
 
         We intentionally apply credit **after** all income calculations,
         discounts and boosts. This keeps the math deterministic, and credit is
@@ -125,7 +253,10 @@ class SkipMoverBase(ABC):
             return False, None, float(self.Economy.current_budget)
 
         deficit = float(-self.Economy.current_budget)
-        desired_final = self.io.request_credit(deficit)
+        if self.credit_policy is not None:
+            desired_final = self.credit_policy.desired_final_budget(deficit)
+        else:
+            desired_final = yield CreditRequest(deficit)
         if desired_final is None:
             return False, None, float(self.Economy.current_budget)
 
@@ -216,7 +347,9 @@ class SkipMoverBase(ABC):
             self.InnerPolitics.education_level += increase
             logger.debug(f"Образованность повышена на {increase}")
 
-        self.InnerPolitics.recalculate_derived_fields()
+        recalculated = self.InnerPolitics.recalculate_derived_fields(
+            rng=self.rng, changed=("education_level",))
+        logger.debug(f"Пересчитаны поля: {', '.join(recalculated)}")
 
     def _update_military_equipment(self) -> None:
         """Update military equipment score."""
@@ -239,37 +372,46 @@ class BasicSkipMove(SkipMoverBase):
     waste: float = 0.0
 
     InMoveFunctions: BasicInMoveFunctions = field(
-        default_factory=BasicInMoveFunctions)
+        default_factory=_in_move_functions(GameMode.BASIC))
     Rules: SkipMoveRules = field(default_factory=BasicSkipMoveRules)
 
     mode_name: str = "basic"
 
-    def run(self) -> SkipMoveReport:
+    def play_turn(self) -> Generator[CreditRequest, Optional[float],
+                                     SkipMoveReport]:
+        # Only a turn that can stop at a credit request can be abandoned
+        checkpoint = self._checkpoint() if self.credit_policy is None \
+            else None
         try:
-            budget_before = float(self.Economy.current_budget)
-            logistic_wastes = self._calculate_logistic_wastes()
-            results = self._perform_basic_calculations(logistic_wastes)
+            with self._turn():
+                budget_before = float(self.Economy.current_budget)
+                logistic_wastes = self._logistic_wastes()
+                results = self._perform_basic_calculations(logistic_wastes)
 
-            self._calculate_income_and_expenses(results, logistic_wastes)
+                self._calculate_income_and_expenses(results, logistic_wastes)
 
-            total_wastes = self._calculate_total_wastes(logistic_wastes)
+                total_wastes = self._total_wastes()
 
-            report = self._finalize_calculations(
-                budget_before=budget_before,
-                logistic_discount=float(results.logistic_params.discount),
-                total_wastes=total_wastes,
-                contentment_coefficient_2=float(
-                    results.contentment_coefficient_2),
-            )
+                report = self._finalize_calculations(
+                    budget_before=budget_before,
+                    logistic_discount=float(results.logistic_params.discount),
+                    total_wastes=total_wastes,
+                    contentment_coefficient_2=float(
+                        results.contentment_coefficient_2),
+                )
 
-            credit_taken, credit_amount, budget_final = self._apply_credit_if_needed()
-            report.credit_taken = credit_taken
-            report.credit_amount = float(credit_amount or 0.0)
-            report.budget_final = float(budget_final)
+                credit_taken, credit_amount, budget_final = \
+                    yield from self._apply_credit_if_needed()
+                report.credit_taken = credit_taken
+                report.credit_amount = float(credit_amount or 0.0)
+                report.budget_final = float(budget_final)
 
             self.last_report = report
             return report
 
+        except GeneratorExit:
+            self._rollback(checkpoint)
+            raise
         except Exception as e:
             logger.error(f"Ошибка при выполнении пропуска хода: {e}")
             raise
@@ -422,32 +564,33 @@ class BasicSkipMove(SkipMoverBase):
 
     def _calculate_base_income(self, results: CalculationResults) -> None:
         income_multipliers = [
-            self.InMoveFunctions.calculate_goods_coefficient(
+            ("goods", self.InMoveFunctions.calculate_goods_coefficient(
                 self.Industry.tvr1
-            ),
-            (
+            )),
+            ("stability", (
                     self.InMoveFunctions.calculate_stability_coefficient(
                         self.InnerPolitics.poor_level,
                         self.InnerPolitics.jobless_level,
                         sum(self.Economy.med_wastes),
                         self.Economy.population_count,
+                        rng=self.rng,
                     )
                     * results.contentment_coefficient_1
                     * (0.015 * self.InnerPolitics.many_children_propoganda + 1)
-            ),
-            self.InMoveFunctions.calculate_income_coefficient_based_on_agriculture(
+            )),
+            ("agriculture", self.InMoveFunctions.calculate_income_coefficient_based_on_agriculture(
                 self.Agriculture.food_security
-            ),
-            self.InMoveFunctions.calculate_income_coefficient_based_on_social_decline(
+            )),
+            ("society_decline", self.InMoveFunctions.calculate_income_coefficient_based_on_social_decline(
                 self.InnerPolitics.society_decline
-            ),
-            self.InMoveFunctions.calculate_income_coefficient_based_on_food_diversity(
+            )),
+            ("food_diversity", self.InMoveFunctions.calculate_income_coefficient_based_on_food_diversity(
                 self.Agriculture.food_diversity
-            ),
+            )),
         ]
 
-        for multiplier in income_multipliers:
-            self.Economy.income *= multiplier
+        self.Economy.income = self._ctx().ledger.apply(
+            "income", self.Economy.income, income_multipliers)
 
         self.Economy.population_count *= self.InMoveFunctions.calculate_population_decrement_coefficient(
             self.Economy.decrement_coefficient
@@ -455,7 +598,8 @@ class BasicSkipMove(SkipMoverBase):
         self.Economy.population_count -= self.InMoveFunctions.calculate_population_underfeed(
             self.Economy.population_count,
             results.real_food_security or 0,
-            self.Agriculture.biome_richness
+            self.Agriculture.biome_richness,
+            rng=self.rng,
         )
 
         logger.debug(f"Итоговый расчетный прирост - {self.Economy.income}")
@@ -498,8 +642,7 @@ class BasicSkipMove(SkipMoverBase):
         logger.debug(f"Итоговый налоговый доход - {self.Economy.tax_income}")
 
     def _calculate_trade_income(self) -> None:
-        logistic_wastes = self._calculate_logistic_wastes()
-        total_wastes_for_forex = self._calculate_total_wastes(logistic_wastes)
+        total_wastes_for_forex = self._total_wastes()
 
         self.Economy.forex = self.InMoveFunctions.calculate_forex_course(
             self.Economy.stability,
@@ -530,10 +673,13 @@ class BasicSkipMove(SkipMoverBase):
             self.Economy.valgery,
         )
 
-        self.Economy.trade_income = base_trade_income
-        self.Economy.trade_income *= self.InMoveFunctions.calculate_overproduction_trade_income(
-            self.Industry.overproduction_coefficient
-        )
+        self.Economy.trade_income = self._ctx().ledger.apply(
+            "trade_income", base_trade_income, [(
+                "overproduction",
+                self.InMoveFunctions.calculate_overproduction_trade_income(
+                    self.Industry.overproduction_coefficient
+                ),
+            )])
 
         # Mode-specific trade tweaks
         self.Rules.postprocess_trade_income(self._ctx())
@@ -545,7 +691,8 @@ class BasicSkipMove(SkipMoverBase):
             results: CalculationResults,
             logistic_wastes: float
     ) -> None:
-        total_wastes = self._calculate_total_wastes(logistic_wastes)
+        ledger = self._ctx().ledger
+        total_wastes = self._total_wastes()
         logger.debug(f"Общие расходы - {total_wastes}")
 
         allegorization_trade_factor = self.InMoveFunctions.calculate_allegorization_trade_factor(
@@ -573,13 +720,19 @@ class BasicSkipMove(SkipMoverBase):
         logger.debug(
             f"ОФД от РСХ - {agriculture_summarizing_factor}")
 
-        self.Economy.trade_income *= allegorization_trade_factor
-        self.Economy.branches_income *= allegorization_trade_factor
+        trade_factors = [("allegorization", allegorization_trade_factor)]
+        economy_factors = [("allegorization", allegorization_economy_factor)]
+        self.Economy.trade_income = ledger.apply(
+            "trade_income", self.Economy.trade_income, trade_factors)
+        self.Economy.branches_income = ledger.apply(
+            "branches_income", self.Economy.branches_income, trade_factors)
 
-        self.Economy.tax_income *= allegorization_economy_factor
+        self.Economy.tax_income = ledger.apply(
+            "tax_income", self.Economy.tax_income, economy_factors)
         self.Economy.tax_income += agriculture_summarizing_factor
 
-        self.Industry.industry_income *= allegorization_economy_factor
+        self.Industry.industry_income = ledger.apply(
+            "industry_income", self.Industry.industry_income, economy_factors)
 
         science_income = getattr(self.InnerPolitics, "income_from_scientific",
                                  0) or 0
@@ -596,11 +749,15 @@ class BasicSkipMove(SkipMoverBase):
         inflation_factor = self.InMoveFunctions.calculate_inflation_factor(
             self.Economy.inflation)
 
-        self.Economy.money_income *= inflation_factor
+        self.Economy.money_income = ledger.apply(
+            "money_income", self.Economy.money_income,
+            [("inflation", inflation_factor)])
 
         # Mode-specific extra modifiers
-        for m in self.Rules.money_income_extra_multipliers(self._ctx()):
-            self.Economy.money_income *= m
+        self.Economy.money_income = ledger.apply(
+            "money_income", self.Economy.money_income,
+            (("mode", m) for m in
+             self.Rules.money_income_extra_multipliers(self._ctx())))
 
         logger.debug(f"Итоговый доход - {self.Economy.money_income}")
 
@@ -639,7 +796,7 @@ class BasicSkipMove(SkipMoverBase):
         report = SkipMoveReport(
             mode=self.mode_name,
             budget_before=float(budget_before),
-            logistic_wastes=float(self._calculate_logistic_wastes()),
+            logistic_wastes=float(self._logistic_wastes()),
             total_wastes=float(total_wastes),
             logistic_discount=float(logistic_discount),
             tax_income=float(self.Economy.tax_income or 0),
@@ -655,6 +812,7 @@ class BasicSkipMove(SkipMoverBase):
             credit_taken=False,
             credit_amount=0.0,
             budget_final=float(budget_after_boost),
+            income_factors=tuple(self._ctx().ledger.income_factors),
         )
 
         return report
@@ -670,7 +828,7 @@ class AtteriumSkipMove(BasicSkipMove):
     InnerPolitics: AtteriumInnerPoliticsStats
 
     InMoveFunctions: AtteriumInMoveFunctions = field(
-        default_factory=AtteriumInMoveFunctions)
+        default_factory=_in_move_functions(GameMode.ATTERIUM))
     Rules: SkipMoveRules = field(default_factory=AtteriumSkipMoveRules)
 
     mode_name: str = "atterium"
@@ -686,7 +844,7 @@ class IsfSkipMove(BasicSkipMove):
     InnerPolitics: IsfInnerPoliticsStats
 
     InMoveFunctions: IsfInMoveFunctions = field(
-        default_factory=IsfInMoveFunctions)
+        default_factory=_in_move_functions(GameMode.ISF))
     Rules: SkipMoveRules = field(default_factory=IsfSkipMoveRules)
 
     mode_name: str = "isf"
@@ -1,26 +1,10 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Optional, Dict, Type, TypeVar, Generic
-
-from stats.atterium_stats import (
-    AtteriumEconomyStats,
-    AtteriumIndustrialStats,
-    AtteriumAgricultureStats,
-    AtteriumInnerPoliticsStats
-)
-from stats.basic_stats import (
-    EconomyStats,
-    IndustrialStats,
-    AgricultureStats,
-    InnerPoliticsStats
-)
-from stats.isf_stats import (
-    IsfEconomyStats,
-    IsfIndustrialStats,
-    IsfAgricultureStats,
-    IsfInnerPoliticsStats
-)
+from typing import Any, Optional, Dict, List, Mapping, Type, TypeVar, Generic
+
+import numpy as np
+
 from stats.stats_base import StatsBase
 from utils.input_parsers import InputParser
 from utils.logger_manager import get_logger
@@ -50,6 +34,10 @@ class StatsConfig:
     inner_politics_class: Type[StatsBase]
 
 
+# Разделы GameStats в порядке ввода
+STATS_DOMAINS = ("Economy", "Industry", "Agriculture", "InnerPolitics")
+
+
 @dataclass
 class GameStats:
     """Container for all stats."""
@@ -70,6 +58,19 @@ class InputSection:
     GOVERNMENT = "=== ГОСУДАРСТВО ==="
     PEOPLE = "=== НАРОД ==="
 
+    # Необязательный заголовок страны в файлах с несколькими странами
+    COUNTRY = "=== СТРАНА: {name} ==="
+
+    # Ключи секций режима skipper в порядке ввода
+    SKIPPER_SECTIONS = {
+        'economy': ECONOMY,
+        'trade': TRADE,
+        'industry': INDUSTRY,
+        'agriculture': AGRICULTURE,
+        'government': GOVERNMENT,
+        'people': PEOPLE,
+    }
+
     # Заголовки для режима создателя
     CREATOR_HEADERS = {
         'economy': "=== ВВОД ДАННЫХ ЭКОНОМИКИ ===",
@@ -79,6 +80,94 @@ class InputSection:
     }
 
 
+    @classmethod
+    def split_text(cls, text: str) -> Dict[str, str]:
+        """Разбивает текст статы на секции по заголовкам.
+
+        Отсутствующие секции возвращаются пустыми строками.
+        """
+        keys_by_header = {header: key for key, header in
+                          cls.SKIPPER_SECTIONS.items()}
+        lines: Dict[str, List[str]] = {key: [] for key in
+                                       cls.SKIPPER_SECTIONS}
+        current = None
+        for line in text.splitlines():
+            key = keys_by_header.get(line.strip())
+            if key is not None:
+                current = key
+            elif current is not None:
+                lines[current].append(line)
+            elif line.strip():
+                raise ValueError(
+                    f"Текст до первого заголовка секции: {line.strip()!r}")
+        return {key: '\n'.join(value).strip() for key, value in lines.items()}
+
+    @classmethod
+    def render_text(cls, stats: GameStats) -> str:
+        """Текст статы с заголовками секций, обратный к `split_text`.
+
+        Торговля и народ выводятся внутри секций экономики и государства.
+        """
+        return '\n\n'.join([
+            f"{cls.ECONOMY}\n{stats.Economy}",
+            f"{cls.INDUSTRY}\n{stats.Industry}",
+            f"{cls.AGRICULTURE}\n{stats.Agriculture}",
+            f"{cls.GOVERNMENT}\n{stats.InnerPolitics}",
+        ]) + '\n'
+
+
+def parse_skipper_sections(
+        config: StatsConfig,
+        sections: Dict[str, str],
+        rng: Optional[np.random.Generator] = None,
+) -> GameStats:
+    """Создает статистики из текстов секций режима skipper."""
+    def section(key: str) -> str:
+        return sections.get(key, '')
+
+    return GameStats(
+        # Экономика (экономика + торговля)
+        Economy=config.economy_class.from_stats_text(
+            f"{section('economy')}\n{section('trade')}", rng=rng),
+        Industry=config.industry_class.from_stats_text(
+            section('industry'), rng=rng),
+        Agriculture=config.agriculture_class.from_stats_text(
+            section('agriculture'), rng=rng),
+        # Внутренняя политика (государство + народ)
+        InnerPolitics=config.inner_politics_class.from_stats_text(
+            f"{section('government')}\n{section('people')}", rng=rng),
+    )
+
+
+def stats_to_dict(stats: GameStats) -> Dict[str, Dict[str, Any]]:
+    """Поля статистик по разделам (Economy, Industry, ...), для JSON."""
+    # После хода движок пишет целые поля (population_count) как float
+    return {domain: getattr(stats, domain).model_dump(warnings=False)
+            for domain in STATS_DOMAINS}
+
+
+def stats_from_dict(
+        config: StatsConfig,
+        data: Mapping[str, Mapping[str, Any]],
+        rng: Optional[np.random.Generator] = None,
+) -> GameStats:
+    """Создает статистики из словаря разделов с полной валидацией."""
+    if not isinstance(data, Mapping) or set(data) != set(STATS_DOMAINS):
+        raise ValueError(
+            f"Ожидаются разделы {', '.join(STATS_DOMAINS)}")
+    classes = {
+        "Economy": config.economy_class,
+        "Industry": config.industry_class,
+        "Agriculture": config.agriculture_class,
+        "InnerPolitics": config.inner_politics_class,
+    }
+    return GameStats(**{
+        domain: classes[domain].model_validate(
+            data[domain], context={"rng": rng})
+        for domain in STATS_DOMAINS
+    })
+
+
 class ModeSelector:
     """Класс для выбора режима игры"""
 
@@ -163,17 +252,11 @@ class DataInputHandler:
     @classmethod
     def collect_skipper_sections(cls) -> Dict[str, str]:
         """Собирает все секции для режима skipper"""
-        sections = {}
         try:
-            sections['economy'] = cls.get_section_data(InputSection.ECONOMY)
-            sections['trade'] = cls.get_section_data(InputSection.TRADE)
-            sections['industry'] = cls.get_section_data(InputSection.INDUSTRY)
-            sections['agriculture'] = cls.get_section_data(
-                InputSection.AGRICULTURE)
-            sections['government'] = cls.get_section_data(
-                InputSection.GOVERNMENT)
-            sections['people'] = cls.get_section_data(InputSection.PEOPLE)
-            return sections
+            return {
+                key: cls.get_section_data(header)
+                for key, header in InputSection.SKIPPER_SECTIONS.items()
+            }
         except Exception as e:
             logger.error(f"Ошибка при сборе секций: {e}")
             raise
@@ -252,32 +335,7 @@ class StartSkipMoveBase(ABC, Generic[
         try:
             # Собираем данные всех секций
             sections = DataInputHandler.collect_skipper_sections()
-            config = self._stats_config
-
-            # Создаем статистики из текста
-            stats_data = {}
-
-            # Экономика (экономика + торговля)
-            economy_text = f"{sections['economy']}\n{sections['trade']}"
-            stats_data['Economy'] = config.economy_class.from_stats_text(
-                economy_text)
-
-            # Промышленность
-            stats_data['Industry'] = config.industry_class.from_stats_text(
-                sections['industry'])
-
-            # Сельское хозяйство
-            stats_data[
-                'Agriculture'] = config.agriculture_class.from_stats_text(
-                sections['agriculture'])
-
-            # Внутренняя политика (государство + народ)
-            politics_text = f"{sections['government']}\n{sections['people']}"
-            stats_data[
-                'InnerPolitics'] = config.inner_politics_class.from_stats_text(
-                politics_text)
-
-            return GameStats(**stats_data)
+            return parse_skipper_sections(self._stats_config, sections)
 
         except Exception as e:
             logger.error(f"Ошибка в режиме пропуска ходов: {e}")
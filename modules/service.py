@@ -0,0 +1,361 @@
+"""Local JSON-over-HTTP simulation service.
+
+A long-lived server with a warm process pool, so a game master's bot can
+send many countries without paying the interpreter and import cost for
+each::
+
+    python -m modules.service --port 8765 --workers 8
+
+Every endpoint takes a JSON object by POST and answers with a JSON object.
+``mode`` is a :class:`GameMode` value (``basic`` by default) and ``text`` a
+country in the ``InputSection`` format:
+
+``/parse``      ``{mode, text, seed?}`` -> ``{stats: {Economy: {...}, ...}}``
+``/skip-move``  ``{mode, text, seed?, waste?}`` -> ``{report, rendered}``
+``/render``     ``{mode, text | stats}`` -> ``{rendered}``
+``/ensemble``   ``{mode, text, replicas?, seed?, waste?}`` -> ``{bands}``
+
+``GET /metrics`` returns per-endpoint latency histograms and the pool queue
+depth, ``GET /health`` answers ``{"status": "ok"}``. Invalid requests get a
+400 with ``{"error": ...}``. NaN and infinite numbers in the answers (e.g. a
+deficit with no food consumption) are sent as ``null``. Credit is never taken.
+
+Requests are handled on threads and the work itself runs in the pool; the
+pool workers import every mode and build its validators, parse plans and
+render templates when they start, so the first request is as fast as the next ones.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, wait
+from dataclasses import asdict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+from modules.ensemble import run_ensemble
+from modules.mode_spec import GameMode, ModeRegistry
+from modules.run_batch import process_text
+from modules.run_start_skip import GameStats, InputSection, \
+    parse_skipper_sections, stats_from_dict, stats_to_dict
+from utils.logger_manager import get_logger
+
+
+logger = get_logger("Service")
+
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 4 * 1024 * 1024
+MAX_REPLICAS = 10_000
+
+# Upper bounds of the latency buckets, milliseconds
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+_BUCKET_LABELS = LATENCY_BUCKETS_MS + ("inf",)
+
+
+def _mode(payload: Dict[str, Any]) -> GameMode:
+    try:
+        return GameMode(payload.get("mode", GameMode.BASIC))
+    except ValueError:
+        raise ValueError(
+            f"Неизвестный режим: {payload.get('mode')!r}; доступны: "
+            f"{', '.join(GameMode)}") from None
+
+
+def _text(payload: Dict[str, Any]) -> str:
+    text = payload.get("text")
+    if not isinstance(text, str):
+        raise ValueError("Нужно поле 'text' со статами страны")
+    return text
+
+
+def _parse_stats(payload: Dict[str, Any]) -> GameStats:
+    mode = _mode(payload)
+    return parse_skipper_sections(
+        ModeRegistry.get(mode).stats_config,
+        InputSection.split_text(_text(payload)),
+        rng=np.random.default_rng(payload.get("seed")))
+
+
+def parse_endpoint(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {"stats": stats_to_dict(_parse_stats(payload))}
+
+
+def skip_move_endpoint(payload: Dict[str, Any]) -> Dict[str, Any]:
+    rendered, report = process_text(
+        _mode(payload), _text(payload), payload.get("seed"),
+        float(payload.get("waste", 0.0)))
+    return {"report": asdict(report), "rendered": rendered}
+
+
+def render_endpoint(payload: Dict[str, Any]) -> Dict[str, Any]:
+    if "stats" not in payload:
+        return {"rendered": InputSection.render_text(_parse_stats(payload))}
+    stats = stats_from_dict(
+        ModeRegistry.get(_mode(payload)).stats_config, payload["stats"],
+        rng=np.random.default_rng(payload.get("seed")))
+    return {"rendered": InputSection.render_text(stats)}
+
+
+def ensemble_endpoint(payload: Dict[str, Any]) -> Dict[str, Any]:
+    replicas = int(payload.get("replicas", 200))
+    if not 1 <= replicas <= MAX_REPLICAS:
+        raise ValueError(f"Количество реплик должно быть от 1 до {MAX_REPLICAS}")
+    seed = payload.get("seed")
+    result = run_ensemble(
+        _parse_stats(payload), mode=_mode(payload), replicas=replicas,
+        master_seed=0 if seed is None else int(seed), workers=1,
+        waste=float(payload.get("waste", 0.0)))
+    return {"mode": result.mode, "replicas": result.replicas,
+            "bands": {name: asdict(band) for name, band in result.bands.items()}}
+
+
+ENDPOINTS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "/parse": parse_endpoint,
+    "/skip-move": skip_move_endpoint,
+    "/render": render_endpoint,
+    "/ensemble": ensemble_endpoint,
+}
+
+
+def _call_endpoint(path: str, payload: Dict[str, Any]) -> tuple[bool, Any]:
+    """Runs in a pool worker; errors of the request come back as values."""
+    try:
+        return True, ENDPOINTS[path](payload)
+    except (ValueError, TypeError, KeyError) as e:
+        return False, str(e)
+
+
+def _warm_up() -> None:
+    """Pool initializer: builds every lazily cached class table up front."""
+    for spec in ModeRegistry.available().values():
+        # Modes import their formulas and rules on first use
+        spec.in_move_functions_factory
+        spec.rules_factory
+        config = spec.stats_config
+        for cls in (config.economy_class, config.industry_class,
+                    config.agriculture_class, config.inner_politics_class):
+            # Pydantic validators are deferred to the first validation
+            cls.model_rebuild()
+            cls._get_parse_plan()
+            cls._get_render_template()
+            cls._get_trusted_layout()
+
+
+def _finite(value: Any) -> Any:
+    """`value` with every NaN or infinite float replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def dump_json(body: Dict[str, Any]) -> bytes:
+    """Strict JSON of `body`: non-finite numbers become null."""
+    try:
+        text = json.dumps(body, ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        text = json.dumps(_finite(body), ensure_ascii=False, allow_nan=False)
+    return text.encode("utf-8")
+
+
+class LatencyHistogram:
+    """Counts of request latencies per bucket of `LATENCY_BUCKETS_MS`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.errors = 0
+        self.total_ms = 0.0
+
+    def observe(self, seconds: float, ok: bool = True) -> None:
+        ms = seconds * 1e3
+        with self._lock:
+            self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+            self.total_ms += ms
+            self.errors += not ok
+
+    def quantile(self, q: float) -> Optional[float | str]:
+        """Upper bound of the bucket holding the `q` quantile, ms."""
+        total = sum(self.counts)
+        if not total:
+            return None
+        seen = 0
+        for bound, count in zip(_BUCKET_LABELS, self.counts):
+            seen += count
+            if seen >= q * total:
+                return bound
+        return _BUCKET_LABELS[-1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            count = sum(self.counts)
+            return {
+                "count": count,
+                "errors": self.errors,
+                "mean_ms": self.total_ms / count if count else None,
+                "p50_ms": self.quantile(0.5),
+                "p95_ms": self.quantile(0.95),
+                "buckets_ms": list(_BUCKET_LABELS),
+                "counts": list(self.counts),
+            }
+
+
+class SimulationService:
+    """The warm pool and the metrics shared by all request threads."""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers,
+                                        initializer=_warm_up)
+        # Start every worker now instead of on the first requests
+        wait([self.pool.submit(time.sleep, 0) for _ in range(self.workers)])
+        self.latency = {path: LatencyHistogram() for path in ENDPOINTS}
+        self._lock = threading.Lock()
+        self.in_flight = 0
+
+    def call(self, path: str, payload: Dict[str, Any]) -> tuple[bool, Any]:
+        started = time.perf_counter()
+        with self._lock:
+            self.in_flight += 1
+        try:
+            ok, result = self.pool.submit(_call_endpoint, path, payload).result()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        self.latency[path].observe(time.perf_counter() - started, ok)
+        return ok, result
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a free worker."""
+        return max(0, self.in_flight - self.workers)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "endpoints": {path: histogram.snapshot()
+                          for path, histogram in self.latency.items()},
+        }
+
+    def close(self) -> None:
+        self.pool.shutdown(cancel_futures=True)
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    service: SimulationService
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send(self, status: HTTPStatus, body: Dict[str, Any]) -> None:
+        data = dump_json(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path == "/metrics":
+            self._send(HTTPStatus.OK, self.service.metrics())
+        elif self.path == "/health":
+            self._send(HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._send(HTTPStatus.NOT_FOUND,
+                       {"error": f"Неизвестный адрес: {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path not in ENDPOINTS:
+            self._send(HTTPStatus.NOT_FOUND,
+                       {"error": f"Неизвестный адрес: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_BODY_BYTES:
+            self._send(HTTPStatus.BAD_REQUEST,
+                       {"error": f"Длина тела запроса должна быть "
+                                 f"от 0 до {MAX_BODY_BYTES} байт"})
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(payload, dict):
+                raise ValueError
+        except ValueError:
+            self._send(HTTPStatus.BAD_REQUEST,
+                       {"error": "Тело запроса должно быть JSON-объектом"})
+            return
+
+        try:
+            ok, result = self.service.call(self.path, payload)
+        except Exception as e:
+            logger.error(f"Ошибка обработки {self.path}: {e}")
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR,
+                       {"error": f"{type(e).__name__}: {e}"})
+            return
+        if ok:
+            self._send(HTTPStatus.OK, result)
+        else:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": result})
+
+
+def make_server(host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                workers: Optional[int] = None) -> ThreadingHTTPServer:
+    """A server bound to (host, port); its `service` holds the pool.
+
+    Call `server.service.close()` after `server.server_close()`.
+    """
+    service = SimulationService(workers)
+    handler = type("BoundServiceHandler", (ServiceHandler,),
+                   {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Локальный HTTP-сервис расчета ходов")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Количество процессов (по умолчанию - по CPU)")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    server = make_server(args.host, args.port, args.workers)
+    host, port = server.server_address[:2]
+    print(f"Сервис запущен: http://{host}:{port} "
+          f"({server.service.workers} процессов)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Остановка сервиса")
+    finally:
+        server.server_close()
+        server.service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -48,7 +48,11 @@ class SkipMoveRules(ABC):
         """Compute tax income for this mode (already includes all modifiers)."""
 
     def postprocess_trade_income(self, ctx: SkipMoveContext) -> None:
-        """Optional: mutate ctx.economy.trade_income / branches_income."""
+        """Optional: mutate ctx.economy.trade_income / branches_income.
+
+        Multipliers should go through `ctx.ledger.apply`, so that they show
+        up in the report.
+        """
 
     def postprocess_agriculture(self, ctx: SkipMoveContext) -> None:
         """Optional: apply mode-specific agriculture tweaks."""
@@ -125,21 +129,17 @@ class BasicSkipMoveRules(SkipMoveRules):
         )
 
         modifiers = [
-            results.contentment_coefficient_2,
-            (1 - results.logistic_params.tax_income_coefficient),
-            ctx.in_move.calculate_integrity_of_faith_factor(
-                ctx.inner_politics.integrity_of_faith),
-            ctx.in_move.calculate_income_coefficient_based_on_panic_level(
-                ctx.inner_politics.panic_level),
-            ctx.in_move.calculate_overproduction_tax_spotter(
-                ctx.industry.overproduction_coefficient),
+            ("contentment", results.contentment_coefficient_2),
+            ("logistic", 1 - results.logistic_params.tax_income_coefficient),
+            ("integrity_of_faith", ctx.in_move.calculate_integrity_of_faith_factor(
+                ctx.inner_politics.integrity_of_faith)),
+            ("panic_level", ctx.in_move.calculate_income_coefficient_based_on_panic_level(
+                ctx.inner_politics.panic_level)),
+            ("overproduction", ctx.in_move.calculate_overproduction_tax_spotter(
+                ctx.industry.overproduction_coefficient)),
         ]
 
-        tax_income = base_tax_income
-        for m in modifiers:
-            tax_income *= m
-
-        return tax_income
+        return ctx.ledger.apply("tax_income", base_tax_income, modifiers)
 
 
 class AtteriumSkipMoveRules(BasicSkipMoveRules):
@@ -196,24 +196,21 @@ class AtteriumSkipMoveRules(BasicSkipMoveRules):
             ctx.economy.plan_efficiency, large_entities)
 
         modifiers = [
-            results.contentment_coefficient_2,
-            (1 - results.logistic_params.tax_income_coefficient),
-            ctx.in_move.calculate_integrity_of_faith_factor(
-                ctx.inner_politics.integrity_of_faith),
-            ctx.in_move.calculate_income_coefficient_based_on_panic_level(
-                ctx.inner_politics.panic_level),
-            ctx.in_move.calculate_huge_economy_buff(
-                ctx.inner_politics.egocentrism_development),
-            income_spotter_adrian,
-            ctx.in_move.calculate_overproduction_tax_spotter(
-                ctx.industry.overproduction_coefficient),
+            ("contentment", results.contentment_coefficient_2),
+            ("logistic", 1 - results.logistic_params.tax_income_coefficient),
+            ("integrity_of_faith", ctx.in_move.calculate_integrity_of_faith_factor(
+                ctx.inner_politics.integrity_of_faith)),
+            ("panic_level", ctx.in_move.calculate_income_coefficient_based_on_panic_level(
+                ctx.inner_politics.panic_level)),
+            ("huge_economy", ctx.in_move.calculate_huge_economy_buff(
+                ctx.inner_politics.egocentrism_development)),
+            ("adrian_effect", income_spotter_adrian),
+            ("overproduction", ctx.in_move.calculate_overproduction_tax_spotter(
+                ctx.industry.overproduction_coefficient)),
         ]
 
-        tax_income = base_tax_income + plan_efficiency_income
-        for m in modifiers:
-            tax_income *= m
-
-        return tax_income
+        return ctx.ledger.apply(
+            "tax_income", base_tax_income + plan_efficiency_income, modifiers)
 
     def postprocess_trade_income(self, ctx: SkipMoveContext) -> None:
         # Adrian + Power of economic formation
@@ -223,8 +220,13 @@ class AtteriumSkipMoveRules(BasicSkipMoveRules):
             ctx.economy.power_of_economic_formation
         )
 
-        ctx.economy.trade_income *= trade_spotter_adrian * trade_spotter_power
-        ctx.economy.branches_income *= branches_spotter_power
+        ctx.economy.trade_income = ctx.ledger.apply(
+            "trade_income", ctx.economy.trade_income,
+            [("adrian_effect_and_formation",
+              trade_spotter_adrian * trade_spotter_power)])
+        ctx.economy.branches_income = ctx.ledger.apply(
+            "branches_income", ctx.economy.branches_income,
+            [("economic_formation", branches_spotter_power)])
 
 
 class IsfSkipMoveRules(BasicSkipMoveRules):
@@ -317,21 +319,17 @@ class IsfSkipMoveRules(BasicSkipMoveRules):
         )
 
         modifiers = [
-            results.contentment_coefficient_2,
-            (1 - results.logistic_params.tax_income_coefficient),
-            ctx.in_move.calculate_integrity_of_faith_factor(
-                ctx.inner_politics.integrity_of_faith),
-            ctx.in_move.calculate_income_coefficient_based_on_panic_level(
-                ctx.inner_politics.panic_level),
-            ctx.in_move.calculate_overproduction_tax_spotter(
-                ctx.industry.overproduction_coefficient),
+            ("contentment", results.contentment_coefficient_2),
+            ("logistic", 1 - results.logistic_params.tax_income_coefficient),
+            ("integrity_of_faith", ctx.in_move.calculate_integrity_of_faith_factor(
+                ctx.inner_politics.integrity_of_faith)),
+            ("panic_level", ctx.in_move.calculate_income_coefficient_based_on_panic_level(
+                ctx.inner_politics.panic_level)),
+            ("overproduction", ctx.in_move.calculate_overproduction_tax_spotter(
+                ctx.industry.overproduction_coefficient)),
         ]
 
-        tax_income = base_tax_income
-        for m in modifiers:
-            tax_income *= m
-
-        return tax_income
+        return ctx.ledger.apply("tax_income", base_tax_income, modifiers)
 
     def postprocess_agriculture(self, ctx: SkipMoveContext) -> None:
         # ISF-specific debuff
@@ -9,8 +9,8 @@ This module is intentionally dependency-light to avoid circular imports.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, Tuple
 
 
 @dataclass
@@ -36,6 +36,37 @@ class CalculationResults:
     real_food_security: float | None = None
 
 
+@dataclass(frozen=True)
+class IncomeFactor:
+    """One multiplier applied to an income value during a turn."""
+
+    target: str
+    name: str
+    value: float
+
+
+@dataclass
+class TurnLedger:
+    """Intermediate values of one turn, each computed once.
+
+    The engine fills the wastes on first use; `income_factors` lists every
+    multiplier applied to an income value, in the order of application.
+    """
+
+    logistic_wastes: Optional[float] = None
+    total_wastes: Optional[float] = None
+    income_factors: list[IncomeFactor] = field(default_factory=list)
+
+    def apply(self, target: str, value: float,
+              factors: Iterable[Tuple[str, float]]) -> float:
+        """Multiplies `value` by each named factor and records them."""
+        for name, factor in factors:
+            self.income_factors.append(
+                IncomeFactor(target, name, float(factor)))
+            value *= factor
+        return value
+
+
 @dataclass
 class SkipMoveContext:
     """A lightweight bag of references for rules implementations."""
@@ -46,6 +77,14 @@ class SkipMoveContext:
     inner_politics: Any
     waste: float
     in_move: Any
+    ledger: TurnLedger = field(default_factory=TurnLedger)
+
+
+@dataclass(frozen=True)
+class CreditRequest:
+    """Yielded by a turn whose budget ends negative: the player decides."""
+
+    deficit: float
 
 
 @dataclass
@@ -80,3 +119,5 @@ class SkipMoveReport:
     credit_taken: bool = False
     credit_amount: float = 0.0
     budget_final: Optional[float] = None
+
+    income_factors: Tuple[IncomeFactor, ...] = ()
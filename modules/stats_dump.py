@@ -0,0 +1,157 @@
+"""Streaming reader for files with many countries' stats.
+
+A dump is a sequence of country blocks in the ``InputSection`` format::
+
+    === СТРАНА: Примерия ===        (optional)
+    === ЭКОНОМИКА ===
+    ```
+    ...
+    ```
+    === ПРОМЫШЛЕННОСТЬ ===
+    ...
+
+A new block starts at a country header or when a section header repeats
+within the current block, so unnamed blocks simply follow one another. The
+file is read line by line and only the current block is kept in memory. A
+block that fails to parse yields a record with the error and the stream goes
+on.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from functions.rng import resolve_rng, spawn_rngs
+from modules.mode_spec import GameMode, ModeRegistry
+from modules.run_start_skip import GameStats, InputSection, \
+    parse_skipper_sections
+from utils.logger_manager import get_logger
+
+
+logger = get_logger("Stats Dump")
+
+_COUNTRY_RE = re.compile(
+    "^" + re.escape(InputSection.COUNTRY).replace(
+        re.escape("{name}"), "(?P<name>.+?)") + "$")
+
+
+@dataclass
+class DumpBlock:
+    """Raw sections of one country, `line` is 1-based."""
+
+    index: int
+    line: int
+    name: Optional[str]
+    sections: Dict[str, str]
+    stray_line: Optional[str] = None
+
+
+@dataclass
+class DumpRecord:
+    """One country of a dump: stats or the reason it was skipped."""
+
+    index: int
+    line: int
+    name: Optional[str]
+    stats: Optional[GameStats] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _BlockBuilder:
+    def __init__(self, index: int, line: int, name: Optional[str] = None):
+        self.index = index
+        self.line = line
+        self.name = name
+        self.lines: Dict[str, List[str]] = {}
+        self.current: Optional[str] = None
+        self.stray_line: Optional[str] = None
+
+    def is_empty(self) -> bool:
+        return not self.lines and self.stray_line is None
+
+    def build(self) -> DumpBlock:
+        sections = {key: '\n'.join(self.lines.get(key, ())).strip()
+                    for key in InputSection.SKIPPER_SECTIONS}
+        return DumpBlock(index=self.index, line=self.line, name=self.name,
+                         sections=sections, stray_line=self.stray_line)
+
+
+def iter_blocks(lines: Iterable[str]) -> Iterator[DumpBlock]:
+    """Splits dump lines into country blocks without parsing the stats."""
+    keys_by_header = {header: key for key, header in
+                      InputSection.SKIPPER_SECTIONS.items()}
+    block = _BlockBuilder(index=0, line=1)
+
+    for line_number, raw_line in enumerate(lines, start=1):
+        line = raw_line.strip()
+        country = _COUNTRY_RE.match(line)
+        key = keys_by_header.get(line)
+
+        if country is not None or (key is not None and key in block.lines):
+            if not block.is_empty() or block.name is not None:
+                yield block.build()
+                block = _BlockBuilder(index=block.index + 1, line=line_number)
+            block.line = line_number
+            if country is not None:
+                block.name = country.group('name').strip()
+                continue
+
+        if key is not None:
+            block.current = key
+            block.lines[key] = []
+        elif block.current is not None:
+            block.lines[block.current].append(raw_line.rstrip('\n'))
+        elif line and line != "```" and block.stray_line is None:
+            block.stray_line = line
+
+    if not block.is_empty() or block.name is not None:
+        yield block.build()
+
+
+def iter_dump(
+        lines: Iterable[str],
+        mode: GameMode = GameMode.BASIC,
+        rng: Optional[np.random.Generator] = None,
+) -> Iterator[DumpRecord]:
+    """Parses every block of a dump into `GameStats` of the chosen mode.
+
+    Each block gets its own child stream of `rng`, so a broken block does not
+    change the random draws of the following ones.
+    """
+    config = ModeRegistry.get(mode).stats_config
+    rng = resolve_rng(rng)
+
+    for block in iter_blocks(lines):
+        block_rng = spawn_rngs(rng, 1)[0]
+        record = DumpRecord(index=block.index, line=block.line,
+                            name=block.name)
+        try:
+            if block.stray_line is not None:
+                raise ValueError(f"Текст до первого заголовка секции: "
+                                 f"{block.stray_line!r}")
+            record.stats = parse_skipper_sections(config, block.sections,
+                                                  rng=block_rng)
+        except Exception as e:
+            record.error = f"{type(e).__name__}: {e}"
+            logger.error(f"Блок {block.index} (строка {block.line}) "
+                         f"не разобран: {e}")
+        yield record
+
+
+def read_dump(
+        path: Union[str, Path],
+        mode: GameMode = GameMode.BASIC,
+        rng: Optional[np.random.Generator] = None,
+) -> Iterator[DumpRecord]:
+    """`iter_dump` over a file that is read lazily."""
+    with open(path, encoding="utf-8") as file:
+        yield from iter_dump(file, mode, rng)
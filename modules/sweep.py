@@ -0,0 +1,367 @@
+"""Parameter sweeps: one skip-move turn per point of a field grid.
+
+:func:`run_sweep` takes base stats, a mode and one or more :class:`SweepAxis`
+grids (``universal_tax``, ``Economy.gov_wastes[2]``...). It plays a turn for
+every point of their Cartesian product and returns a tidy
+:class:`SweepResult`: one row per point, the swept inputs followed by every
+numeric :class:`SkipMoveReport` field. From the command line::
+
+    python -m modules.sweep --input country.txt --grid universal_tax=10:30:0.5 \\
+        --grid "med_wastes[0]=50,100,150" --output sweep.csv
+
+Points are evaluated in chunks of ``chunk_size`` in a process pool. Chunk
+``i`` is seeded with the ``i``-th child of ``SeedSequence(seed)``, so the
+table depends on the seed and the chunk size, never on the number of
+workers. Credit is never taken.
+
+Evaluators
+----------
+``batch``
+    :class:`BatchSkipMove`, one vectorized turn per chunk. Base mode only;
+    random steps match the scalar engine in distribution, not draw by draw.
+``engine``
+    :class:`BasicSkipMove` with the mode's functions and rules, point by
+    point. Works for every mode.
+``auto``
+    The fastest evaluator the mode supports.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO
+
+import numpy as np
+
+from modules.batch_skip_move import BatchSkipMove
+from modules.credit_policy import NeverCredit
+from modules.ensemble import numeric_report_fields
+from modules.mode_spec import GameMode, ModeRegistry
+from modules.run_skip_move import BasicSkipMove
+from modules.run_start_skip import GameStats, InputSection, \
+    parse_skipper_sections
+from modules.skip_move_types import SkipMoveReport
+from utils.logger_manager import get_logger
+from utils.user_io import HeadlessIO
+
+
+logger = get_logger("Sweep")
+
+DOMAINS = ("Economy", "Industry", "Agriculture", "InnerPolitics")
+DEFAULT_CHUNK_SIZE = 512
+
+_PATH_PATTERN = re.compile(
+    r"^(?:(?P<domain>\w+)\.)?(?P<field>\w+)(?:\[(?P<index>\d+)\])?$")
+
+
+class SweepEvaluator(StrEnum):
+    AUTO = "auto"
+    BATCH = "batch"
+    ENGINE = "engine"
+
+
+@dataclass(frozen=True)
+class SweepAxis:
+    """Values of one field; `index` selects an item of a list field."""
+
+    field: str
+    values: tuple[float, ...]
+    domain: Optional[str] = None
+    index: Optional[int] = None
+
+    @property
+    def name(self) -> str:
+        name = self.field if self.index is None else f"{self.field}[{self.index}]"
+        return name if self.domain is None else f"{self.domain}.{name}"
+
+    @classmethod
+    def parse(cls, spec: str) -> SweepAxis:
+        """``path=start:stop:step`` (stop included) or ``path=v1,v2,...``."""
+        path, sep, grid = spec.partition("=")
+        if not sep:
+            raise ValueError(
+                f"Ожидается 'поле=начало:конец:шаг' или 'поле=a,b,c', получено: {spec!r}")
+        domain, field, index = parse_path(path)
+        return cls(field=field, values=parse_grid(grid), domain=domain,
+                   index=index)
+
+
+def parse_path(path: str) -> tuple[Optional[str], str, Optional[int]]:
+    """``Domain.field[index]`` -> (domain, field, index); domain and index
+    are optional."""
+    match = _PATH_PATTERN.match(path.strip())
+    if match is None:
+        raise ValueError(f"Некорректное имя поля: {path!r}")
+    index = match["index"]
+    return match["domain"], match["field"], None if index is None else int(index)
+
+
+def parse_grid(grid: str) -> tuple[float, ...]:
+    grid = grid.strip()
+    try:
+        if ":" in grid:
+            start, stop, step = (float(part) for part in grid.split(":"))
+            if step <= 0 or stop < start:
+                raise ValueError
+            count = int(np.floor((stop - start) / step + 1e-9)) + 1
+            return tuple(float(v) for v in np.round(
+                start + step * np.arange(count), 12))
+        values = tuple(float(part) for part in grid.split(","))
+    except ValueError:
+        raise ValueError(f"Некорректная сетка значений: {grid!r}") from None
+    if not values:
+        raise ValueError(f"Некорректная сетка значений: {grid!r}")
+    return values
+
+
+@dataclass
+class SweepResult:
+    """Tidy table: one column per swept field, then per report field."""
+
+    mode: str
+    evaluator: str
+    axes: tuple[str, ...]
+    columns: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.columns[self.axes[0]])
+
+    def rows(self) -> Iterator[Dict[str, float]]:
+        names = list(self.columns)
+        for values in zip(*(self.columns[name].tolist() for name in names)):
+            yield dict(zip(names, values))
+
+    def write_csv(self, stream: TextIO) -> None:
+        writer = csv.writer(stream)
+        writer.writerow(self.columns)
+        writer.writerows(zip(*(self.columns[name].tolist()
+                               for name in self.columns)))
+
+
+def resolve_axes(mode: GameMode, stats: GameStats,
+                 axes: Sequence[SweepAxis]) -> List[SweepAxis]:
+    """Fills in the domain of every axis and checks fields and indices."""
+    resolved = []
+    for axis in axes:
+        domains = [axis.domain] if axis.domain else [
+            domain for domain in DOMAINS
+            if axis.field in type(getattr(stats, domain)).model_fields]
+        if axis.domain and axis.domain not in DOMAINS:
+            raise ValueError(f"Неизвестный раздел: {axis.domain}")
+        if not domains or axis.field not in type(
+                getattr(stats, domains[0])).model_fields:
+            raise ValueError(f"Поле {axis.name} не найдено в режиме {mode.value}")
+        if len(domains) > 1:
+            raise ValueError(
+                f"Поле {axis.field} есть в разделах {', '.join(domains)}; "
+                f"укажите раздел, например {domains[0]}.{axis.field}")
+
+        value = getattr(getattr(stats, domains[0]), axis.field)
+        if axis.index is not None:
+            if not isinstance(value, list) or axis.index >= len(value):
+                raise ValueError(f"Поле {axis.name} не является списком такой длины")
+        elif isinstance(value, list):
+            raise ValueError(f"Поле {axis.field} - список, укажите элемент: "
+                             f"{axis.field}[0]")
+        resolved.append(SweepAxis(field=axis.field, values=axis.values,
+                                  domain=domains[0], index=axis.index))
+    names = [axis.name for axis in resolved]
+    if len(set(names)) != len(names):
+        raise ValueError("Одно и то же поле указано в нескольких сетках")
+    return resolved
+
+
+def pick_evaluator(mode: GameMode,
+                   evaluator: SweepEvaluator = SweepEvaluator.AUTO) -> SweepEvaluator:
+    evaluator = SweepEvaluator(evaluator)
+    batch_ok = mode is GameMode.BASIC
+    if evaluator is SweepEvaluator.AUTO:
+        return SweepEvaluator.BATCH if batch_ok else SweepEvaluator.ENGINE
+    if evaluator is SweepEvaluator.BATCH and not batch_ok:
+        raise ValueError(
+            f"Пакетный расчет поддерживает только режим {GameMode.BASIC.value}")
+    return evaluator
+
+
+def point_stats(mode: GameMode, base: Dict[str, Dict[str, Any]],
+                 axes: Sequence[SweepAxis], point: Sequence[float],
+                 rng: np.random.Generator) -> GameStats:
+    """Base stats with the point applied; derived fields follow the inputs."""
+    config = ModeRegistry.get(mode).stats_config
+    classes = {
+        "Economy": config.economy_class,
+        "Industry": config.industry_class,
+        "Agriculture": config.agriculture_class,
+        "InnerPolitics": config.inner_politics_class,
+    }
+    data = {domain: dict(values) for domain, values in base.items()}
+    pinned: Dict[str, Dict[str, float]] = {domain: {} for domain in DOMAINS}
+    for axis, value in zip(axes, point):
+        values = data[axis.domain]
+        if isinstance(values[axis.field], int) and not isinstance(
+                values[axis.field], bool):
+            if not float(value).is_integer():
+                raise ValueError(f"Поле {axis.name} целочисленное: {value}")
+            value = int(value)
+        if axis.index is not None:
+            items = values[axis.field] = list(values[axis.field])
+            items[axis.index] = value
+        elif axis.field in classes[axis.domain]._get_derived_graph().producers:
+            pinned[axis.domain][axis.field] = value
+        else:
+            values[axis.field] = value
+
+    models = {}
+    for domain in DOMAINS:
+        model = classes[domain].from_trusted(data[domain], rng=rng)
+        for name, value in pinned[domain].items():
+            setattr(model, name, value)
+        models[domain] = model
+    return GameStats(**models)
+
+
+def run_turn(mode: GameMode, stats: GameStats, rng: np.random.Generator,
+             waste: float = 0.0) -> SkipMoveReport:
+    """Plays one turn on `stats` in place with the mode's engine; no credit."""
+    spec = ModeRegistry.get(mode)
+    engine = BasicSkipMove(
+        Economy=stats.Economy,
+        Industry=stats.Industry,
+        Agriculture=stats.Agriculture,
+        InnerPolitics=stats.InnerPolitics,
+        waste=waste,
+        InMoveFunctions=spec.in_move_functions_factory(),
+        Rules=spec.rules_factory(),
+        io=HeadlessIO(),
+        rng=rng,
+        credit_policy=NeverCredit(),
+        mode_name=spec.mode.value,
+    )
+    return engine.run()
+
+
+def _evaluate_chunk(task: tuple) -> Dict[str, np.ndarray]:
+    mode, evaluator, base, axes, points, seed, waste = task
+    rng = np.random.default_rng(seed)
+    stats = [point_stats(mode, base, axes, point, rng) for point in points]
+    names = numeric_report_fields()
+
+    if evaluator is SweepEvaluator.BATCH:
+        report = BatchSkipMove.from_stats(stats, rng=rng, waste=waste).run()
+        return {name: np.asarray(getattr(report, name), dtype=float)
+                for name in names}
+
+    reports = [run_turn(mode, point, rng, waste) for point in stats]
+    return {name: np.array([float(getattr(report, name) or 0.0)
+                            for report in reports])
+            for name in names}
+
+
+def run_sweep(
+        stats: GameStats,
+        axes: Sequence[SweepAxis],
+        *,
+        mode: GameMode = GameMode.BASIC,
+        evaluator: SweepEvaluator = SweepEvaluator.AUTO,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        waste: float = 0.0,
+) -> SweepResult:
+    """Plays one turn per grid point on copies of `stats`.
+
+    `workers=1` runs inline; otherwise chunks are spread over a process
+    pool (`None` means one process per CPU).
+    """
+    if not axes:
+        raise ValueError("Нужна хотя бы одна сетка значений")
+    if chunk_size < 1:
+        raise ValueError("Размер блока должен быть положительным")
+    axes = resolve_axes(mode, stats, axes)
+    evaluator = pick_evaluator(mode, evaluator)
+
+    points = list(itertools.product(*(axis.values for axis in axes)))
+    chunks = [points[start:start + chunk_size]
+              for start in range(0, len(points), chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    base = {domain: getattr(stats, domain).model_dump() for domain in DOMAINS}
+    tasks = [(mode, evaluator, base, axes, chunk, child, waste)
+             for chunk, child in zip(chunks, seeds)]
+    logger.info(f"Перебор: {len(points)} точек, {len(chunks)} блоков, "
+                f"режим {mode.value}, расчет {evaluator.value}")
+
+    if workers == 1 or len(tasks) == 1:
+        outputs = [_evaluate_chunk(task) for task in tasks]
+    else:
+        pool_size = min(workers or os.cpu_count() or 1, len(tasks))
+        with ProcessPoolExecutor(max_workers=pool_size) as pool:
+            outputs = list(pool.map(_evaluate_chunk, tasks))
+
+    grid = np.array(points, dtype=float).reshape(len(points), len(axes))
+    columns = {axis.name: grid[:, i] for i, axis in enumerate(axes)}
+    for name in numeric_report_fields():
+        columns[name] = np.concatenate([output[name] for output in outputs])
+    return SweepResult(mode=mode.value, evaluator=evaluator.value,
+                       axes=tuple(axis.name for axis in axes), columns=columns)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Перебор значений полей с пропуском хода в каждой точке")
+    parser.add_argument("--mode", type=GameMode, choices=list(GameMode),
+                        default=GameMode.BASIC)
+    parser.add_argument("--input", required=True, type=Path,
+                        help="Файл со статами страны")
+    parser.add_argument("--grid", required=True, action="append",
+                        type=SweepAxis.parse,
+                        help="поле=начало:конец:шаг или поле=a,b,c; "
+                             "элемент списка - поле[0]")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="CSV-файл (по умолчанию - стандартный вывод)")
+    parser.add_argument("--evaluator", type=SweepEvaluator,
+                        choices=list(SweepEvaluator),
+                        default=SweepEvaluator.AUTO)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Количество процессов (по умолчанию - по CPU)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--seed", type=int, default=None)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    spec = ModeRegistry.get(args.mode)
+    stats = parse_skipper_sections(
+        spec.stats_config,
+        InputSection.split_text(args.input.read_text(encoding="utf-8")),
+        rng=np.random.default_rng(args.seed))
+    try:
+        result = run_sweep(stats, args.grid, mode=args.mode,
+                           evaluator=args.evaluator, seed=args.seed,
+                           workers=args.workers, chunk_size=args.chunk_size)
+    except ValueError as e:
+        print(f"Ошибка: {e}")
+        return 1
+
+    if args.output is None:
+        result.write_csv(sys.stdout)
+    else:
+        with args.output.open("w", encoding="utf-8", newline="") as stream:
+            result.write_csv(stream)
+        print(f"Точек: {len(result)}, расчет {result.evaluator}, "
+              f"таблица - {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""Thread-pool runner for independent skip-move games.
+
+:func:`run_games` plays several games, one per stats snapshot, for a number
+of consecutive turns. Every game gets a private copy of its stats, its own
+engine and its own generator (the ``i``-th child of
+``SeedSequence(master_seed)``), so games share no mutable state and the
+result does not depend on the backend or on the number of workers.
+
+Threads avoid pickling the stats and starting processes, but on a standard
+CPython build the GIL keeps the turns from running in parallel; on a
+free-threaded build (3.13t and later) they scale with the cores. The process
+backend is kept for comparison (see ``benchmarks/bench_threads.py``)::
+
+    python -m modules.thread_runner --input stats.txt --games 64 --turns 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, \
+    ThreadPoolExecutor
+from enum import StrEnum
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from functions.industry_models import IndustryEstimator, use_industry_estimator
+from modules.ensemble import replica_engine, replica_seeds
+from modules.mode_spec import GameMode, ModeRegistry
+from modules.run_start_skip import GameStats, InputSection, \
+    parse_skipper_sections
+from modules.skip_move_types import SkipMoveReport
+from utils.logger_manager import get_logger
+
+
+logger = get_logger("ThreadRunner")
+
+
+class RunnerBackend(StrEnum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+def gil_enabled() -> bool:
+    """False only on a free-threaded build running without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def play_game(
+        mode: GameMode,
+        stats: GameStats,
+        seed: int,
+        turns: int = 1,
+        waste: float = 0.0,
+        industry_estimator: IndustryEstimator = IndustryEstimator.NUMPY,
+) -> List[SkipMoveReport]:
+    """Plays `turns` turns on a copy of `stats` with a fixed seed."""
+    with use_industry_estimator(industry_estimator):
+        engine = replica_engine(mode, stats, np.random.default_rng(seed),
+                                waste)
+        return list(engine.simulate(turns))
+
+
+def _play_game_task(task: tuple) -> List[SkipMoveReport]:
+    return play_game(*task)
+
+
+def _executor(backend: RunnerBackend, workers: int) -> Executor:
+    if backend is RunnerBackend.THREAD:
+        return ThreadPoolExecutor(max_workers=workers,
+                                  thread_name_prefix="skip-move")
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def run_games(
+        stats: Sequence[GameStats],
+        *,
+        mode: GameMode = GameMode.BASIC,
+        turns: int = 1,
+        master_seed: int = 0,
+        workers: Optional[int] = None,
+        backend: RunnerBackend = RunnerBackend.THREAD,
+        waste: float = 0.0,
+        industry_estimator: IndustryEstimator = IndustryEstimator.NUMPY,
+) -> List[List[SkipMoveReport]]:
+    """Reports of every turn of every game, in the order of `stats`.
+
+    `workers=1` runs inline; otherwise games are spread over a pool of
+    `backend` (`None` means one worker per CPU). The caller's stats are never
+    touched.
+    """
+    if turns < 0:
+        raise ValueError("Количество ходов не может быть отрицательным")
+    backend = RunnerBackend(backend)
+
+    tasks = [(mode, game, seed, turns, waste, industry_estimator)
+             for game, seed in zip(stats,
+                                   replica_seeds(master_seed, len(stats)))]
+    logger.info(f"Запуск {len(tasks)} игр по {turns} ходов, "
+                f"режим {mode.value}, {backend.value}")
+
+    if workers == 1 or not tasks:
+        return [_play_game_task(task) for task in tasks]
+
+    pool_size = workers or os.cpu_count() or 1
+    chunksize = 1 if backend is RunnerBackend.THREAD else max(
+        1, len(tasks) // (4 * pool_size))
+    with _executor(backend, pool_size) as pool:
+        return list(pool.map(_play_game_task, tasks, chunksize=chunksize))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Несколько независимых игр в пуле потоков")
+    parser.add_argument("--mode", type=GameMode, choices=list(GameMode),
+                        default=GameMode.BASIC)
+    parser.add_argument("--input", type=Path, required=True,
+                        help="Файл со статистикой в формате InputSection")
+    parser.add_argument("--games", type=int, default=16)
+    parser.add_argument("--turns", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Количество потоков (по умолчанию - по CPU)")
+    parser.add_argument("--backend", type=RunnerBackend,
+                        choices=list(RunnerBackend),
+                        default=RunnerBackend.THREAD)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    spec = ModeRegistry.get(args.mode)
+    stats = parse_skipper_sections(
+        spec.stats_config,
+        InputSection.split_text(args.input.read_text(encoding="utf-8")),
+        rng=np.random.default_rng(args.seed))
+
+    try:
+        if args.games < 1:
+            raise ValueError("Количество игр должно быть положительным")
+        games = run_games([stats] * args.games, mode=args.mode,
+                          turns=args.turns, master_seed=args.seed,
+                          workers=args.workers, backend=args.backend)
+    except ValueError as e:
+        print(f"Ошибка: {e}")
+        return 1
+
+    budgets = np.array([reports[-1].budget_final if reports
+                        else stats.Economy.current_budget
+                        for reports in games])
+    print(f"Игр: {len(games)}, ходов: {args.turns}, "
+          f"GIL: {'включен' if gil_enabled() else 'выключен'}")
+    print(f"Бюджет после последнего хода: медиана {np.median(budgets):.2f}, "
+          f"от {budgets.min():.2f} до {budgets.max():.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
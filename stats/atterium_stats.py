@@ -7,8 +7,9 @@ from stats.basic_stats import IndustrialStats, AgricultureStats
 from stats.stats_base import StatsBase
 from stats.pretty_layouts import get_layout_for_class
 from stats.derived_fields import (
-    populate_basic_economy,
-    populate_atterium_inner_politics,
+    ATTERIUM_INNER_POLITICS,
+    BASIC_ECONOMY,
+    DerivedFields,
 )
 
 
@@ -58,8 +59,10 @@ class AtteriumEconomyStats(StatsBase):
                 f"Сумма товаров разных качеств должна быть равна 100, а на деле - {goods_percent}")
         return self
 
-    def recalculate_derived_fields(self) -> None:
-        populate_basic_economy(self)
+    @staticmethod
+    @override
+    def _get_derived_fields() -> tuple[DerivedFields, ...]:
+        return BASIC_ECONOMY
 
     def trade_usage_load(self) -> int:
         if not self.trade_potential:
@@ -153,8 +156,10 @@ class AtteriumInnerPoliticsStats(StatsBase):
     success_chance: float | None = None
     society_decline: float | None = None
 
-    def recalculate_derived_fields(self) -> None:
-        populate_atterium_inner_politics(self)
+    @staticmethod
+    @override
+    def _get_derived_fields() -> tuple[DerivedFields, ...]:
+        return ATTERIUM_INNER_POLITICS
 
     @override
     def debug(self):
@@ -4,9 +4,10 @@ import pydantic
 from typing_extensions import override
 
 from stats.derived_fields import (
-    populate_basic_economy,
-    populate_basic_industry,
-    populate_basic_inner_politics,
+    BASIC_ECONOMY,
+    BASIC_INDUSTRY,
+    BASIC_INNER_POLITICS,
+    DerivedFields,
 )
 from stats.pretty_layouts import get_layout_for_class
 from stats.stats_base import StatsBase
@@ -57,8 +58,10 @@ class EconomyStats(StatsBase):
 
         return self
 
-    def recalculate_derived_fields(self) -> None:
-        populate_basic_economy(self)
+    @staticmethod
+    @override
+    def _get_derived_fields() -> tuple[DerivedFields, ...]:
+        return BASIC_ECONOMY
 
     def trade_usage_load(self) -> int:
         if not self.trade_potential:
@@ -111,8 +114,10 @@ class IndustrialStats(StatsBase):
     max_potential: float | None = None
     expected_wastes: float | None = None
 
-    def recalculate_derived_fields(self) -> None:
-        populate_basic_industry(self)
+    @staticmethod
+    @override
+    def _get_derived_fields() -> tuple[DerivedFields, ...]:
+        return BASIC_INDUSTRY
 
     @override
     def debug(self):
@@ -201,8 +206,10 @@ class InnerPoliticsStats(StatsBase):
     success_chance: float | None = None
     society_decline: float | None = None
 
-    def recalculate_derived_fields(self) -> None:
-        populate_basic_inner_politics(self)
+    @staticmethod
+    @override
+    def _get_derived_fields() -> tuple[DerivedFields, ...]:
+        return BASIC_INNER_POLITICS
 
     @override
     def debug(self):
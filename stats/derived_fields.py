@@ -1,94 +1,216 @@
+"""Derived stats fields and the dependencies between them.
+
+Every derived value is declared as a :class:`DerivedFields` node: the fields
+it writes, the fields it reads (plain or other derived fields) and a
+`compute` callable. A stats class lists its nodes in `_get_derived_fields`,
+and :class:`DerivedGraph` orders them so that a change of one input recomputes
+only the nodes downstream of it.
+"""
+
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
 from functions.atterium_stats_functions import AtteriumStatsFunctions
 from functions.basic_stats_functions import BasicStatsFunctions
 from functions.isf_stats_functions import IsfStatsFunctions
 
 
-def populate_basic_economy(stats) -> None:
-    stats.income = round(
-        BasicStatsFunctions.calculate_population_growth(stats.population_count)
-    )
-    stats.trade_potential = BasicStatsFunctions.calculate_trade_potential(
+ComputeFunc = Callable[[object, Optional[np.random.Generator]], tuple]
+
+
+@dataclass(frozen=True)
+class DerivedFields:
+    """Fields computed together by `compute` from the `inputs` fields.
+
+    `compute(stats, rng)` returns the values in the order of `outputs`.
+    """
+
+    outputs: tuple[str, ...]
+    inputs: tuple[str, ...]
+    compute: ComputeFunc
+
+
+class DerivedGraph:
+    """Derived field nodes of one stats class, ordered by dependencies."""
+
+    def __init__(self, nodes: Sequence[DerivedFields]):
+        self.producers: Dict[str, DerivedFields] = {}
+        for node in nodes:
+            for name in node.outputs:
+                if name in self.producers:
+                    raise ValueError(
+                        f"Производное поле {name} объявлено дважды")
+                self.producers[name] = node
+
+        self._consumers: Dict[str, list[DerivedFields]] = {}
+        for node in nodes:
+            for name in node.inputs:
+                self._consumers.setdefault(name, []).append(node)
+
+        self.nodes = self._sorted(nodes)
+        self._order = {node: position for position, node in
+                       enumerate(self.nodes)}
+        self._downstream: Dict[frozenset, tuple[DerivedFields, ...]] = {}
+
+    def _sorted(self, nodes: Sequence[DerivedFields]
+                ) -> tuple[DerivedFields, ...]:
+        ordered: list[DerivedFields] = []
+        state: Dict[DerivedFields, bool] = {}  # False - in progress
+
+        def visit(node: DerivedFields) -> None:
+            if state.get(node) is True:
+                return
+            if state.get(node) is False:
+                raise ValueError(
+                    f"Циклическая зависимость производных полей: "
+                    f"{', '.join(node.outputs)}")
+            state[node] = False
+            for name in node.inputs:
+                producer = self.producers.get(name)
+                if producer is not None:
+                    visit(producer)
+            state[node] = True
+            ordered.append(node)
+
+        for node in nodes:
+            visit(node)
+        return tuple(ordered)
+
+    def downstream(self, changed: Iterable[str]) -> tuple[DerivedFields, ...]:
+        """Nodes that read any of `changed`, directly or transitively."""
+        key = frozenset(changed)
+        cached = self._downstream.get(key)
+        if cached is not None:
+            return cached
+
+        found: set[DerivedFields] = set()
+        pending = list(key)
+        while pending:
+            for node in self._consumers.get(pending.pop(), ()):
+                if node not in found:
+                    found.add(node)
+                    pending.extend(node.outputs)
+
+        result = self._downstream[key] = tuple(
+            sorted(found, key=self._order.__getitem__))
+        return result
+
+    def outputs(self, nodes: Iterable[DerivedFields]) -> tuple[str, ...]:
+        return tuple(name for node in nodes for name in node.outputs)
+
+
+INCOME = DerivedFields(
+    outputs=("income",),
+    inputs=("population_count",),
+    compute=lambda stats, rng: (round(
+        BasicStatsFunctions.calculate_population_growth(
+            stats.population_count)),),
+)
+
+TRADE_POTENTIAL = DerivedFields(
+    outputs=("trade_potential",),
+    inputs=("trade_rank", "trade_efficiency"),
+    compute=lambda stats, rng: (BasicStatsFunctions.calculate_trade_potential(
         stats.trade_rank,
         stats.trade_efficiency,
-    )
-    stats.branches_income = BasicStatsFunctions.calculate_branches_income(
+    ),),
+)
+
+BRANCHES_INCOME = DerivedFields(
+    outputs=("branches_income",),
+    inputs=("branches_count", "branches_efficiency"),
+    compute=lambda stats, rng: (BasicStatsFunctions.calculate_branches_income(
         stats.branches_count,
         stats.branches_efficiency,
-    )
+    ),),
+)
 
+BASIC_ECONOMY = (INCOME, TRADE_POTENTIAL, BRANCHES_INCOME)
 
-def populate_basic_industry(stats) -> None:
-    stats.civil_usage = BasicStatsFunctions.calculate_civil_usage(
+
+CIVIL_USAGE = DerivedFields(
+    outputs=("civil_usage",),
+    inputs=("civil_security", "tvr1", "tvr2"),
+    compute=lambda stats, rng: (BasicStatsFunctions.calculate_civil_usage(
         stats.civil_security,
         stats.tvr1,
         stats.tvr2,
-    )
-    stats.industry_coefficient = BasicStatsFunctions.calculate_industry_coefficient(
-        stats.processing_production,
-        stats.processing_usage,
-        stats.processing_efficiency,
-        sum(stats.usages) // len(stats.usages),
-    ) if stats.usages else 0
+    ),),
+)
 
+INDUSTRY_COEFFICIENT = DerivedFields(
+    outputs=("industry_coefficient",),
+    inputs=("processing_production", "processing_usage",
+            "processing_efficiency", "usages"),
+    compute=lambda stats, rng: (
+        BasicStatsFunctions.calculate_industry_coefficient(
+            stats.processing_production,
+            stats.processing_usage,
+            stats.processing_efficiency,
+            sum(stats.usages) // len(stats.usages),
+        ) if stats.usages else 0,
+    ),
+)
+
+
+def _industry_basic_stats(stats, rng: Optional[np.random.Generator]) -> tuple:
     efficiency, max_potential, expected_wastes = (
         BasicStatsFunctions.calculate_industry_basic_stats(
             stats.industry_coefficient,
             stats.civil_usage,
             stats.standardization,
+            rng,
         )
     )
-
-    stats.civil_efficiency = (
+    civil_efficiency = (
         efficiency * BasicStatsFunctions.calculate_civil_efficiency_boost_from_logistic(
             stats.logistic
         )
     )
-    stats.max_potential = max_potential
-    stats.expected_wastes = expected_wastes
+    return civil_efficiency, max_potential, expected_wastes
 
 
-def populate_basic_inner_politics(stats) -> None:
-    stats.success_chance = round(
-        BasicStatsFunctions.calculate_success_chance(
-            stats.knowledge_level,
-            stats.education_level,
-            stats.erudition_will,
-        )
-    )
-    stats.society_decline = BasicStatsFunctions.calculate_society_decline(
-        stats.contentment,
-        stats.government_trust,
-        stats.many_children_traditions,
-        stats.sexual_asceticism,
-        stats.egocentrism_development,
-        stats.education_level,
-        stats.erudition_will,
-        stats.cultural_level,
-        stats.violence_tendency,
-        stats.unemployment_rate,
-        stats.grace_of_the_highest,
-        stats.commitment_to_cause,
-        stats.departure_from_truths,
-    )
+# One Monte Carlo draw gives all three values
+INDUSTRY_BASIC_STATS = DerivedFields(
+    outputs=("civil_efficiency", "max_potential", "expected_wastes"),
+    inputs=("industry_coefficient", "civil_usage", "standardization",
+            "logistic"),
+    compute=_industry_basic_stats,
+)
+
+BASIC_INDUSTRY = (CIVIL_USAGE, INDUSTRY_COEFFICIENT, INDUSTRY_BASIC_STATS)
 
 
-def populate_atterium_inner_politics(stats) -> None:
-    stats.success_chance = round(
+SUCCESS_CHANCE = DerivedFields(
+    outputs=("success_chance",),
+    inputs=("knowledge_level", "education_level", "erudition_will"),
+    compute=lambda stats, rng: (round(
         BasicStatsFunctions.calculate_success_chance(
             stats.knowledge_level,
             stats.education_level,
             stats.erudition_will,
+            rng,
         )
-    )
-    stats.society_decline = AtteriumStatsFunctions.calculate_society_decline(
+    ),),
+)
+
+BASIC_SOCIETY_DECLINE = DerivedFields(
+    outputs=("society_decline",),
+    inputs=("contentment", "government_trust", "many_children_traditions",
+            "sexual_asceticism", "egocentrism_development", "education_level",
+            "erudition_will", "cultural_level", "violence_tendency",
+            "unemployment_rate", "grace_of_the_highest",
+            "commitment_to_cause", "departure_from_truths"),
+    compute=lambda stats, rng: (BasicStatsFunctions.calculate_society_decline(
         stats.contentment,
         stats.government_trust,
         stats.many_children_traditions,
         stats.sexual_asceticism,
         stats.egocentrism_development,
-        stats.capitalistic_decay,
         stats.education_level,
         stats.erudition_will,
         stats.cultural_level,
@@ -97,19 +219,47 @@ def populate_atterium_inner_politics(stats) -> None:
         stats.grace_of_the_highest,
         stats.commitment_to_cause,
         stats.departure_from_truths,
-        stats.equality,
-    )
-
+    ),),
+)
 
-def populate_isf_inner_politics(stats) -> None:
-    stats.success_chance = round(
-        BasicStatsFunctions.calculate_success_chance(
-            stats.knowledge_level,
+ATTERIUM_SOCIETY_DECLINE = DerivedFields(
+    outputs=("society_decline",),
+    inputs=("contentment", "government_trust", "many_children_traditions",
+            "sexual_asceticism", "egocentrism_development",
+            "capitalistic_decay", "education_level", "erudition_will",
+            "cultural_level", "violence_tendency", "unemployment_rate",
+            "grace_of_the_highest", "commitment_to_cause",
+            "departure_from_truths", "equality"),
+    compute=lambda stats, rng: (
+        AtteriumStatsFunctions.calculate_society_decline(
+            stats.contentment,
+            stats.government_trust,
+            stats.many_children_traditions,
+            stats.sexual_asceticism,
+            stats.egocentrism_development,
+            stats.capitalistic_decay,
             stats.education_level,
             stats.erudition_will,
-        )
-    )
-    stats.society_decline = IsfStatsFunctions.calculate_society_decline(
+            stats.cultural_level,
+            stats.violence_tendency,
+            stats.unemployment_rate,
+            stats.grace_of_the_highest,
+            stats.commitment_to_cause,
+            stats.departure_from_truths,
+            stats.equality,
+        ),
+    ),
+)
+
+ISF_SOCIETY_DECLINE = DerivedFields(
+    outputs=("society_decline",),
+    inputs=("contentment", "government_trust", "many_children_traditions",
+            "sexual_asceticism", "egocentrism_development", "education_level",
+            "erudition_will", "cultural_level", "violence_tendency",
+            "unemployment_rate", "grace_of_the_silver", "commitment_to_cause",
+            "departure_from_truths", "imperial_court_power",
+            "separatism_of_the_highest", "allegory_influence"),
+    compute=lambda stats, rng: (IsfStatsFunctions.calculate_society_decline(
         stats.contentment,
         stats.government_trust,
         stats.many_children_traditions,
@@ -126,4 +276,10 @@ def populate_isf_inner_politics(stats) -> None:
         stats.imperial_court_power,
         stats.separatism_of_the_highest,
         stats.allegory_influence,
-    )
+    ),),
+)
+
+BASIC_INNER_POLITICS = (SUCCESS_CHANCE, BASIC_SOCIETY_DECLINE)
+ATTERIUM_INNER_POLITICS = (SUCCESS_CHANCE, ATTERIUM_SOCIETY_DECLINE)
+ISF_INNER_POLITICS = (SUCCESS_CHANCE, ISF_SOCIETY_DECLINE)
+
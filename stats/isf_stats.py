@@ -5,8 +5,9 @@ from typing_extensions import override
 
 from stats.basic_stats import IndustrialStats
 from stats.derived_fields import (
-    populate_basic_economy,
-    populate_isf_inner_politics,
+    BASIC_ECONOMY,
+    ISF_INNER_POLITICS,
+    DerivedFields,
 )
 from stats.pretty_layouts import get_layout_for_class
 from stats.stats_base import StatsBase
@@ -62,8 +63,10 @@ class IsfEconomyStats(StatsBase):
 
         return self
 
-    def recalculate_derived_fields(self) -> None:
-        populate_basic_economy(self)
+    @staticmethod
+    @override
+    def _get_derived_fields() -> tuple[DerivedFields, ...]:
+        return BASIC_ECONOMY
 
     def trade_usage_load(self) -> int:
         if not self.trade_potential:
@@ -203,8 +206,10 @@ class IsfInnerPoliticsStats(StatsBase):
     success_chance: float | None = None
     society_decline: float | None = None
 
-    def recalculate_derived_fields(self) -> None:
-        populate_isf_inner_politics(self)
+    @staticmethod
+    @override
+    def _get_derived_fields() -> tuple[DerivedFields, ...]:
+        return ISF_INNER_POLITICS
 
     @override
     def debug(self):
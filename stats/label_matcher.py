@@ -0,0 +1,94 @@
+"""Multi-pattern label matcher for pretty-text parsing.
+
+`LabelMatcher` compiles the label tokens of all parseable specs of a layout
+into one Aho-Corasick automaton, so every input line is scanned once no matter
+how many labels and aliases the layout has.
+
+The result is identical to the reference `stats.pretty._find_matches_in_line`:
+for each spec only its earliest (and, on a tie, longest) token occurrence is a
+candidate; candidates are ordered by position, longer first, then by spec
+order, and overlapping candidates are dropped greedily.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Generic, Sequence, TypeVar
+
+
+T = TypeVar("T")
+
+
+class LabelMatcher(Generic[T]):
+    """Finds non-overlapping label tokens of many specs in one pass."""
+
+    __slots__ = ("_items", "_goto", "_fail", "_out")
+
+    def __init__(self, items: Sequence[T],
+                 tokens: Sequence[Sequence[str]]) -> None:
+        """`tokens[i]` are all token strings that identify `items[i]`."""
+        self._items = tuple(items)
+        self._goto: list[dict[str, int]] = [{}]
+        self._out: list[list[tuple[int, int]]] = [[]]
+
+        for item_index, item_tokens in enumerate(tokens):
+            for token in item_tokens:
+                if token:
+                    self._add(token, item_index)
+        self._fail = self._build_failure_links()
+
+    def _add(self, token: str, item_index: int) -> None:
+        state = 0
+        for char in token:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._out.append([])
+            state = next_state
+        self._out[state].append((len(token), item_index))
+
+    def _build_failure_links(self) -> list[int]:
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = self._goto[fallback].get(char, 0)
+                self._out[next_state].extend(self._out[fail[next_state]])
+        return fail
+
+    def find(self, line: str) -> list[tuple[int, int, T]]:
+        goto, fail, out = self._goto, self._fail, self._out
+        best: dict[int, tuple[int, int]] = {}
+
+        state = 0
+        for position, char in enumerate(line):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, item_index in out[state]:
+                start = position + 1 - length
+                current = best.get(item_index)
+                if current is None or start < current[0] or (
+                        start == current[0] and start + length > current[1]):
+                    best[item_index] = (start, start + length)
+
+        candidates = sorted(
+            (start, start - end, item_index)
+            for item_index, (start, end) in best.items()
+        )
+
+        resolved: list[tuple[int, int, T]] = []
+        last_end = -1
+        for start, negative_length, item_index in candidates:
+            if resolved and start < last_end:
+                continue
+            last_end = start - negative_length
+            resolved.append((start, last_end, self._items[item_index]))
+        return resolved
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+
+from stats.label_matcher import LabelMatcher
 
 
 RenderFunc = Callable[[Any, bool], str]
@@ -24,10 +27,18 @@ class PrettyFieldSpec:
     getter: GetterFunc | None = None
     formatter: RenderFunc | None = None
     parser: ParserFunc | None = None
+    # model attributes a `getter` reads; used to invalidate cached renders
+    depends_on: tuple[str, ...] | None = None
 
     def all_labels(self) -> tuple[str, ...]:
         return (self.label, *self.aliases)
 
+    def dependencies(self) -> tuple[str, ...] | None:
+        """Attributes the rendered value depends on; None means unknown."""
+        if self.getter is not None:
+            return self.depends_on
+        return (self.field_name or self.key,)
+
 
 @dataclass(frozen=True)
 class PrettyLineSpec:
@@ -66,6 +77,7 @@ def field(
         formatter: RenderFunc | None = None,
         parser: ParserFunc | None = None,
         parse_kind: str = "number",
+        depends_on: Iterable[str] | None = None,
 ) -> PrettyFieldSpec:
     target_field_name = field_name if field_name is not None else (
         None if read_only else key)
@@ -82,6 +94,7 @@ def field(
         formatter=formatter,
         parser=parser,
         parse_kind="skip" if read_only else parse_kind,
+        depends_on=None if depends_on is None else tuple(depends_on),
     )
 
 
@@ -99,6 +112,7 @@ def list_item(
         formatter: RenderFunc | None = None,
         parser: ParserFunc | None = None,
         parse_kind: str = "number",
+        depends_on: Iterable[str] | None = None,
 ) -> PrettyFieldSpec:
     return PrettyFieldSpec(
         key=f"{key}[{index}]",
@@ -114,6 +128,7 @@ def list_item(
         formatter=formatter,
         parser=parser,
         parse_kind="skip" if read_only else parse_kind,
+        depends_on=None if depends_on is None else tuple(depends_on),
     )
 
 
@@ -246,9 +261,30 @@ def _render_value(spec: PrettyFieldSpec, value: Any, debug: bool) -> str:
     return text
 
 
-def render_pretty(model: Any, layout: PrettyLayoutSpec, *,
-                  debug: bool = False) -> str:
-    lines: list[str] = []
+@dataclass(frozen=True)
+class _RenderRow:
+    specs: tuple[PrettyFieldSpec, ...]
+    prefixes: tuple[str, ...]
+    line_width: int
+    min_gap: int
+
+
+@dataclass(frozen=True)
+class RenderTemplate:
+    """A layout flattened into static lines and field rows.
+
+    `dependencies` are the model attributes the rendered text depends on, or
+    None when some getter does not declare them.
+    """
+
+    layout: PrettyLayoutSpec
+    lines: tuple[str | _RenderRow, ...]
+    dependencies: frozenset[str] | None
+
+
+def compile_render_template(layout: PrettyLayoutSpec) -> RenderTemplate:
+    lines: list[str | _RenderRow] = []
+    dependencies: set[str] | None = set()
 
     for line_spec in layout.lines:
         _append_blank_lines(lines, line_spec.gap_before)
@@ -263,27 +299,69 @@ def render_pretty(model: Any, layout: PrettyLayoutSpec, *,
             _append_blank_lines(lines, line_spec.gap_after)
             continue
 
-        texts: list[str] = []
-        for field_key in line_spec.fields:
-            spec = layout.fields[field_key]
-            value = _resolve_value(model, spec)
-            texts.append(f"{spec.label} - {_render_value(spec, value, debug)}")
-
-        row_line_width = line_spec.line_width or layout.line_width
-        row_min_gap = line_spec.min_gap or layout.min_gap
-        lines.append(_render_row(texts, row_line_width, row_min_gap))
-
+        specs = tuple(layout.fields[key] for key in line_spec.fields)
+        for spec in specs:
+            spec_dependencies = spec.dependencies()
+            if spec_dependencies is None:
+                dependencies = None
+            elif dependencies is not None:
+                dependencies.update(spec_dependencies)
+
+        lines.append(_RenderRow(
+            specs=specs,
+            prefixes=tuple(f"{spec.label} - " for spec in specs),
+            line_width=line_spec.line_width or layout.line_width,
+            min_gap=line_spec.min_gap or layout.min_gap,
+        ))
         _append_blank_lines(lines, line_spec.gap_after)
 
+    # Rows are never empty, so trailing blank lines are static too.
     while lines and lines[-1] == "":
         lines.pop()
 
+    return RenderTemplate(
+        layout=layout,
+        lines=tuple(lines),
+        dependencies=None if dependencies is None else frozenset(dependencies),
+    )
+
+
+def render_template(model: Any, template: RenderTemplate, *,
+                    debug: bool = False) -> str:
+    lines: list[str] = []
+    for line in template.lines:
+        if isinstance(line, str):
+            lines.append(line)
+            continue
+        texts = [
+            prefix + _render_value(spec, _resolve_value(model, spec), debug)
+            for prefix, spec in zip(line.prefixes, line.specs)
+        ]
+        lines.append(_render_row(texts, line.line_width, line.min_gap))
+
     body = "\n".join(lines)
-    if layout.code_block:
+    if template.layout.code_block:
         return f"```\n{body}\n```"
     return body
 
 
+def render_pretty(model: Any, layout: PrettyLayoutSpec, *,
+                  debug: bool = False) -> str:
+    return render_template(model, _compiled_template(layout), debug=debug)
+
+
+_TEMPLATES: Dict[int, tuple[PrettyLayoutSpec, RenderTemplate]] = {}
+
+
+def _compiled_template(layout: PrettyLayoutSpec) -> RenderTemplate:
+    cached = _TEMPLATES.get(id(layout))
+    if cached is not None and cached[0] is layout:
+        return cached[1]
+    template = compile_render_template(layout)
+    _TEMPLATES[id(layout)] = (layout, template)
+    return template
+
+
 def _append_blank_lines(lines: list[str], count: int) -> None:
     for _ in range(max(count, 0)):
         if not lines or lines[-1] != "":
@@ -313,35 +391,85 @@ def _render_row(texts: list[str], line_width: int, min_gap: int) -> str:
     return "".join(parts).rstrip()
 
 
-def parse_pretty_text(
-        text: str,
+Caster = Callable[[Any], Any]
+
+
+@dataclass(frozen=True)
+class ParsePlan:
+    """Everything parsing derives from a layout and a model, computed once.
+
+    Build it with :func:`compile_parse_plan` and parse with
+    :func:`parse_with_plan`; stats classes keep one plan per class.
+    """
+
+    layout: PrettyLayoutSpec
+    specs: tuple[PrettyFieldSpec, ...]
+    list_lengths: tuple[tuple[str, int], ...]
+    casters: Mapping[str, Caster]
+    matcher: LabelMatcher[PrettyFieldSpec]
+    defaults: Mapping[str, Any]
+    field_groups: Mapping[str, tuple[str, ...]]
+    field_names: Mapping[str, str]
+
+
+def compile_parse_plan(
         layout: PrettyLayoutSpec,
         model_fields: Dict[str, Any],
+        *,
         defaults: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
-    result: Dict[str, Any] = (defaults or {}).copy()
+        field_groups: Optional[Dict[str, Iterable[str]]] = None,
+        field_names: Optional[Dict[str, str]] = None,
+) -> ParsePlan:
+    specs = tuple(_parse_specs(layout))
 
     list_lengths: Dict[str, int] = {}
-    for spec in layout.fields.values():
-        if spec.read_only or spec.parse_kind == "skip" or spec.field_name is None:
-            continue
+    for spec in specs:
         if spec.index is not None:
             list_lengths[spec.field_name] = max(
                 list_lengths.get(spec.field_name, 0), spec.index + 1
             )
-    for field_name, length in list_lengths.items():
+
+    casters = {
+        spec.field_name: _caster_for(spec.field_name, model_fields)
+        for spec in specs
+    }
+
+    return ParsePlan(
+        layout=layout,
+        specs=specs,
+        list_lengths=tuple(list_lengths.items()),
+        casters=MappingProxyType(casters),
+        matcher=_compiled_matcher(layout),
+        defaults=MappingProxyType(dict(defaults or {})),
+        field_groups=MappingProxyType({
+            group: tuple(names)
+            for group, names in (field_groups or {}).items()
+        }),
+        field_names=MappingProxyType(dict(field_names or {})),
+    )
+
+
+def parse_with_plan(
+        text: str,
+        plan: ParsePlan,
+        defaults: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Parses `text`; `defaults` override the defaults stored in the plan."""
+    result: Dict[str, Any] = dict(plan.defaults)
+    if defaults:
+        result.update(defaults)
+
+    for field_name, length in plan.list_lengths:
         existing = result.get(field_name)
         if not isinstance(existing, list) or len(existing) < length:
             result[field_name] = [0.0] * length
+        else:
+            # Never write into lists owned by the caller or the plan.
+            result[field_name] = list(existing)
 
-    parse_specs = [
-        spec for spec in layout.fields.values()
-        if
-        not spec.read_only and spec.parse_kind != "skip" and spec.field_name is not None
-    ]
-
+    matcher, casters = plan.matcher, plan.casters
     for line in _normalize_lines(text):
-        matches = _find_matches_in_line(line, parse_specs)
+        matches = matcher.find(line)
         if not matches:
             continue
 
@@ -350,11 +478,22 @@ def parse_pretty_text(
             end = matches[idx + 1][0] if idx + 1 < len(matches) else len(line)
             value_text = line[start:end].strip()
             spec = match[2]
-            _assign_parsed_value(result, spec, value_text, model_fields)
+            _assign_parsed_value(result, spec, value_text,
+                                 casters[spec.field_name])
 
     return result
 
 
+def parse_pretty_text(
+        text: str,
+        layout: PrettyLayoutSpec,
+        model_fields: Dict[str, Any],
+        defaults: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    return parse_with_plan(text, _compiled_plan(layout, model_fields),
+                           defaults)
+
+
 def _normalize_lines(text: str) -> list[str]:
     cleaned = text.replace("\r", "").replace("\xa0", " ").replace("\t", " ")
     lines: list[str] = []
@@ -366,10 +505,55 @@ def _normalize_lines(text: str) -> list[str]:
     return lines
 
 
+_MATCHERS: Dict[int, tuple[PrettyLayoutSpec, LabelMatcher[PrettyFieldSpec]]] = {}
+_PLANS: Dict[tuple[int, int], tuple[PrettyLayoutSpec, Dict[str, Any], ParsePlan]] = {}
+
+
+def _parse_specs(layout: PrettyLayoutSpec) -> list[PrettyFieldSpec]:
+    return [
+        spec for spec in layout.fields.values()
+        if
+        not spec.read_only and spec.parse_kind != "skip" and spec.field_name is not None
+    ]
+
+
+def _compiled_matcher(
+        layout: PrettyLayoutSpec) -> LabelMatcher[PrettyFieldSpec]:
+    # Layouts are frozen but hold a dict, so they are cached by identity.
+    cached = _MATCHERS.get(id(layout))
+    if cached is not None and cached[0] is layout:
+        return cached[1]
+    specs = _parse_specs(layout)
+    matcher = LabelMatcher(specs, [
+        [token for label in spec.all_labels() for token in _token_variants(label)]
+        for spec in specs
+    ])
+    _MATCHERS[id(layout)] = (layout, matcher)
+    return matcher
+
+
+def _compiled_plan(layout: PrettyLayoutSpec,
+                   model_fields: Dict[str, Any]) -> ParsePlan:
+    # Same identity caching as `_compiled_matcher`; `model_fields` is the
+    # per-class dict pydantic keeps on the model.
+    key = (id(layout), id(model_fields))
+    cached = _PLANS.get(key)
+    if cached is not None and cached[0] is layout and cached[1] is model_fields:
+        return cached[2]
+    plan = compile_parse_plan(layout, model_fields)
+    _PLANS[key] = (layout, model_fields, plan)
+    return plan
+
+
 def _find_matches_in_line(
         line: str,
         specs: list[PrettyFieldSpec]
 ) -> list[tuple[int, int, PrettyFieldSpec]]:
+    """Reference matcher: one `str.find` per spec, label and variant.
+
+    `parse_pretty_text` uses the compiled `LabelMatcher`, which must return
+    exactly the same matches.
+    """
     candidates: list[tuple[int, int, PrettyFieldSpec]] = []
     for spec in specs:
         best: tuple[int, int] | None = None
@@ -403,8 +587,7 @@ def _token_variants(label: str) -> tuple[str, ...]:
 
 
 def _assign_parsed_value(result: Dict[str, Any], spec: PrettyFieldSpec,
-                         value_text: str,
-                         model_fields: Dict[str, Any]) -> None:
+                         value_text: str, caster: Caster) -> None:
     if spec.parser is not None:
         parsed_value = spec.parser(value_text)
     elif spec.parse_kind == "budget":
@@ -423,22 +606,31 @@ def _assign_parsed_value(result: Dict[str, Any], spec: PrettyFieldSpec,
         target_list = result.setdefault(spec.field_name, [])
         while len(target_list) <= spec.index:
             target_list.append(0.0)
-        target_list[spec.index] = _cast_value(spec.field_name, parsed_value,
-                                              model_fields)
+        target_list[spec.index] = caster(parsed_value)
         return
 
-    result[spec.field_name] = _cast_value(spec.field_name, parsed_value,
-                                          model_fields)
+    result[spec.field_name] = caster(parsed_value)
+
+
+def _cast_int(value: Any) -> int:
+    return int(round(_coerce_number(value, 0.0)))
+
 
+def _cast_float(value: Any) -> float:
+    return float(_coerce_number(value, 0.0))
 
-def _cast_value(field_name: str, value: Any,
-                model_fields: Dict[str, Any]) -> Any:
+
+def _keep_value(value: Any) -> Any:
+    return value
+
+
+def _caster_for(field_name: str, model_fields: Dict[str, Any]) -> Caster:
     field_info = model_fields.get(field_name)
     if field_info is None:
-        return value
+        return _keep_value
     annotation = field_info.annotation
     if annotation == int:
-        return int(round(_coerce_number(value, 0.0)))
+        return _cast_int
     if annotation == float:
-        return float(_coerce_number(value, 0.0))
-    return value
+        return _cast_float
+    return _keep_value
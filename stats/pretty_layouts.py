@@ -6,3 +6,4 @@ from stats.pretty_layouts keep working during the transition.
 """
 
 from stats.pretty_specs import *  # noqa: F401,F403
+from stats.pretty_specs import __getattr__  # noqa: F401
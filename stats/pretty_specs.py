@@ -5,3 +5,5 @@ This module is kept as a stable import surface for the rest of the project.
 """
 
 from stats.pretty_specs_parts import *  # noqa: F401,F403
+# Layouts (and `LAYOUTS_BY_CLASS`) are resolved lazily
+from stats.pretty_specs_parts import __getattr__  # noqa: F401
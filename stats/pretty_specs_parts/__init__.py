@@ -1,31 +1,55 @@
-from stats.pretty_specs_parts.economy import (
-    BASIC_ECONOMY_LAYOUT,
-    ATTERIUM_ECONOMY_LAYOUT,
-    ISF_ECONOMY_LAYOUT,
-)
-from stats.pretty_specs_parts.industry import INDUSTRY_LAYOUT
-from stats.pretty_specs_parts.agriculture import AGRICULTURE_LAYOUT, ISF_AGRICULTURE_LAYOUT
-from stats.pretty_specs_parts.inner_politics import (
-    BASIC_INNER_LAYOUT,
-    ATTERIUM_INNER_LAYOUT,
-    ISF_INNER_LAYOUT,
-)
-
-LAYOUTS_BY_CLASS = {
-    "EconomyStats": BASIC_ECONOMY_LAYOUT,
-    "AtteriumEconomyStats": ATTERIUM_ECONOMY_LAYOUT,
-    "IsfEconomyStats": ISF_ECONOMY_LAYOUT,
-    "IndustrialStats": INDUSTRY_LAYOUT,
-    "AtteriumIndustrialStats": INDUSTRY_LAYOUT,
-    "IsfIndustrialStats": INDUSTRY_LAYOUT,
-    "AgricultureStats": AGRICULTURE_LAYOUT,
-    "AtteriumAgricultureStats": AGRICULTURE_LAYOUT,
-    "IsfAgricultureStats": ISF_AGRICULTURE_LAYOUT,
-    "InnerPoliticsStats": BASIC_INNER_LAYOUT,
-    "AtteriumInnerPoliticsStats": ATTERIUM_INNER_LAYOUT,
-    "IsfInnerPoliticsStats": ISF_INNER_LAYOUT,
+"""Pretty layouts by stat domain, imported on first use.
+
+A layout module is loaded when a stats class first parses or renders, so
+importing the stats models loads none of them.
+"""
+
+__all__ = ["get_layout_for_class"]
+
+# Layout constant -> module of this package defining it
+_LAYOUT_MODULES = {
+    "BASIC_ECONOMY_LAYOUT": "economy",
+    "ATTERIUM_ECONOMY_LAYOUT": "economy",
+    "ISF_ECONOMY_LAYOUT": "economy",
+    "INDUSTRY_LAYOUT": "industry",
+    "AGRICULTURE_LAYOUT": "agriculture",
+    "ISF_AGRICULTURE_LAYOUT": "agriculture",
+    "BASIC_INNER_LAYOUT": "inner_politics",
+    "ATTERIUM_INNER_LAYOUT": "inner_politics",
+    "ISF_INNER_LAYOUT": "inner_politics",
+}
+
+_LAYOUT_NAMES_BY_CLASS = {
+    "EconomyStats": "BASIC_ECONOMY_LAYOUT",
+    "AtteriumEconomyStats": "ATTERIUM_ECONOMY_LAYOUT",
+    "IsfEconomyStats": "ISF_ECONOMY_LAYOUT",
+    "IndustrialStats": "INDUSTRY_LAYOUT",
+    "AtteriumIndustrialStats": "INDUSTRY_LAYOUT",
+    "IsfIndustrialStats": "INDUSTRY_LAYOUT",
+    "AgricultureStats": "AGRICULTURE_LAYOUT",
+    "AtteriumAgricultureStats": "AGRICULTURE_LAYOUT",
+    "IsfAgricultureStats": "ISF_AGRICULTURE_LAYOUT",
+    "InnerPoliticsStats": "BASIC_INNER_LAYOUT",
+    "AtteriumInnerPoliticsStats": "ATTERIUM_INNER_LAYOUT",
+    "IsfInnerPoliticsStats": "ISF_INNER_LAYOUT",
 }
 
 
+def _load_layout(name: str):
+    module = __import__(f"{__name__}.{_LAYOUT_MODULES[name]}",
+                        fromlist=[name])
+    return getattr(module, name)
+
+
 def get_layout_for_class(class_name: str):
-    return LAYOUTS_BY_CLASS[class_name]
+    return _load_layout(_LAYOUT_NAMES_BY_CLASS[class_name])
+
+
+def __getattr__(name: str):
+    # `LAYOUTS_BY_CLASS` and the layout constants load their modules
+    if name == "LAYOUTS_BY_CLASS":
+        return {class_name: get_layout_for_class(class_name)
+                for class_name in _LAYOUT_NAMES_BY_CLASS}
+    if name in _LAYOUT_MODULES:
+        return _load_layout(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -46,6 +46,8 @@ AGRICULTURE_COMMON_FIELDS = {
         "Обеспеченность едой",
         read_only=True,
         getter=food_security_getter,
+        depends_on=("food_security", "_is_negative_food_security",
+                    "is_negative_food_security"),
         formatter=food_security,
         default=0.0,
         aliases=("Обесп. едой",),
@@ -18,6 +18,7 @@ ECONOMY_COMMON_FIELDS = {
         "Казна",
         field_name="current_budget",
         getter=budget_getter,
+        depends_on=("current_budget", "prev_budget"),
         formatter=budget_pair,
         parse_kind="budget",
         default=0.0,
@@ -63,13 +64,15 @@ ECONOMY_COMMON_FIELDS = {
     "trade_usage_load": field("trade_usage_load", "Загрузка путей", decimals=0,
                               suffix="%", read_only=True,
                               getter=trade_usage_load, default=0.0,
+                              depends_on=("trade_usage", "trade_potential"),
                               aliases=("Загруженность торговых путей",)),
     "trade_wastes": field("trade_wastes", "Трансп. издержки", decimals=1,
                           suffix=" ед.вал",
                           aliases=("Транспортные издержки",)),
     "available_trade_paths": field("available_trade_paths", "Доступные пути",
                                    decimals=0, read_only=True,
-                                   getter=available_trade_paths, default=0),
+                                   getter=available_trade_paths, default=0,
+                                   depends_on=("trade_rank",)),
 
     "hq": field("high_quality_percent", "Высокое качество", decimals=1,
                 suffix="%", aliases=("Высокого качества",)),
@@ -4,8 +4,9 @@ These centralize field groups/names/regex patterns and reduce duplication betwee
 """
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any, Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
 
 MODES = ['basic', 'atterium', 'isf']
@@ -120,14 +121,28 @@ def _mode_dict(mode: str, *, kind: str):
     raise ValueError(f"Unknown kind: {kind}")
 
 
+@lru_cache(maxsize=None)
+def _merged_field_groups(mode: str) -> Mapping[str, tuple[str, ...]]:
+    base = {group: tuple(fields) for group, fields in COMMON_FIELD_GROUPS.items()}
+    base.update({group: tuple(fields) for group, fields
+                 in _mode_dict(mode, kind="groups").items()})
+    return MappingProxyType(base)
+
+
+@lru_cache(maxsize=None)
+def _merged_field_names(mode: str) -> Mapping[str, str]:
+    base = dict(COMMON_FIELD_NAMES)
+    base.update(_mode_dict(mode, kind="names"))
+    return MappingProxyType(base)
+
+
 def build_field_groups(mode: str) -> Dict[str, List[str]]:
-    base = deepcopy(COMMON_FIELD_GROUPS)
-    base.update(deepcopy(_mode_dict(mode, kind="groups")))
-    return base
+    """A fresh mutable copy; the merge itself is done once per mode."""
+    return {group: list(fields)
+            for group, fields in _merged_field_groups(mode).items()}
 
 
 def build_field_names(mode: str) -> Dict[str, str]:
-    base = deepcopy(COMMON_FIELD_NAMES)
-    base.update(deepcopy(_mode_dict(mode, kind="names")))
-    return base
+    """A fresh mutable copy; the merge itself is done once per mode."""
+    return dict(_merged_field_names(mode))
 
@@ -1,23 +1,253 @@
+import itertools
+import math
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, List, Any, Dict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, List, Any, Dict, Iterable, Iterator, \
+    Mapping, Type, get_args, get_origin
 
+import numpy as np
 import pydantic
 
-from stats.pretty import parse_pretty_text, render_pretty, PrettyLayoutSpec
+from stats.derived_fields import DerivedFields, DerivedGraph
+from stats.pretty import (
+    ParsePlan,
+    PrettyLayoutSpec,
+    RenderTemplate,
+    compile_parse_plan,
+    compile_render_template,
+    parse_with_plan,
+    render_template,
+)
 from utils.input_parsers import InputParser
 
 
+_PARSE_PLANS: Dict[Type['StatsBase'], ParsePlan] = {}
+_RENDER_TEMPLATES: Dict[Type['StatsBase'], tuple[RenderTemplate, tuple[str, ...]]] = {}
+_DERIVED_GRAPHS: Dict[Type['StatsBase'], DerivedGraph] = {}
+_TRUSTED_LAYOUTS: Dict[Type['StatsBase'], tuple[
+    Dict[str, Any], tuple[str, ...], tuple[str, ...], Dict[str, Any]]] = {}
+
+
+# Per-class caches are filled on first use. Reads need no lock; builds are
+# serialized so that concurrent first uses (e.g. from a thread pool) build
+# each entry once and all get the same object. Re-entrant because builders
+# call each other.
+_CACHE_LOCK = threading.RLock()
+
+
+def _cached_for_class(cache: Dict[type, Any], cls: type, build) -> Any:
+    value = cache.get(cls)
+    if value is None:
+        with _CACHE_LOCK:
+            value = cache.get(cls)
+            if value is None:
+                value = cache[cls] = build()
+    return value
+
+_INTERNAL_PRIVATE = frozenset({"_rendered", "_derived_rng", "_pinned_derived"})
+_trusted_check_rate: ContextVar[float] = ContextVar(
+    "trusted_check_rate", default=0.0)
+_trusted_calls = itertools.count(1)
+
+
+@contextmanager
+def check_trusted_construction(rate: float = 1.0) -> Iterator[None]:
+    """Debug switch: fully validates `rate` of `from_trusted` calls in the block.
+
+    Sampling is deterministic (every ``1 / rate``-th call) and does not touch
+    any random generator.
+    """
+    if not 0 <= rate <= 1:
+        raise ValueError("Доля проверок должна быть от 0 до 1")
+    token = _trusted_check_rate.set(rate)
+    try:
+        yield
+    finally:
+        _trusted_check_rate.reset(token)
+
+
+def _should_check_trusted() -> bool:
+    rate = _trusted_check_rate.get()
+    if rate <= 0:
+        return False
+    call = next(_trusted_calls)
+    return math.floor(call * rate) != math.floor((call - 1) * rate)
+
+
+def _is_list_annotation(annotation: Any) -> bool:
+    return get_origin(annotation) is list or any(
+        get_origin(arg) is list for arg in get_args(annotation))
+
+
 class StatsBase(pydantic.BaseModel, ABC):
+    # Validators are built on first validation, not when a mode is imported
+    model_config = pydantic.ConfigDict(defer_build=True)
+
+    # debug flag -> (text, snapshot of list fields). The dict is replaced and
+    # never mutated: shallow model copies share private values.
+    _rendered: Dict[bool, tuple[str, tuple]] = pydantic.PrivateAttr(
+        default_factory=dict)
+
+    # Generator for lazily computed derived fields (see `_get_derived_fields`)
+    _derived_rng: Optional[np.random.Generator] = pydantic.PrivateAttr(
+        default=None)
+    # Derived fields assigned explicitly: kept until the next recalculation
+    _pinned_derived: frozenset = pydantic.PrivateAttr(default=frozenset())
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names missing from __dict__: a stale derived field.
+        node = self._get_derived_graph().producers.get(name)
+        if node is None:
+            return super().__getattr__(name)
+        self._compute_derived(node, None)
+        return self.__dict__[name]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        graph = self._get_derived_graph()
+        node = graph.producers.get(name)
+        if node is not None:
+            if name not in self.__dict__:
+                # keep the rest of a stale node consistent with eager semantics
+                self._compute_derived(node, None)
+            private = self.__pydantic_private__
+            private["_pinned_derived"] = private["_pinned_derived"] | {name}
+
+        super().__setattr__(name, value)
+        self._drop_derived(graph.downstream((name,)))
+
+        private = self.__pydantic_private__
+        if private and private.get("_rendered"):
+            dependencies = self._get_render_template().dependencies
+            if dependencies is None or name in dependencies:
+                private["_rendered"] = {}
+
+    def __eq__(self, other: Any) -> bool:
+        # Stale derived fields are not computed here (that would draw from
+        # the generators): they are compared only where both models have them
+        if not isinstance(other, StatsBase):
+            return NotImplemented
+        if type(self) is not type(other):
+            return False
+        derived = self._get_derived_graph().producers
+        mine, theirs = self.__dict__, other.__dict__
+        stale = {name for name in derived
+                 if name not in mine or name not in theirs}
+        return ({name: value for name, value in mine.items()
+                 if name not in stale}
+                == {name: value for name, value in theirs.items()
+                    if name not in stale}
+                and self._public_private() == other._public_private())
+
+    def __iter__(self):
+        self.materialize_derived_fields()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self.materialize_derived_fields()
+        return super().__repr_args__()
+
+    def _public_private(self) -> Dict[str, Any]:
+        """Private state without caches and the derived-field generator."""
+        return {name: value for name, value in
+                (self.__pydantic_private__ or {}).items()
+                if name not in _INTERNAL_PRIVATE}
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # `update` bypasses __setattr__
+            copied.__pydantic_private__["_rendered"] = {}
+            graph = copied._get_derived_graph()
+            pinned = set(update) & graph.producers.keys()
+            if pinned:
+                copied.__pydantic_private__["_pinned_derived"] = (
+                        copied._pinned_derived | pinned)
+            copied._drop_derived(graph.downstream(update))
+        return copied
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        self.materialize_derived_fields()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        self.materialize_derived_fields()
+        return super().model_dump_json(**kwargs)
 
     def model_post_init(self, __context) -> None:
-        self.recalculate_derived_fields()
+        # A generator can be passed as `model_validate(..., context={"rng": rng})`
+        rng = __context.get("rng") if isinstance(__context, dict) else None
+        self.__pydantic_private__["_derived_rng"] = rng
+        self._drop_derived(self._get_derived_graph().nodes)
+
+    def recalculate_derived_fields(
+            self,
+            rng: Optional[np.random.Generator] = None,
+            changed: Optional[Iterable[str]] = None,
+    ) -> tuple[str, ...]:
+        """Пересчитывает производные поля модели после инициализации.
+
+        With `changed` only the fields downstream of those inputs are
+        recomputed. Returns the names of the recomputed fields.
+        """
+        graph = self._get_derived_graph()
+        nodes = graph.nodes if changed is None else graph.downstream(changed)
+        outputs = graph.outputs(nodes)
 
-    def recalculate_derived_fields(self) -> None:
-        """Пересчитывает производные поля модели после инициализации."""
-        return None
+        private = self.__pydantic_private__
+        private["_pinned_derived"] = private["_pinned_derived"].difference(
+            outputs)
+        for node in nodes:
+            self._compute_derived(node, rng)
+        return outputs
+
+    def materialize_derived_fields(self) -> None:
+        """Computes every derived field that has not been computed yet."""
+        for node in self._get_derived_graph().nodes:
+            if node.outputs[0] not in self.__dict__:
+                self._compute_derived(node, None)
+
+    def _compute_derived(self, node: DerivedFields,
+                         rng: Optional[np.random.Generator]) -> None:
+        private = self.__pydantic_private__
+        if rng is None:
+            rng = private["_derived_rng"]
+        self.__dict__.update(zip(node.outputs, node.compute(self, rng)))
+        private["_rendered"] = {}
+
+    def _drop_derived(self, nodes: Iterable[DerivedFields]) -> None:
+        """Marks `nodes` stale unless one of their fields is pinned."""
+        if not nodes:
+            return
+        private = self.__pydantic_private__
+        pinned = private["_pinned_derived"]
+        for node in nodes:
+            if pinned and not pinned.isdisjoint(node.outputs):
+                continue
+            for name in node.outputs:
+                self.__dict__.pop(name, None)
+        private["_rendered"] = {}
 
     def render_pretty(self, *, debug: bool = False) -> str:
-        return render_pretty(self, self._get_pretty_layout(), debug=debug)
+        """Rendered layout, cached until a field it shows is assigned.
+
+        List fields can change in place, so their contents are compared too.
+        """
+        template = self._get_render_template()
+        snapshot = tuple(
+            tuple(value) if isinstance(value := getattr(self, name, None),
+                                       list) else value
+            for name in _RENDER_TEMPLATES[type(self)][1]
+        )
+        cached = self._rendered.get(debug)
+        if cached is not None and cached[1] == snapshot:
+            return cached[0]
+
+        text = render_template(self, template, debug=debug)
+        self.__pydantic_private__["_rendered"] = {
+            **self._rendered, debug: (text, snapshot)}
+        return text
 
     def debug(self):
         return self.render_pretty(debug=True)
@@ -44,6 +274,46 @@ class StatsBase(pydantic.BaseModel, ABC):
     def _get_default_values() -> Dict:
         return {}
 
+    @staticmethod
+    def _get_derived_fields() -> tuple[DerivedFields, ...]:
+        """Derived field nodes, computed lazily in dependency order."""
+        return ()
+
+    @classmethod
+    def _get_derived_graph(cls) -> DerivedGraph:
+        return _cached_for_class(
+            _DERIVED_GRAPHS, cls,
+            lambda: DerivedGraph(cls._get_derived_fields()))
+
+    @classmethod
+    def _get_parse_plan(cls) -> ParsePlan:
+        """Parse plan of this class, compiled on first use."""
+        def build() -> ParsePlan:
+            return compile_parse_plan(
+                cls._get_pretty_layout(),
+                cls.model_fields,
+                defaults=cls._get_default_values(),
+                field_groups=cls._get_field_groups(),
+                field_names=cls._get_field_names(),
+            )
+
+        return _cached_for_class(_PARSE_PLANS, cls, build)
+
+    @classmethod
+    def _get_render_template(cls) -> RenderTemplate:
+        """Render template of this class, compiled on first use."""
+        def build() -> tuple[RenderTemplate, tuple[str, ...]]:
+            template = compile_render_template(cls._get_pretty_layout())
+            list_fields = tuple(
+                name for name, info in cls.model_fields.items()
+                if _is_list_annotation(info.annotation) and (
+                        template.dependencies is None
+                        or name in template.dependencies)
+            )
+            return template, list_fields
+
+        return _cached_for_class(_RENDER_TEMPLATES, cls, build)[0]
+
     @classmethod
     def from_user_input(cls,
                         greeting_text: Optional[str] = None) -> 'StatsBase':
@@ -53,8 +323,9 @@ class StatsBase(pydantic.BaseModel, ABC):
         fields = cls.model_fields
         data = {}
 
-        field_groups = cls._get_field_groups()
-        field_names = cls._get_field_names()
+        plan = cls._get_parse_plan()
+        field_groups = plan.field_groups
+        field_names = plan.field_names
 
         for group_name, field_list in field_groups.items():
             print(f"\n--- {group_name} ---")
@@ -78,15 +349,88 @@ class StatsBase(pydantic.BaseModel, ABC):
 
     @classmethod
     def from_stats_text(cls, data: str,
-                        defaults: Dict[str, Any] = None) -> 'StatsBase':
-        merged_defaults = cls._get_default_values().copy()
-        if defaults:
-            merged_defaults.update(defaults)
-
-        parsed = parse_pretty_text(
-            data,
-            cls._get_pretty_layout(),
-            cls.model_fields,
-            defaults=merged_defaults,
-        )
-        return cls(**parsed)
+                        defaults: Dict[str, Any] = None,
+                        rng: Optional[np.random.Generator] = None) -> 'StatsBase':
+        parsed = parse_with_plan(data, cls._get_parse_plan(), defaults)
+        return cls.model_validate(parsed, context={"rng": rng})
+
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any],
+                     rng: Optional[np.random.Generator] = None) -> 'StatsBase':
+        """Builds a model from data this program produced, e.g. `model_dump`.
+
+        Validators are skipped; derived fields are recomputed lazily as after
+        a validated construction. Lists are copied. Inside
+        `check_trusted_construction` sampled calls are validated in full.
+        """
+        if _should_check_trusted():
+            return cls.model_validate(data, context={"rng": rng})
+
+        defaults, list_fields, derived, private = cls._get_trusted_layout()
+        values = {**defaults, **data}
+        for name in list_fields:
+            value = values.get(name)
+            if isinstance(value, list):
+                values[name] = list(value)
+        for name in derived:
+            values.pop(name, None)
+
+        # What `model_construct` does, minus its per-field Python loop
+        model = cls.__new__(cls)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__pydantic_fields_set__", set(data))
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__",
+                           {**private, "_derived_rng": rng})
+        return model
+
+    @classmethod
+    def _get_trusted_layout(cls) -> tuple[
+            Dict[str, Any], tuple[str, ...], tuple[str, ...], Dict[str, Any]]:
+        """Field defaults, list fields, derived fields and private defaults.
+
+        Private defaults are shared between models: none of them is ever
+        mutated in place.
+        """
+        def build():
+            fields = cls.__pydantic_fields__
+            return (
+                {name: info.default for name, info in fields.items()
+                 if not info.is_required() and info.default_factory is None},
+                tuple(name for name, info in fields.items()
+                      if _is_list_annotation(info.annotation)
+                      or info.annotation is list),
+                tuple(cls._get_derived_graph().producers),
+                {name: attr.get_default() if attr.default_factory is None
+                 else attr.default_factory()
+                 for name, attr in cls.__private_attributes__.items()},
+            )
+
+        return _cached_for_class(_TRUSTED_LAYOUTS, cls, build)
+
+    def checkpoint(self) -> tuple:
+        """Copy of the model state for `rollback`.
+
+        Lists are copied and the state of the derived-field generator is
+        saved, so draws made after the checkpoint are undone too. A
+        checkpoint is rolled back to at most once.
+        """
+        values = dict(self.__dict__)
+        for name in self._get_trusted_layout()[1]:
+            value = values.get(name)
+            if type(value) is list:
+                values[name] = list(value)
+        private = dict(self.__pydantic_private__)
+        rng = private["_derived_rng"]
+        return (values, private, set(self.__pydantic_fields_set__),
+                None if rng is None else rng.bit_generator.state)
+
+    def rollback(self, checkpoint: tuple) -> None:
+        """Puts the model back to a state taken by `checkpoint`."""
+        values, private, fields_set, rng_state = checkpoint
+        self.__dict__.clear()
+        self.__dict__.update(values)
+        object.__setattr__(self, "__pydantic_private__", private)
+        object.__setattr__(self, "__pydantic_fields_set__", fields_set)
+        if rng_state is not None:
+            private["_derived_rng"].bit_generator.state = rng_state
@@ -1,13 +1,13 @@
-import random
-
 import pytest
 
+from functions.rng import seed_default_rng
+
 
 @pytest.fixture(autouse=True)
 def _test_environment(monkeypatch):
     # Do not create log files during tests
     monkeypatch.setenv("WPI_LOG_TO_FILE", "0")
     monkeypatch.setenv("WPI_LOG_LEVEL", "WARNING")
-    # Deterministic randomness for functions using `random`
-    random.seed(12345)
+    # Deterministic randomness for models using the fallback generator
+    seed_default_rng(12345)
     yield
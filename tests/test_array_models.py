@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+from dataclasses import fields
+
+import numpy as np
+import pytest
+
+from functions import array_models
+from functions.agriculture_models import (
+    AdditionalWastesModel,
+    AgricultureDevelopmentModel,
+    AgricultureEfficiencyModel,
+    AgricultureWastesModel,
+    FoodModel,
+    WorkersCountModel,
+)
+from functions.economy_models import (
+    BranchIncomeModel,
+    PopulationGrowthModel,
+    TradePotentialModel,
+)
+from functions.income_models import (
+    InfrastructureModel,
+    LogisticsModel,
+    MoneyIncomeModel,
+    TaxIncomeModel,
+)
+from functions.industry_models import (
+    CivilEfficiencyLogisticModel,
+    CivilUsageModel,
+    ConsumptionOfGoodsModel,
+    IndustryBasicStatsModel,
+    IndustryCoefficientModel,
+    IndustryEstimator,
+    IndustryIncomeModel,
+    IndustryOverproductionModel,
+    OverproductionModel,
+)
+from functions.society_models import (
+    ContentmentModel,
+    CorruptionModel,
+    CulturalCoefficientModel,
+    DemographyModel,
+    IncomeModifierModel,
+    IntegrityOfFaithModel,
+    KnowledgeModel,
+    SocietyDeclineModel,
+    StabilityModel,
+    StateApparatusModel,
+    SuccessChanceModel,
+)
+from functions.trade_models import ForexFeatureBatch, ForexFeatures, TradeModels
+
+
+RNG = np.random.default_rng(2024)
+N = 64
+
+PERCENT = np.concatenate([[0, 20, 21, 40, 60, 80, 81, 100], RNG.uniform(0, 100, N - 8)])
+SIGNED = RNG.uniform(-200, 200, N)
+POPULATION = np.concatenate([
+    [1, 1_000_000, 2_500_000, 5_500_000, 8_000_000, 10_000_000, 500_000_000, 600_000_000],
+    RNG.integers(1, 300_000_000, N - 8),
+]).astype(float)
+SECURITIES = RNG.uniform(0, 130, (N, 3))
+GOV_WASTES = RNG.uniform(0, 500, (N, 5))
+FOREX_FIELDS = [item.name for item in fields(ForexFeatures)]
+
+
+def _percent():
+    return RNG.permutation(PERCENT)
+
+
+def _assert_parity(scalar, vectorized, *columns, rtol=1e-12):
+    expected = np.array([scalar(*row) for row in zip(*columns)], dtype=float)
+    np.testing.assert_allclose(vectorized(*columns), expected, rtol=rtol, atol=1e-12)
+
+
+@pytest.mark.parametrize("scalar, vectorized, columns", [
+    (PopulationGrowthModel.calculate, array_models.PopulationGrowthModel.calculate,
+     (POPULATION,)),
+    (TradePotentialModel.calculate, array_models.TradePotentialModel.calculate,
+     (RNG.integers(1, 12, N), PERCENT)),
+    (BranchIncomeModel.calculate, array_models.BranchIncomeModel.calculate,
+     (RNG.integers(0, 20, N), PERCENT)),
+    (MoneyIncomeModel.collaboration_factor, array_models.MoneyIncomeModel.collaboration_factor,
+     (PERCENT, _percent())),
+    (MoneyIncomeModel.inflation_factor, array_models.MoneyIncomeModel.inflation_factor,
+     (PERCENT,)),
+    (MoneyIncomeModel.agriculture_factor, array_models.MoneyIncomeModel.agriculture_factor,
+     (SIGNED, PERCENT, POPULATION / 50)),
+    (MoneyIncomeModel.boost, array_models.MoneyIncomeModel.boost,
+     (RNG.uniform(70, 110, N), RNG.uniform(0, 6, N), RNG.uniform(0, 15, N))),
+    (MoneyIncomeModel.simple_boost, array_models.MoneyIncomeModel.simple_boost,
+     (RNG.uniform(0, 130, N),)),
+    (InfrastructureModel.expected_wastes, array_models.InfrastructureModel.expected_wastes,
+     (POPULATION,)),
+    (CulturalCoefficientModel.calculate, array_models.CulturalCoefficientModel.calculate,
+     (RNG.integers(0, 10, N), SIGNED / 10)),
+    (IncomeModifierModel.from_agriculture, array_models.IncomeModifierModel.from_agriculture,
+     (SIGNED + 100,)),
+    (IncomeModifierModel.from_social_decline, array_models.IncomeModifierModel.from_social_decline,
+     (PERCENT,)),
+    (IncomeModifierModel.from_panic_level, array_models.IncomeModifierModel.from_panic_level,
+     (PERCENT,)),
+    (IncomeModifierModel.from_food_diversity, array_models.IncomeModifierModel.from_food_diversity,
+     (np.concatenate([[0.0], SIGNED[1:]]),)),
+    (DemographyModel.decrement_coefficient, array_models.DemographyModel.decrement_coefficient,
+     (PERCENT,)),
+    (StateApparatusModel.expected_size, array_models.StateApparatusModel.expected_size,
+     (POPULATION, PERCENT / 10)),
+    (KnowledgeModel.calculate, array_models.KnowledgeModel.calculate,
+     (np.concatenate([[0.0], POPULATION[1:]]), PERCENT * 5)),
+    (IntegrityOfFaithModel.factor, array_models.IntegrityOfFaithModel.factor, (PERCENT,)),
+    (CorruptionModel.apply, array_models.CorruptionModel.apply, (RNG.integers(0, 8, N),)),
+    (AdditionalWastesModel.calculate, array_models.AdditionalWastesModel.calculate,
+     (SIGNED,)),
+    (WorkersCountModel.calculate, array_models.WorkersCountModel.calculate,
+     (np.concatenate([[-5.0], POPULATION[1:]]), PERCENT / 100, PERCENT)),
+    (FoodModel.diversity, array_models.FoodModel.diversity,
+     (PERCENT, _percent(), _percent(), _percent())),
+    (FoodModel.consumption, array_models.FoodModel.consumption, (POPULATION, SIGNED)),
+    (FoodModel.security, array_models.FoodModel.security, (PERCENT, SIGNED)),
+    (FoodModel.supplies, array_models.FoodModel.supplies,
+     (PERCENT * 10, SIGNED * 10, PERCENT / 100, _percent())),
+    (IndustryCoefficientModel.calculate, array_models.IndustryCoefficientModel.calculate,
+     (PERCENT + 1, _percent() + 1, _percent(), _percent())),
+    (CivilUsageModel.calculate, array_models.CivilUsageModel.calculate,
+     (PERCENT, _percent(), _percent())),
+    (CivilEfficiencyLogisticModel.calculate, array_models.CivilEfficiencyLogisticModel.calculate,
+     (PERCENT,)),
+    (IndustryOverproductionModel.calculate_change,
+     array_models.IndustryOverproductionModel.calculate_change,
+     (PERCENT, _percent(), SIGNED + 100, RNG.integers(0, 80, N))),
+    (OverproductionModel.tax_spotter, array_models.OverproductionModel.tax_spotter, (PERCENT,)),
+    (OverproductionModel.trade_income_factor,
+     array_models.OverproductionModel.trade_income_factor, (PERCENT,)),
+    (TradeModels.calculate_allegorization_trade_factor,
+     array_models.TradeModels.calculate_allegorization_trade_factor, (PERCENT,)),
+    (TradeModels.calculate_allegorization_economy_factor,
+     array_models.TradeModels.calculate_allegorization_economy_factor, (PERCENT,)),
+])
+def test_array_model_matches_scalar_model(scalar, vectorized, columns):
+    _assert_parity(scalar, vectorized, *columns)
+
+
+def test_multi_output_and_list_models_match_scalar_models():
+    tax_columns = (PERCENT, _percent(), SIGNED, _percent(), _percent(),
+                   PERCENT / 5, RNG.integers(0, 30, N), POPULATION)
+    _assert_parity(TaxIncomeModel.calculate, array_models.TaxIncomeModel.calculate, *tax_columns)
+
+    contentment = RNG.integers(-10, 100, N)
+    np.testing.assert_allclose(
+        np.array(array_models.ContentmentModel.coefficients(contentment)).T,
+        [ContentmentModel.coefficients(value) for value in contentment])
+
+    consumption_columns = (POPULATION, RNG.integers(0, 100, N), PERCENT / 50, SIGNED + 200, _percent())
+    np.testing.assert_allclose(
+        np.array(array_models.ConsumptionOfGoodsModel.calculate(*consumption_columns)).T,
+        [ConsumptionOfGoodsModel.calculate(*row) for row in zip(*consumption_columns)])
+
+    decline_columns = tuple(RNG.uniform(0, 60, N) for _ in range(13))
+    _assert_parity(SocietyDeclineModel.calculate, array_models.SocietyDeclineModel.calculate,
+                   *decline_columns)
+
+    np.testing.assert_allclose(
+        array_models.LogisticsModel.expected_wastes(GOV_WASTES),
+        [LogisticsModel.expected_wastes(list(row)) for row in GOV_WASTES])
+
+    mixes = (PERCENT, _percent(), _percent())
+    securities = [list(row) for row in SECURITIES]
+    _assert_parity(
+        AgricultureWastesModel.calculate, array_models.AgricultureWastesModel.calculate,
+        POPULATION / 100, securities, *mixes)
+    _assert_parity(
+        AgricultureDevelopmentModel.calculate, array_models.AgricultureDevelopmentModel.calculate,
+        securities, POPULATION / 100, POPULATION, PERCENT, SIGNED, *mixes)
+    _assert_parity(
+        AgricultureEfficiencyModel.calculate, array_models.AgricultureEfficiencyModel.calculate,
+        securities, PERCENT, *mixes, _percent() / 5, _percent() / 5, POPULATION / 100, POPULATION)
+    _assert_parity(
+        AgricultureDevelopmentModel.approximate_food_security,
+        array_models.AgricultureDevelopmentModel.approximate_food_security,
+        PERCENT, RNG.integers(0, 5, N), securities)
+    _assert_parity(
+        AgricultureDevelopmentModel.approximate_development,
+        array_models.AgricultureDevelopmentModel.approximate_development,
+        SIGNED + 150, securities)
+    _assert_parity(
+        FoodModel.income, array_models.FoodModel.income,
+        POPULATION / 100, securities, PERCENT, _percent() / 2, _percent() / 2, SIGNED)
+    _assert_parity(
+        IndustryIncomeModel.calculate, array_models.IndustryIncomeModel.calculate,
+        [list(row) for row in GOV_WASTES], PERCENT + 1, _percent(), _percent())
+
+
+def test_trade_income_matches_scalar_model():
+    potential = RNG.uniform(0, 60, N)
+    columns = (potential, potential * RNG.uniform(0.5, 2.0, N), PERCENT, RNG.uniform(0, 5, N),
+               _percent(), _percent(), _percent(), RNG.uniform(0, 3, N), _percent())
+    _assert_parity(TradeModels.calculate_trade_income,
+                   array_models.TradeModels.calculate_trade_income, *columns)
+
+
+def test_allegorization_rejects_out_of_range_percent():
+    with pytest.raises(ValueError, match="150"):
+        array_models.TradeModels.calculate_allegorization_trade_factor(np.array([10.0, 150.0]))
+
+
+def test_array_models_broadcast_scalars_against_arrays():
+    result = array_models.TaxIncomeModel.calculate(
+        np.array([[10.0], [20.0]]), 8.1, 105.0, 8.7, 27.0, 12.5, 13, POPULATION[:4])
+
+    assert result.shape == (2, 4)
+    assert result[1, 2] == pytest.approx(
+        TaxIncomeModel.calculate(20.0, 8.1, 105.0, 8.7, 27.0, 12.5, 13, POPULATION[2]))
+
+
+def _scalar_draws(scalar, columns, seed, **kwargs):
+    rng = np.random.default_rng(seed)
+    return np.array([scalar(*row, rng=rng, **kwargs) for row in zip(*columns)], dtype=float)
+
+
+def test_stochastic_models_consume_the_stream_like_a_scalar_loop():
+    med_waste = np.concatenate([[40.0, 40.0], RNG.uniform(0, 2000, N - 2)])
+    stability_columns = (np.concatenate([[60.0, 10.0], PERCENT[2:]]), PERCENT / 5, med_waste,
+                         np.concatenate([[1e7, 1e7], POPULATION[2:]]))
+    np.testing.assert_allclose(
+        array_models.StabilityModel.coefficient(*stability_columns,
+                                                rng=np.random.default_rng(3)),
+        _scalar_draws(StabilityModel.coefficient, stability_columns, 3))
+
+    chance_columns = (PERCENT, _percent(), RNG.uniform(1, 100, N))
+    np.testing.assert_allclose(
+        array_models.SuccessChanceModel.calculate(*chance_columns,
+                                                  rng=np.random.default_rng(5)),
+        _scalar_draws(SuccessChanceModel.calculate, chance_columns, 5))
+
+    underfeed_columns = (POPULATION, SIGNED * 100, PERCENT)
+    np.testing.assert_allclose(
+        array_models.FoodModel.underfeed(*underfeed_columns, rng=np.random.default_rng(9)),
+        _scalar_draws(FoodModel.underfeed, underfeed_columns, 9))
+
+
+def test_stochastic_models_take_a_size():
+    draws = array_models.StabilityModel.coefficient(
+        50.0, 3.0, 500.0, 1e7, rng=np.random.default_rng(0), size=1000)
+
+    assert draws.shape == (1000,)
+    assert draws.min() >= 0.92 and draws.max() <= 0.94
+    with pytest.raises(ValueError):
+        array_models.StabilityModel.coefficient(50.0, 3.0, 500.0, [1e7, 0.0])
+
+
+@pytest.mark.parametrize("estimator", list(IndustryEstimator))
+def test_industry_basic_stats_match_scalar_model(estimator):
+    columns = (PERCENT[:8] + 20, _percent()[:8] + 10, _percent()[:8])
+    for row in zip(*columns):
+        expected = IndustryBasicStatsModel.calculate(
+            *row, rng=np.random.default_rng(11), estimator=estimator)
+        got = array_models.IndustryBasicStatsModel.calculate(
+            *row, rng=np.random.default_rng(11), estimator=estimator)
+        np.testing.assert_allclose(got, expected, rtol=1e-9)
+
+    efficiency, _, _ = array_models.IndustryBasicStatsModel.calculate(
+        *columns, rng=np.random.default_rng(11), estimator=estimator)
+    assert efficiency.shape == (8,)
+
+
+def _random_forex_features(rows: int) -> ForexFeatureBatch:
+    rng = np.random.default_rng(18)
+    return ForexFeatureBatch(
+        stability=rng.integers(0, 120, rows),
+        income=rng.uniform(-3000, 3000, rows) * rng.choice([0.01, 1, 10], rows),
+        wastes=rng.uniform(0, 5000, rows),
+        budget=rng.uniform(-20000, 20000, rows),
+        trade_rank=rng.integers(1, 12, rows),
+        trade_efficiency=rng.uniform(0, 150, rows),
+        trade_overload=rng.uniform(0, 300, rows),
+        industry_efficiency=rng.uniform(0, 150, rows),
+        state_apparatus_efficiency=rng.integers(0, 150, rows),
+        contentment=rng.integers(-20, 120, rows),
+        poor_level=rng.uniform(0, 60, rows),
+        jobless_level=rng.uniform(0, 60, rows),
+        control_balance=rng.uniform(-100, 100, rows),
+    )
+
+
+def test_forex_course_batch_matches_scalar_model():
+    batch = _random_forex_features(20_000)
+    rows = [ForexFeatures(**{name: getattr(batch, name)[i] for name in FOREX_FIELDS})
+            for i in range(len(batch))]
+
+    np.testing.assert_allclose(
+        array_models.TradeModels.legacy_forex_score(batch),
+        [TradeModels.legacy_forex_score(row) for row in rows], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(
+        array_models.TradeModels.normalized_forex_score(batch),
+        [TradeModels.normalized_forex_score(row) for row in rows], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(
+        array_models.TradeModels.calculate_forex_course(batch),
+        [TradeModels.calculate_forex_course(row) for row in rows], rtol=0, atol=1e-9)
+
+
+def test_forex_feature_batch_round_trips_rows_and_broadcasts():
+    batch = _random_forex_features(5)
+    rows = [ForexFeatures(**{name: getattr(batch, name)[i] for name in FOREX_FIELDS})
+            for i in range(5)]
+
+    rebuilt = ForexFeatureBatch.from_features(rows)
+    assert len(rebuilt) == 5
+    for name in FOREX_FIELDS:
+        np.testing.assert_array_equal(getattr(rebuilt, name), getattr(batch, name))
+
+    columns = {name: getattr(batch, name)[0] for name in FOREX_FIELDS}
+    columns["budget"] = np.array([[0.0], [5000.0]])
+    assert ForexFeatureBatch(**columns).shape == (2, 1)
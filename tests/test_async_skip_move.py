@@ -0,0 +1,169 @@
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from modules.async_skip_move import run_turn_async, simulate_async
+from modules.credit_policy import FixedTargetCredit
+from modules.run_skip_move import BasicSkipMove
+from modules.skip_move_types import CreditRequest
+from stats.basic_stats import IndustrialStats
+from utils.user_io import InMemoryAsyncIO, TestIO
+
+from tests.factories import make_basic_bundle
+
+
+def _engine(seed: int, *, deficit: bool = False, io=None) -> BasicSkipMove:
+    b = make_basic_bundle(budget=0.0 if deficit else 1000.0)
+    if deficit:
+        b.economy.gov_wastes = [5000.0, 2000.0, 1000.0, 500.0]
+    engine = BasicSkipMove(
+        Economy=b.economy,
+        Industry=b.industry,
+        Agriculture=b.agriculture,
+        InnerPolitics=b.inner_politics,
+        io=io or TestIO(),
+        rng=np.random.default_rng(seed),
+    )
+    # Derived fields draw from the session's stream, not the thread's one
+    engine.recalculate_derived_fields()
+    return engine
+
+
+async def _player(io: InMemoryAsyncIO, answers, delay: float = 0.0):
+    for answer in answers:
+        await io.next_question()
+        await asyncio.sleep(delay)
+        await io.answer(answer)
+
+
+def test_async_turn_awaits_the_credit_decision():
+    async def session():
+        engine, io = _engine(1, deficit=True), InMemoryAsyncIO()
+        player = asyncio.create_task(_player(io, [True, 100.0]))
+        report = await run_turn_async(engine, io)
+        await player
+        return engine, io, report
+
+    engine, io, report = asyncio.run(session())
+
+    assert report.credit_taken and report.budget_final == 100.0
+    assert engine.Economy.current_budget == 100.0
+    assert io.printed[0].startswith("У меня нет денег")
+    assert any(m.startswith("Сумма кредита") for m in io.printed)
+    # The engine gets its own io back
+    assert isinstance(engine.io, TestIO)
+    # Same turn as the synchronous engine with the same answers
+    assert report == _engine(1, deficit=True, io=TestIO([True, 100.0])).run()
+
+
+def test_refused_credit_and_policies_need_no_player():
+    async def session(engine):
+        io = InMemoryAsyncIO()
+        player = asyncio.create_task(_player(io, [False]))
+        report = await run_turn_async(engine, io)
+        player.cancel()
+        return report, io
+
+    refused, io = asyncio.run(session(_engine(2, deficit=True)))
+    assert not refused.credit_taken and refused.budget_final < 0
+    assert io.questions.empty()
+
+    engine = _engine(2, deficit=True)
+    engine.credit_policy = FixedTargetCredit(50.0)
+    with_policy, io = asyncio.run(session(engine))
+    assert with_policy.budget_final == 50.0
+    assert io.printed == [f"Сумма кредита - {with_policy.credit_amount}"]
+
+
+def test_hundreds_of_sessions_share_one_loop():
+    sessions = 300
+
+    async def main():
+        rnd = random.Random(0)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            async def one(index):
+                engine, io = _engine(index, deficit=index % 2 == 0), \
+                    InMemoryAsyncIO()
+                answers = [True, float(index)] if index % 2 == 0 else []
+                player = asyncio.create_task(
+                    _player(io, answers, delay=rnd.random() * 0.01))
+                report = await run_turn_async(engine, io, executor=pool)
+                await player
+                return report
+
+            return await asyncio.gather(*(one(i) for i in range(sessions)))
+
+    reports = asyncio.run(main())
+
+    for index, report in enumerate(reports):
+        answers = [True, float(index)] if index % 2 == 0 else []
+        expected = _engine(index, deficit=index % 2 == 0,
+                           io=TestIO(answers)).run()
+        assert report == expected
+
+
+def test_cancelled_session_leaves_the_models_untouched():
+    async def session():
+        engine, io = _engine(3, deficit=True), InMemoryAsyncIO()
+        task = asyncio.create_task(run_turn_async(engine, io))
+        await io.next_question()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return engine
+
+    engine = asyncio.run(session())
+
+    assert engine.Economy.current_budget == 0.0
+    assert engine.last_report is None
+
+
+def test_abandoned_turn_restores_the_models_and_generators():
+    engine = _engine(3, deficit=True)
+    models = (engine.Economy, engine.Industry, engine.Agriculture,
+              engine.InnerPolitics)
+    expected = [stats.model_dump() for stats in models]
+    rng_state = engine.rng.bit_generator.state
+
+    turn = engine.play_turn()
+    assert isinstance(next(turn), CreditRequest)
+    turn.close()
+
+    assert [stats.model_dump() for stats in models] == expected
+    assert engine.rng.bit_generator.state == rng_state
+    # Played again, the turn is the one it would have been
+    engine.io = TestIO([False])
+    assert engine.run() == _engine(3, deficit=True,
+                                   io=TestIO([False])).run()
+
+
+def test_rollback_undoes_derived_field_draws():
+    data = make_basic_bundle().industry.model_dump(exclude_none=True)
+    rng = np.random.default_rng(0)
+    industry = IndustrialStats.model_validate(data, context={"rng": rng})
+    state = rng.bit_generator.state
+    checkpoint = industry.checkpoint()
+
+    industry.civil_efficiency
+    industry.usages[0] += 10
+    industry.logistic = 99.0
+    industry.rollback(checkpoint)
+
+    assert "civil_efficiency" not in vars(industry)
+    assert rng.bit_generator.state == state
+    assert industry.model_dump() == IndustrialStats.model_validate(
+        data, context={"rng": np.random.default_rng(0)}).model_dump()
+
+
+def test_simulate_async_matches_simulate():
+    async def collect():
+        engine = _engine(4)
+        return [report async for report in simulate_async(
+            engine, InMemoryAsyncIO(), 3)]
+
+    reports = asyncio.run(collect())
+
+    assert reports == list(_engine(4).simulate(3))
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from modules.batch_skip_move import (
+    REPORT_ATOL,
+    REPORT_RTOL,
+    BatchSkipMove,
+    StatsColumns,
+)
+from modules.run_skip_move import BasicSkipMove
+from modules.run_start_skip import GameStats
+from utils.user_io import TestIO
+
+from tests.factories import make_basic_bundle
+
+
+def _variant(**overrides):
+    b = make_basic_bundle(budget=overrides.pop("budget", 1000.0))
+    for key, value in overrides.items():
+        domain, name = key.split("__")
+        setattr(getattr(b, domain), name, value)
+    for stats in (b.economy, b.industry, b.agriculture, b.inner_politics):
+        stats.recalculate_derived_fields()
+    return GameStats(
+        Economy=b.economy,
+        Industry=b.industry,
+        Agriculture=b.agriculture,
+        InnerPolitics=b.inner_politics,
+    )
+
+
+VARIANTS = [
+    {},
+    {"budget": -500.0},
+    {"inner_politics__salt_security": 120},
+    {"inner_politics__salt_security": 20},
+    {"inner_politics__control": [50, 45, 0, 0]},
+    {"economy__allegorization": 45.0},
+    {"economy__stability": 95, "inner_politics__state_apparatus_size": 10},
+    {"economy__gov_wastes": [10.0, 500.0, 30.0, 10.0]},
+    {"economy__population_count": 40_000_000},
+    {"economy__trade_usage": 200, "industry__tvr2": 30},
+    {"agriculture__securities": [20.0, 20.0, 20.0],
+     "agriculture__food_supplies": 5000.0},
+    {"inner_politics__education_level": 90.0},
+]
+
+
+def _copy(stats: GameStats) -> GameStats:
+    return GameStats(
+        Economy=stats.Economy.model_copy(deep=True),
+        Industry=stats.Industry.model_copy(deep=True),
+        Agriculture=stats.Agriculture.model_copy(deep=True),
+        InnerPolitics=stats.InnerPolitics.model_copy(deep=True),
+    )
+
+
+def _run_scalar(stats: GameStats):
+    engine = BasicSkipMove(
+        Economy=stats.Economy,
+        Industry=stats.Industry,
+        Agriculture=stats.Agriculture,
+        InnerPolitics=stats.InnerPolitics,
+        io=TestIO(inputs=[False]),
+    )
+    return engine.run()
+
+
+def test_batch_matches_scalar_engine_for_every_row():
+    scalar_states = [_variant(**v) for v in VARIANTS]
+    # Derived industry fields are sampled, so both engines start from copies
+    # of the very same models.
+    batch_engine = BatchSkipMove.from_stats(
+        [_copy(stats) for stats in scalar_states],
+        rng=np.random.default_rng(0),
+    )
+    batch_report = batch_engine.run()
+    scalar_reports = [_run_scalar(stats) for stats in scalar_states]
+
+    assert len(batch_report) == len(VARIANTS)
+    for index, expected in enumerate(scalar_reports):
+        got = batch_report.row(index)
+        for name, value in vars(expected).items():
+            if name in ("mode", "credit_taken", "credit_amount",
+                        "budget_final", "income_factors"):
+                continue
+            assert got.__dict__[name] == pytest.approx(
+                value, rel=REPORT_RTOL, abs=REPORT_ATOL), (index, name)
+        assert got.budget_final == pytest.approx(got.budget_after_boost)
+        assert got.credit_taken is False
+
+    # Turn state is written back into the columns just like into the models.
+    for index, stats in enumerate(scalar_states):
+        for domain in ("Economy", "Industry", "Agriculture"):
+            row = getattr(batch_engine, domain).row(index)
+            for name, value in vars(getattr(stats, domain)).items():
+                if name == "income" or value is None:
+                    continue
+                assert row[name] == pytest.approx(
+                    value, rel=REPORT_RTOL, abs=REPORT_ATOL), (domain, name)
+        inner = batch_engine.InnerPolitics.row(index)
+        for name in ("education_level", "society_decline",
+                     "military_equipment"):
+            assert inner[name] == pytest.approx(
+                getattr(stats.InnerPolitics, name),
+                rel=REPORT_RTOL, abs=REPORT_ATOL), name
+
+
+def test_stats_columns_pad_lists_and_check_required_columns():
+    stats = _variant()
+    columns = StatsColumns.from_models([stats.Economy, stats.Economy])
+    assert columns.gov_wastes.shape == (2, 4)
+    assert columns.current_budget.tolist() == [1000.0, 1000.0]
+
+    del columns.gov_wastes
+    with pytest.raises(ValueError, match="gov_wastes"):
+        BatchSkipMove(
+            Economy=columns,
+            Industry=StatsColumns.from_models([stats.Industry] * 2),
+            Agriculture=StatsColumns.from_models([stats.Agriculture] * 2),
+            InnerPolitics=StatsColumns.from_models([stats.InnerPolitics] * 2),
+        )
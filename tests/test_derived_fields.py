@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from stats.basic_stats import EconomyStats, IndustrialStats, \
+    InnerPoliticsStats
+from stats.derived_fields import DerivedFields, DerivedGraph
+
+from tests.factories import make_atterium_bundle, make_basic_bundle, \
+    make_isf_bundle
+
+
+class _RecordingStats:
+    """Records which attributes `compute` reads from a real model."""
+
+    def __init__(self, stats):
+        self._stats = stats
+        self.read = set()
+
+    def __getattr__(self, name):
+        self.read.add(name)
+        return getattr(self._stats, name)
+
+
+@pytest.mark.parametrize("stats", [
+    make_basic_bundle().economy, make_basic_bundle().industry,
+    make_basic_bundle().inner_politics, make_atterium_bundle().economy,
+    make_atterium_bundle().inner_politics, make_isf_bundle().economy,
+    make_isf_bundle().inner_politics,
+], ids=lambda stats: type(stats).__name__)
+def test_declared_inputs_cover_everything_compute_reads(stats):
+    for node in stats._get_derived_fields():
+        proxy = _RecordingStats(stats)
+        values = node.compute(proxy, np.random.default_rng(0))
+        assert proxy.read == set(node.inputs)
+        assert len(values) == len(node.outputs)
+        assert set(node.outputs) <= set(type(stats).model_fields)
+
+
+def test_derived_fields_are_computed_on_first_access_only():
+    data = make_basic_bundle().industry.model_dump(exclude_none=True)
+    industry = IndustrialStats(**data)
+
+    assert "civil_efficiency" not in vars(industry)
+    first = industry.civil_efficiency
+    assert {"civil_usage", "max_potential", "expected_wastes"} <= \
+        set(vars(industry))
+    assert industry.civil_efficiency == first
+
+
+def test_assigning_an_input_invalidates_its_group_only():
+    economy = make_basic_bundle().economy
+    assert economy.income is not None and economy.trade_potential is not None
+
+    economy.money_income = 1.0
+    assert "income" in vars(economy)
+
+    economy.trade_rank += 1
+    assert "trade_potential" not in vars(economy)
+    assert economy.trade_potential == EconomyStats(
+        **economy.model_dump()).trade_potential
+
+
+def test_explicit_assignment_of_a_stale_output_wins():
+    data = make_basic_bundle().inner_politics.model_dump(exclude_none=True)
+    politics = InnerPoliticsStats(**data)
+
+    politics.success_chance = 42
+    assert politics.success_chance == 42
+    assert politics.society_decline is not None
+
+
+def test_dump_copy_and_equality_see_derived_fields():
+    data = make_basic_bundle().industry.model_dump(exclude_none=True)
+    industry = IndustrialStats(**data)
+
+    copied = industry.model_copy(deep=True)
+    assert "civil_efficiency" not in vars(copied)
+    assert industry.model_dump()["civil_efficiency"] is not None
+
+    updated = industry.model_copy(update={"logistic": 10.0})
+    assert "civil_efficiency" not in vars(updated)
+    # computed values are copied, not drawn again
+    assert industry.model_copy(deep=True) == industry
+
+
+def test_iteration_and_repr_see_stale_derived_fields():
+    industry = make_basic_bundle().industry
+    industry.civil_usage = 5
+
+    assert {"industry_coefficient", "civil_efficiency", "max_potential",
+            "expected_wastes"} <= dict(industry).keys()
+    industry.civil_usage = 6
+    assert "civil_efficiency=" in repr(industry)
+
+
+def test_equality_leaves_stale_derived_fields_alone():
+    data = make_basic_bundle().industry.model_dump(exclude_none=True)
+    rng = np.random.default_rng(0)
+    first = IndustrialStats.model_validate(data, context={"rng": rng})
+    second = IndustrialStats.model_validate(data, context={"rng": rng})
+    state = rng.bit_generator.state
+
+    assert first == second
+    assert "civil_efficiency" not in vars(first)
+    assert "civil_efficiency" not in vars(second)
+    assert rng.bit_generator.state == state
+
+    first.civil_efficiency
+    assert first == second
+    second.civil_efficiency = first.civil_efficiency + 1
+    assert first != second
+    second.logistic += 1
+    assert first != second
+
+
+@pytest.mark.parametrize("stats", [
+    make_atterium_bundle().inner_politics, make_isf_bundle().inner_politics,
+], ids=lambda stats: type(stats).__name__)
+def test_explicit_recalculation_is_eager(stats):
+    fresh = type(stats)(**stats.model_dump(exclude_none=True))
+    assert "success_chance" not in vars(fresh)
+
+    fresh.recalculate_derived_fields(rng=np.random.default_rng(1))
+    assert {"success_chance", "society_decline"} <= set(vars(fresh))
+
+
+def test_graph_orders_nodes_and_finds_downstream_fields():
+    graph = IndustrialStats._get_derived_graph()
+    order = graph.outputs(graph.nodes)
+    assert order.index("civil_usage") < order.index("civil_efficiency")
+    assert order.index("industry_coefficient") < order.index("civil_efficiency")
+
+    assert graph.outputs(graph.downstream(["logistic"])) == (
+        "civil_efficiency", "max_potential", "expected_wastes")
+    assert graph.outputs(graph.downstream(["usages"])) == (
+        "industry_coefficient", "civil_efficiency", "max_potential",
+        "expected_wastes")
+    assert graph.downstream(["industry_income"]) == ()
+
+
+def test_graph_rejects_cycles():
+    first = DerivedFields(outputs=("a",), inputs=("b",),
+                          compute=lambda stats, rng: (0,))
+    second = DerivedFields(outputs=("b",), inputs=("a",),
+                           compute=lambda stats, rng: (0,))
+    with pytest.raises(ValueError):
+        DerivedGraph([first, second])
+
+
+def test_changed_recalculation_reports_only_downstream_fields():
+    politics = make_basic_bundle().inner_politics
+    assert politics.recalculate_derived_fields(changed=["contentment"]) == \
+        ("society_decline",)
+    assert politics.recalculate_derived_fields(changed=["knowledge_level"]) \
+        == ("success_chance",)
+    assert set(politics.recalculate_derived_fields()) == {
+        "success_chance", "society_decline"}
+
+    economy = make_basic_bundle().economy
+    assert economy.recalculate_derived_fields(changed=["money_income"]) == ()
+
+
+def test_assigned_derived_value_survives_input_changes_until_recalculated():
+    economy = make_basic_bundle().economy
+    boosted = economy.income * 2
+    economy.income = boosted
+    economy.population_count += 1_000
+    assert economy.income == boosted
+
+    economy.recalculate_derived_fields()
+    assert economy.income != boosted
+
+
+def test_upstream_assignment_drops_downstream_fields():
+    industry = make_basic_bundle().industry
+    industry.civil_efficiency
+    industry.tvr1 = max(industry.tvr1 - 10, 0)
+    assert "civil_usage" not in vars(industry)
+    assert "civil_efficiency" not in vars(industry)
+    assert "industry_coefficient" in vars(industry)
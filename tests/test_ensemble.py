@@ -0,0 +1,40 @@
+from modules.ensemble import numeric_report_fields, run_ensemble
+from modules.mode_spec import GameMode
+from modules.run_start_skip import GameStats
+
+from tests.factories import make_basic_bundle, make_isf_bundle
+
+
+def _stats(bundle) -> GameStats:
+    return GameStats(
+        Economy=bundle.economy,
+        Industry=bundle.industry,
+        Agriculture=bundle.agriculture,
+        InnerPolitics=bundle.inner_politics,
+    )
+
+
+def test_ensemble_is_reproducible_regardless_of_worker_count():
+    stats = _stats(make_basic_bundle())
+    budget_before = stats.Economy.current_budget
+
+    inline = run_ensemble(stats, replicas=12, master_seed=7, workers=1)
+    pooled = run_ensemble(stats, replicas=12, master_seed=7, workers=3)
+
+    assert inline.bands == pooled.bands
+    assert inline.replicas == 12
+    # Replicas never touch the caller's stats
+    assert stats.Economy.current_budget == budget_before
+
+    other = run_ensemble(stats, replicas=12, master_seed=8, workers=1)
+    assert other.bands != inline.bands
+
+
+def test_ensemble_bands_cover_every_numeric_field():
+    result = run_ensemble(_stats(make_isf_bundle()), mode=GameMode.ISF,
+                          replicas=20, master_seed=1, workers=1)
+
+    assert set(result.bands) == set(numeric_report_fields())
+    for band in result.bands.values():
+        assert band.p5 <= band.p50 <= band.p95
+    assert result.bands["budget_final"].p5 < result.bands["budget_final"].p95
@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Cold start of the interactive entry point, up to the mode menu. Measured
+# at about 60 ms (300 ms with eager mode imports); the budget leaves room
+# for slow CI machines.
+STARTUP_BUDGET_MS = 200
+
+
+def _import_profile(statement: str) -> dict[str, int]:
+    """Cumulative microseconds of every module a fresh interpreter imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+        env={**os.environ, "WPI_LOG_TO_FILE": "0", "PYTHONPATH": str(ROOT)},
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def _loaded(profile, *prefixes: str) -> list[str]:
+    return [name for name in profile
+            if any(name == p or name.startswith(p + ".") for p in prefixes)]
+
+
+def test_mode_menu_loads_no_models():
+    profile = _import_profile("import modules.run_main")
+
+    assert _loaded(profile, "numpy", "pydantic", "asyncio", "stats",
+                   "functions") == []
+
+
+def test_modes_load_on_first_use():
+    profile = _import_profile("import modules.run_skip_move")
+
+    assert _loaded(profile, "asyncio", "stats.basic_stats",
+                   "stats.atterium_stats", "stats.isf_stats",
+                   "stats.pretty_specs_parts",
+                   "functions.basic_in_move_functions") == []
+
+    profile = _import_profile(
+        "from modules.mode_spec import ModeRegistry; "
+        "ModeRegistry.get('isf').stats_config")
+
+    assert _loaded(profile, "stats.isf_stats")
+    # ISF models extend the basic ones, but the Atterium models are not
+    # loaded and layouts wait for the first parse or render
+    assert _loaded(profile, "stats.atterium_stats",
+                   "functions.atterium_in_move_functions",
+                   "stats.pretty_specs_parts.economy") == []
+
+
+def test_startup_import_time_budget():
+    best = min(_import_profile("import modules.run_main")["modules.run_main"]
+               for _ in range(3))
+
+    assert best / 1000 < STARTUP_BUDGET_MS
+
+
+def test_log_directory_waits_for_the_first_record(tmp_path):
+    log_dir = tmp_path / "logs"
+    script = (
+        "from utils import logger_manager\n"
+        "manager = logger_manager._logger_manager\n"
+        "print(manager.log_dir)\n"
+        "logger_manager.get_logger('test').warning('x')\n"
+        "print(manager.log_dir)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, capture_output=True,
+        text=True, check=True,
+        env={**os.environ, "WPI_LOG_TO_FILE": "1", "WPI_LOG_DIR": str(log_dir),
+             "PYTHONPATH": str(ROOT)})
+
+    assert result.stdout.split() == ["None", str(log_dir)]
+    assert len(list(log_dir.glob("app_*.log"))) == 1
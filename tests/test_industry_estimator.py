@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from functions.industry_models import (
+    IndustryBasicStatsModel,
+    IndustryEstimator,
+    use_industry_estimator,
+)
+from stats.basic_stats import IndustrialStats
+
+from tests.factories import make_basic_bundle
+
+
+ARGS = (55.0, 70.0, 60.0)  # industry_coefficient, civil_usage, standardization
+
+
+def _samples(estimator: IndustryEstimator, runs: int = 300) -> np.ndarray:
+    rng = np.random.default_rng(42)
+    return np.array([
+        IndustryBasicStatsModel.calculate(*ARGS, rng=rng, estimator=estimator)
+        for _ in range(runs)
+    ])
+
+
+def test_numpy_estimator_is_distributionally_equivalent_to_legacy():
+    legacy = _samples(IndustryEstimator.LEGACY)
+    vectorized = _samples(IndustryEstimator.NUMPY)
+
+    # efficiency: uniform around the payoff
+    assert vectorized[:, 0].mean() == pytest.approx(legacy[:, 0].mean(), abs=0.05)
+    assert vectorized[:, 0].std() == pytest.approx(legacy[:, 0].std(), rel=0.15)
+    # max potential is deterministic
+    np.testing.assert_allclose(vectorized[:, 1], legacy[:, 1])
+    # expected wastes = 0.3 * payoff
+    assert vectorized[:, 2].mean() == pytest.approx(legacy[:, 2].mean(), rel=1e-3)
+
+
+def test_expected_estimator_matches_sampling_means():
+    legacy = _samples(IndustryEstimator.LEGACY)
+    efficiency, max_potential, expected_wastes = IndustryBasicStatsModel.calculate(
+        *ARGS, estimator=IndustryEstimator.EXPECTED)
+
+    assert efficiency == pytest.approx(legacy[:, 0].mean(), abs=0.05)
+    assert max_potential == pytest.approx(legacy[0, 1])
+    assert expected_wastes == pytest.approx(legacy[:, 2].mean(), rel=1e-3)
+
+
+def test_estimator_is_selected_per_block_and_bounds_the_halving_loop():
+    data = make_basic_bundle().industry.model_dump(exclude_none=True)
+    # Derived fields are computed on first access, inside the block
+    with use_industry_estimator("expected"):
+        first = IndustrialStats(**data)
+        second = IndustrialStats(**data)
+        assert first.civil_efficiency == second.civil_efficiency
+
+    # A non-positive payoff used to halve the dispersion forever
+    efficiency, _, _ = IndustryBasicStatsModel.calculate(
+        -50.0, 1.0, 0.0, estimator=IndustryEstimator.EXPECTED)
+    assert efficiency < 0
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from stats.label_matcher import LabelMatcher
+from stats.pretty import (
+    _compiled_matcher,
+    _find_matches_in_line,
+    _normalize_lines,
+    _parse_specs,
+    _token_variants,
+)
+from stats.pretty_layouts import LAYOUTS_BY_CLASS
+
+from tests.factories import make_atterium_bundle, make_basic_bundle, \
+    make_isf_bundle
+
+
+LAYOUTS = {id(layout): layout for layout in LAYOUTS_BY_CLASS.values()}
+
+
+def _rendered_lines() -> list[str]:
+    lines = []
+    for bundle in (make_basic_bundle(), make_atterium_bundle(),
+                   make_isf_bundle()):
+        for stats in (bundle.economy, bundle.industry, bundle.agriculture,
+                      bundle.inner_politics):
+            lines += _normalize_lines(stats.debug())
+    return lines
+
+
+def _fuzz_lines(layout, count: int, seed: int) -> list[str]:
+    rnd = random.Random(seed)
+    labels = [label for spec in layout.fields.values()
+              for label in spec.all_labels()]
+    lines = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rnd.randint(1, 6)):
+            label = rnd.choice(labels)
+            if rnd.random() < 0.3:
+                # truncated / glued labels produce overlaps
+                label = label[rnd.randint(0, len(label) // 2):]
+            parts.append(rnd.choice(_token_variants(label)))
+            parts.append(rnd.choice(["12", "-3.5%", "", "x ", "1 (2)"]))
+        lines.append(rnd.choice(["", " "]).join(parts).strip())
+    return lines
+
+
+@pytest.mark.parametrize("layout", list(LAYOUTS.values()))
+def test_compiled_matcher_matches_reference(layout):
+    specs = _parse_specs(layout)
+    matcher = _compiled_matcher(layout)
+
+    for line in _rendered_lines() + _fuzz_lines(layout, 300, seed=len(specs)):
+        assert matcher.find(line) == _find_matches_in_line(line, specs), line
+
+
+def test_matcher_prefers_earliest_then_longest_and_drops_overlaps():
+    matcher = LabelMatcher(["short", "long", "other"],
+                           [["ab"], ["abc"], ["bcd"]])
+    assert matcher.find("xxabcd") == [(2, 5, "long")]
+    assert matcher.find("bcd ab") == [(0, 3, "other"), (4, 6, "short")]
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import random
-
+from functions.rng import seed_default_rng
 from functions.basic_in_move_functions import BasicInMoveFunctions
 from functions.basic_stats_functions import BasicStatsFunctions
 from functions.config_models import EdenModel
@@ -46,7 +45,7 @@ def test_eden_model_maps_legacy_numbers_into_valid_basic_bundle():
 
 
 def test_skip_move_runs_for_eden_model():
-    random.seed(7)
+    seed_default_rng(7)
     bundle = EdenModel.build()
 
     engine = BasicSkipMove(
@@ -0,0 +1,138 @@
+import numpy as np
+import pytest
+
+from modules.mode_spec import GameMode, ModeRegistry
+from modules.optimizer import (
+    Constraint,
+    OptimizerMethod,
+    Variable,
+    cma_es,
+    main,
+    nelder_mead,
+    optimize,
+)
+from modules.run_start_skip import GameStats, InputSection, \
+    parse_skipper_sections
+
+from tests.factories import make_basic_bundle, make_isf_bundle
+
+
+def _stats(bundle) -> GameStats:
+    return GameStats(
+        Economy=bundle.economy,
+        Industry=bundle.industry,
+        Agriculture=bundle.agriculture,
+        InnerPolitics=bundle.inner_politics,
+    )
+
+
+def _shifted_sphere(points: np.ndarray) -> np.ndarray:
+    return np.sum((points - np.array([0.2, 0.7, 0.4])) ** 2, axis=1)
+
+
+def test_nelder_mead_finds_the_minimum_in_the_unit_cube():
+    x, value = nelder_mead(_shifted_sphere, np.full(3, 0.9),
+                           max_evaluations=400)
+
+    np.testing.assert_allclose(x, [0.2, 0.7, 0.4], atol=1e-3)
+    assert value < 1e-6
+
+
+def test_cma_es_finds_the_minimum_and_respects_the_cube():
+    calls = []
+
+    def objective(points):
+        calls.append(points.copy())
+        return _shifted_sphere(points) + np.sum(points[:, :1], axis=1) * 2
+
+    x, value = cma_es(objective, np.full(3, 0.5), max_evaluations=600,
+                      rng=np.random.default_rng(0))
+
+    # The linear term pushes the first coordinate onto the cube face
+    np.testing.assert_allclose(x, [0.0, 0.7, 0.4], atol=1e-2)
+    assert all(((p >= 0) & (p <= 1)).all() for p in calls)
+    assert sum(len(p) for p in calls) <= 600
+
+
+@pytest.mark.parametrize("method", list(OptimizerMethod))
+def test_optimizer_meets_constraints_at_the_cheapest_spend(method):
+    stats = _stats(make_basic_bundle())
+    variables = [Variable.parse("gov_wastes[0]=0:1000"),
+                 Variable.parse("war_wastes=0:500")]
+    constraints = [Constraint.parse("spend >= 300"),
+                   Constraint.parse("Agriculture.food_security>=0")]
+
+    result = optimize(stats, variables, constraints=constraints, method=method,
+                      max_evaluations=250, replicas=2, seed=4, workers=1)
+
+    assert list(result.values) == ["Economy.gov_wastes[0]",
+                                   "Economy.war_wastes[0]",
+                                   "Economy.war_wastes[1]",
+                                   "Economy.war_wastes[2]"]
+    assert result.feasible
+    assert 300 <= result.metrics["spend"] < 330
+    assert result.metrics["Agriculture.food_security"] >= 0
+    assert result.history == sorted(result.history, reverse=True)
+    # The caller's stats are left alone
+    assert stats.Economy.gov_wastes == make_basic_bundle().economy.gov_wastes
+
+
+def test_common_random_numbers_make_runs_reproducible_and_cached():
+    stats = _stats(make_basic_bundle())
+    variables = [Variable.parse("universal_tax=5:40")]
+    constraints = [Constraint.parse("stability_after>=10")]
+
+    inline = optimize(stats, variables, constraints=constraints,
+                      max_evaluations=60, replicas=3, seed=9, workers=1)
+    pooled = optimize(stats, variables, constraints=constraints,
+                      max_evaluations=60, replicas=3, seed=9, workers=2)
+
+    assert inline.values == pooled.values
+    assert inline.metrics == pooled.metrics
+    # Samples clipped to the upper tax bound are served from the cache
+    assert inline.cache_hits > 0
+
+
+def test_optimizer_runs_other_modes_and_reports_infeasibility():
+    result = optimize(_stats(make_isf_bundle()),
+                      [Variable.parse("universal_tax=5:30")],
+                      mode=GameMode.ISF,
+                      constraints=[Constraint.parse("spend<=-1")],
+                      max_evaluations=30, replicas=1, seed=1, workers=1)
+
+    assert not result.feasible
+    assert result.values["Economy.universal_tax"] == 5
+
+
+@pytest.mark.parametrize("factory", [
+    lambda: Variable.parse("gov_wastes"),
+    lambda: Variable.parse("gov_wastes=5:1"),
+    lambda: Constraint.parse("stability_after > 80"),
+    lambda: Constraint.parse("stability_after>=many"),
+    lambda: optimize(_stats(make_basic_bundle()),
+                     [Variable.parse("no_such_field=0:1")], workers=1),
+    lambda: optimize(_stats(make_basic_bundle()),
+                     [Variable.parse("universal_tax=0:1")],
+                     constraints=[Constraint.parse("nothing>=1")], workers=1),
+])
+def test_malformed_problems_are_rejected(factory):
+    with pytest.raises(ValueError):
+        factory()
+
+
+def test_cli_writes_the_best_stats(tmp_path):
+    source = tmp_path / "country.txt"
+    source.write_text(InputSection.render_text(_stats(make_basic_bundle())),
+                      encoding="utf-8")
+    output = tmp_path / "best.txt"
+
+    code = main(["--input", str(source), "--var", "med_wastes[0]=0:300",
+                 "--constraint", "spend>=100", "--evaluations", "80",
+                 "--replicas", "1", "--workers", "1", "--seed", "2",
+                 "--output", str(output)])
+
+    assert code == 0
+    best = parse_skipper_sections(
+        ModeRegistry.get(GameMode.BASIC).stats_config,
+        InputSection.split_text(output.read_text(encoding="utf-8")))
+    assert 100 <= best.Economy.med_wastes[0] < 110
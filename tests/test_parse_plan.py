@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from functions.rng import seed_default_rng
+from stats.basic_stats import EconomyStats, IndustrialStats
+from stats.isf_stats import IsfEconomyStats
+from stats.pretty import _compiled_plan, compile_parse_plan, parse_with_plan
+from stats.schemas.economy_schema import build_field_groups, build_field_names
+
+from tests.factories import make_basic_bundle
+
+
+def test_parse_plan_is_memoized_per_class():
+    plan = EconomyStats._get_parse_plan()
+    assert EconomyStats._get_parse_plan() is plan
+    assert IsfEconomyStats._get_parse_plan() is not plan
+    assert plan.layout is EconomyStats._get_pretty_layout()
+    assert _compiled_plan(plan.layout, EconomyStats.model_fields) \
+        is _compiled_plan(plan.layout, EconomyStats.model_fields)
+
+
+def test_parse_plan_is_immutable():
+    plan = IndustrialStats._get_parse_plan()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        plan.specs = ()
+    with pytest.raises(TypeError):
+        plan.casters["processing_production"] = float
+    with pytest.raises(TypeError):
+        plan.field_names["x"] = "y"
+
+
+def test_parse_plan_holds_merged_schemas():
+    plan = EconomyStats._get_parse_plan()
+    assert dict(plan.field_names) == build_field_names("basic")
+    assert {group: list(names) for group, names in plan.field_groups.items()} \
+        == build_field_groups("basic")
+
+
+def test_schema_builders_return_fresh_copies():
+    groups = build_field_groups("basic")
+    first_group = next(iter(groups))
+    groups[first_group].append("garbage")
+    build_field_names("basic")["population_count"] = "garbage"
+
+    assert "garbage" not in build_field_groups("basic")[first_group]
+    assert build_field_names("basic")["population_count"] != "garbage"
+
+
+def test_parse_with_plan_does_not_touch_caller_defaults():
+    seed_default_rng(3)
+    industry = make_basic_bundle().industry
+    plan = compile_parse_plan(industry._get_pretty_layout(),
+                              IndustrialStats.model_fields)
+    list_fields = [name for name, _ in plan.list_lengths]
+    assert list_fields
+
+    defaults = {name: [7.0] * 10 for name in list_fields}
+    parsed = parse_with_plan(industry.debug(), plan, defaults)
+
+    for name in list_fields:
+        assert defaults[name] == [7.0] * 10
+        assert parsed[name] is not defaults[name]
+
+
+def test_from_stats_text_roundtrip_uses_plan():
+    seed_default_rng(5)
+    economy = make_basic_bundle(budget=1000.0).economy
+    economy.prev_budget = economy.current_budget - 10.0
+
+    restored = EconomyStats.from_stats_text(economy.debug())
+    again = EconomyStats.from_stats_text(economy.debug())
+
+    assert restored.population_count == economy.population_count
+    assert restored.current_budget == pytest.approx(economy.current_budget,
+                                                    abs=0.05)
+    assert again.model_dump() == restored.model_dump()
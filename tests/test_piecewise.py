@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from functions.agriculture_models import AdditionalWastesModel, \
+    WorkersCountModel
+from functions.economy_models import PopulationGrowthModel
+from functions.piecewise import (
+    LinearInterpolation,
+    PiecewiseFunction,
+    StepFunction,
+    strictly_above,
+)
+from functions.society_models import StabilityModel
+
+
+GRID = np.concatenate([np.linspace(-5, 15, 401), [math.nan, math.inf, -math.inf]])
+
+
+@pytest.mark.parametrize("closed, expected", [
+    ("left", ["low", "mid", "high", "high"]),
+    ("right", ["low", "low", "mid", "high"]),
+])
+def test_step_function_breakpoints_follow_closed_side(closed, expected):
+    table = StepFunction(bounds=(0, 10), values=("low", "mid", "high"), closed=closed)
+
+    assert [table(x) for x in (-1, 0, 10, 11)] == expected
+
+
+def test_step_function_evaluators_agree_and_send_nan_to_first_interval():
+    table = StepFunction(bounds=(0, strictly_above(5), 10), values=(1.0, 2.0, 3.0, 4.0))
+
+    assert table(5) == 2.0 and table(5.000001) == 3.0
+    assert table(math.nan) == 1.0
+    np.testing.assert_array_equal(table.evaluate(GRID), [table(x) for x in GRID])
+
+
+def test_step_function_with_tuple_values_adds_an_axis():
+    table = StepFunction(bounds=(1,), values=((0.1, 0.2), (0.3, 0.4)))
+
+    np.testing.assert_array_equal(table.evaluate([0, 2]), [[0.1, 0.2], [0.3, 0.4]])
+
+
+def test_piecewise_function_runs_the_same_pieces_on_arrays():
+    table = PiecewiseFunction(
+        bounds=(strictly_above(0), 5),
+        pieces=(-1, lambda x: x / 3, lambda x: 2 - x * 0.7),
+    )
+
+    np.testing.assert_array_equal(table.evaluate(GRID), [table(x) for x in GRID])
+    assert table(0) == -1
+
+
+def test_linear_interpolation_is_flat_past_the_end_and_undefined_below():
+    table = LinearInterpolation(points=((0, 10), (10, 30), (20, 20)))
+
+    assert table(5) == 20.0
+    assert table(100) == 20
+    assert table(-1) is None and table(math.nan) is None
+    expected = [math.nan if table(x) is None else table(x) for x in GRID]
+    np.testing.assert_array_equal(table.evaluate(GRID), expected)
+
+
+@pytest.mark.parametrize("factory", [
+    lambda: StepFunction(bounds=(2, 1), values=(0, 1, 2)),
+    lambda: StepFunction(bounds=(1, 2), values=(0, 1)),
+    lambda: StepFunction(bounds=(1,), values=(0, 1), closed="both"),
+    lambda: PiecewiseFunction(bounds=(1,), pieces=(0,)),
+    lambda: LinearInterpolation(points=((0, 1),)),
+])
+def test_malformed_tables_are_rejected(factory):
+    with pytest.raises(ValueError):
+        factory()
+
+
+# Outputs of the if/elif versions the models replaced
+
+@pytest.mark.parametrize("population, expected", [
+    (8_000_000, 78960.0),
+    (8_000_001, 70160.00877),
+])
+def test_population_growth_matches_the_old_chain(population, expected):
+    assert PopulationGrowthModel.calculate(population) == expected
+
+
+@pytest.mark.parametrize("security, expected", [(0, 3), (20, 0.5), (100, 2)])
+def test_additional_wastes_match_the_old_rules(security, expected):
+    result = AdditionalWastesModel.calculate(security)
+
+    assert result == expected and type(result) is type(expected)
+
+
+@pytest.mark.parametrize("population, expected", [
+    (1_000_000, 2250),
+    (500_000_000, 1_125_000),
+    (-1, 0),
+])
+def test_workers_count_matches_the_old_interpolation(population, expected):
+    result = WorkersCountModel.calculate(population, 0.5, 10)
+
+    assert result == expected and type(result) is int
+
+
+@pytest.mark.parametrize("poor, med_waste, population, expected, draws", [
+    (30, 5, 1_000_000, 0.164, 1),
+    (30, 10, 1_000_000, 0.67, 1),
+    (30, 20, 1_000_000, 0.765, 1),
+    (30, 30, 1_000_000, 0.845, 1),
+    (30, 40, 1_000_000, 0.899, 1),
+    (30, 45, 1_000_000, 0.933, 1),
+    (30, 70, 1_000_000, 0.982, 1),
+    (30, 80, 1_000_000, 1.1, 1),
+    (30, math.nan, 1_000_000, 0.502, 1),
+    # The 0.01 fallback does not touch the generator
+    (60, math.nan, 1_000_000, 0.01, 0),
+    (60, 100, 100_000_000, 0.01, 0),
+    (50, 100, 100_000_000, 0.502, 1),
+])
+def test_stability_coefficient_matches_the_old_ranges(poor, med_waste,
+                                                      population, expected,
+                                                      draws):
+    rng = np.random.default_rng(0)
+    reference = np.random.default_rng(0)
+    reference.uniform(size=draws)
+
+    assert StabilityModel.coefficient(poor, 5, med_waste, population,
+                                      rng=rng) == expected
+    assert rng.bit_generator.state == reference.bit_generator.state
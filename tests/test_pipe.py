@@ -0,0 +1,97 @@
+import io
+import json
+
+from modules.pipe import PipeOrder, iter_pipe, main, process_record
+from modules.run_start_skip import GameStats, InputSection, stats_to_dict
+
+from tests.factories import make_basic_bundle, make_isf_bundle
+
+
+def _stats(bundle) -> GameStats:
+    return GameStats(
+        Economy=bundle.economy,
+        Industry=bundle.industry,
+        Agriculture=bundle.agriculture,
+        InnerPolitics=bundle.inner_politics,
+    )
+
+
+def _line(**record) -> str:
+    record.setdefault("stats", stats_to_dict(_stats(make_basic_bundle())))
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def test_record_carries_state_from_turn_to_turn():
+    output = process_record(0, _line(turns=3, seed=5, id="A"), None)
+
+    assert output["id"] == "A" and output["mode"] == "basic"
+    reports = output["reports"]
+    assert len(reports) == 3
+    for previous, current in zip(reports, reports[1:]):
+        assert current["budget_before"] == previous["budget_final"]
+    assert output["stats"]["Economy"]["current_budget"] == \
+        reports[-1]["budget_final"]
+    # Same seed, same record
+    assert process_record(9, _line(turns=3, seed=5, id="A"), None) == \
+        {**output, "index": 9}
+
+
+def test_text_records_and_other_modes():
+    text = InputSection.render_text(_stats(make_isf_bundle()))
+
+    output = process_record(0, json.dumps({"mode": "isf", "text": text}), 1)
+
+    assert "error" not in output
+    assert output["reports"][0]["mode"] == "isf"
+
+
+def test_broken_records_do_not_stop_the_stream():
+    lines = ["not json\n", "[1, 2]\n", _line(mode="nope"),
+             json.dumps({"turns": 1}) + "\n", "\n", _line(turns=-1), _line()]
+
+    outputs = list(iter_pipe(lines, workers=1, seed=0))
+
+    assert [o["index"] for o in outputs] == [0, 1, 2, 3, 5, 6]
+    assert all("error" in o for o in outputs[:-1])
+    assert "error" not in outputs[-1]
+
+
+def test_pool_output_matches_inline_in_either_order():
+    lines = [_line(turns=1 + index % 2, id=index) for index in range(12)]
+
+    inline = list(iter_pipe(lines, workers=1, seed=3))
+    ordered = list(iter_pipe(lines, workers=3, window=4, seed=3))
+    completed = list(iter_pipe(lines, workers=3, window=4, seed=3,
+                               order=PipeOrder.COMPLETED))
+
+    assert ordered == inline
+    assert sorted(completed, key=lambda o: o["index"]) == inline
+
+
+def test_input_is_read_only_a_window_ahead():
+    consumed = []
+
+    def lines():
+        for index in range(20):
+            consumed.append(index)
+            yield _line(id=index)
+
+    outputs = iter_pipe(lines(), workers=2, window=3, seed=1)
+    first = next(outputs)
+
+    assert first["index"] == 0
+    assert len(consumed) <= 3
+    assert len(list(outputs)) == 19
+
+
+def test_cli_filters_stdin_to_stdout(monkeypatch):
+    stdout = io.StringIO()
+    monkeypatch.setattr("sys.stdin", io.StringIO(_line(id="x") + "oops\n"))
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    code = main(["--workers", "1", "--seed", "4"])
+
+    outputs = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert code == 2
+    assert outputs[0]["id"] == "x" and "reports" in outputs[0]
+    assert outputs[1]["index"] == 1 and "error" in outputs[1]
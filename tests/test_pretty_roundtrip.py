@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import random
-
+from functions.rng import seed_default_rng
 from stats.basic_stats import EconomyStats, IndustrialStats, AgricultureStats, \
     InnerPoliticsStats
 from tests.factories import make_basic_bundle, make_atterium_bundle, \
@@ -9,7 +8,7 @@ from tests.factories import make_basic_bundle, make_atterium_bundle, \
 
 
 def test_basic_economy_roundtrip_from_pretty():
-    random.seed(20)
+    seed_default_rng(20)
     economy = make_basic_bundle().economy
     text = str(economy)
     parsed = EconomyStats.from_stats_text(text)
@@ -24,7 +23,7 @@ def test_basic_economy_roundtrip_from_pretty():
 
 
 def test_basic_industry_roundtrip_from_pretty():
-    random.seed(20)
+    seed_default_rng(20)
     industry = make_basic_bundle().industry
     text = str(industry)
     parsed = IndustrialStats.from_stats_text(text)
@@ -39,7 +38,7 @@ def test_basic_industry_roundtrip_from_pretty():
 
 
 def test_basic_agriculture_roundtrip_from_pretty():
-    random.seed(21)
+    seed_default_rng(21)
     agriculture = make_basic_bundle().agriculture
     agriculture.food_supplies = 123.45
     text = str(agriculture)
@@ -55,7 +54,7 @@ def test_basic_agriculture_roundtrip_from_pretty():
 
 
 def test_basic_inner_politics_roundtrip_from_pretty():
-    random.seed(22)
+    seed_default_rng(22)
     inner = make_basic_bundle().inner_politics
     text = str(inner)
     parsed = InnerPoliticsStats.from_stats_text(text)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+
+import stats.stats_base as stats_base
+from functions.rng import seed_default_rng
+from stats.pretty import compile_render_template, render_pretty
+from stats.pretty_layouts import LAYOUTS_BY_CLASS
+
+from tests.factories import make_atterium_bundle, make_basic_bundle, \
+    make_isf_bundle
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    calls = []
+    original = stats_base.render_template
+
+    def counting(model, template, *, debug=False):
+        calls.append(type(model).__name__)
+        return original(model, template, debug=debug)
+
+    monkeypatch.setattr(stats_base, "render_template", counting)
+    return calls
+
+
+def _all_stats():
+    seed_default_rng(1)
+    for bundle in (make_basic_bundle(), make_atterium_bundle(),
+                   make_isf_bundle()):
+        yield from (bundle.economy, bundle.industry, bundle.agriculture,
+                    bundle.inner_politics)
+
+
+def test_cached_render_matches_uncached_layout_render():
+    for stats in _all_stats():
+        layout = stats._get_pretty_layout()
+        for debug in (False, True):
+            expected = render_pretty(stats, layout, debug=debug)
+            assert stats.render_pretty(debug=debug) == expected
+            assert stats.render_pretty(debug=debug) == expected
+
+
+def test_every_layout_declares_its_dependencies():
+    for layout in LAYOUTS_BY_CLASS.values():
+        assert compile_render_template(layout).dependencies is not None
+
+
+def test_unchanged_stats_render_once(render_calls):
+    economy = make_basic_bundle().economy
+    first = str(economy)
+    assert str(economy) == first
+    assert economy.debug() == economy.debug()
+    assert render_calls == ["EconomyStats", "EconomyStats"]
+
+
+def test_assigning_a_shown_field_invalidates(render_calls):
+    economy = make_basic_bundle(budget=1000.0).economy
+    str(economy)
+    economy.current_budget = 2500.0
+    assert "2500.0" in str(economy)
+    assert len(render_calls) == 2
+
+
+def test_assigning_a_hidden_field_keeps_cache(render_calls):
+    economy = make_basic_bundle().economy
+    str(economy)
+    economy.money_income = 12345.0
+    str(economy)
+    assert len(render_calls) == 1
+
+
+def test_in_place_list_change_invalidates(render_calls):
+    economy = make_basic_bundle().economy
+    before = str(economy)
+    economy.gov_wastes[0] += 7.5
+    assert str(economy) != before
+    assert len(render_calls) == 2
+
+
+def test_private_food_flag_invalidates():
+    agriculture = make_basic_bundle().agriculture
+    assert "!" not in str(agriculture)
+    agriculture._is_negative_food_security = True
+    assert "!" in str(agriculture)
+
+
+def test_copies_do_not_share_cached_text():
+    economy = make_basic_bundle(budget=1000.0).economy
+    str(economy)
+
+    shallow = economy.model_copy()
+    shallow.current_budget = 3000.0
+    updated = economy.model_copy(update={"current_budget": 4000.0})
+
+    assert "3000.0" in str(shallow)
+    assert "4000.0" in str(updated)
+    assert "3000.0" not in str(economy)
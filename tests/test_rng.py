@@ -0,0 +1,72 @@
+import threading
+
+import numpy as np
+
+from functions.rng import default_rng, seed_default_rng
+from modules.run_skip_move import BasicSkipMove
+from stats.basic_stats import IndustrialStats
+from utils.user_io import TestIO
+
+from tests.factories import make_basic_bundle
+
+
+def _run(seed: int):
+    b = make_basic_bundle()
+    rng = np.random.default_rng(seed)
+    b.industry.recalculate_derived_fields(rng=rng)
+    b.inner_politics.recalculate_derived_fields(rng=rng)
+    engine = BasicSkipMove(
+        Economy=b.economy,
+        Industry=b.industry,
+        Agriculture=b.agriculture,
+        InnerPolitics=b.inner_politics,
+        io=TestIO(inputs=[False]),
+        rng=rng,
+    )
+    return engine.run(), b
+
+
+def test_engine_with_same_generator_seed_is_reproducible():
+    first, first_bundle = _run(5)
+    second, second_bundle = _run(5)
+    assert first == second
+    assert first_bundle.economy.income == second_bundle.economy.income
+    assert (first_bundle.inner_politics.success_chance
+            == second_bundle.inner_politics.success_chance)
+
+
+def test_spawned_streams_are_independent_and_reproducible():
+    b = make_basic_bundle()
+    engine = BasicSkipMove(
+        Economy=b.economy,
+        Industry=b.industry,
+        Agriculture=b.agriculture,
+        InnerPolitics=b.inner_politics,
+        rng=np.random.default_rng(1),
+    )
+    children = [child.random(4) for child in engine.spawn_rngs(3)]
+    again = [child.random(4) for child in
+             np.random.default_rng(1).spawn(3)]
+
+    assert not np.allclose(children[0], children[1])
+    for got, expected in zip(children, again):
+        np.testing.assert_array_equal(got, expected)
+
+
+def test_validation_context_passes_generator_to_derived_fields():
+    data = make_basic_bundle().industry.model_dump(exclude_none=True)
+    first = IndustrialStats.model_validate(
+        data, context={"rng": np.random.default_rng(3)})
+    second = IndustrialStats.model_validate(
+        data, context={"rng": np.random.default_rng(3)})
+    assert first.civil_efficiency == second.civil_efficiency
+
+
+def test_fallback_generator_is_thread_local():
+    seed_default_rng(9)
+    main_rng = default_rng()
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(default_rng()))
+    thread.start()
+    thread.join()
+    assert seen[0] is not main_rng
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from modules.mode_spec import GameMode, ModeRegistry
+from modules.run_batch import main
+from modules.run_start_skip import (
+    GameStats,
+    InputSection,
+    parse_skipper_sections,
+)
+
+from tests.factories import make_basic_bundle
+
+
+def _country_text(budget: float) -> str:
+    b = make_basic_bundle(budget=budget)
+    return InputSection.render_text(GameStats(
+        Economy=b.economy,
+        Industry=b.industry,
+        Agriculture=b.agriculture,
+        InnerPolitics=b.inner_politics,
+    ))
+
+
+def test_split_text_allows_missing_sections_and_rejects_orphans():
+    sections = InputSection.split_text(
+        f"{InputSection.INDUSTRY}\nline 1\n{InputSection.PEOPLE}\nline 2\n")
+    assert sections["industry"] == "line 1"
+    assert sections["people"] == "line 2"
+    assert sections["economy"] == sections["trade"] == ""
+
+    with pytest.raises(ValueError):
+        InputSection.split_text("no header\n")
+
+
+def test_rendered_text_roundtrips_through_sections():
+    text = _country_text(750.0)
+    stats = parse_skipper_sections(
+        ModeRegistry.get(GameMode.BASIC).stats_config,
+        InputSection.split_text(text))
+
+    assert stats.Economy.current_budget == 750.0
+    assert stats.InnerPolitics.control == [40, 40, 20, 20]
+    assert stats.Agriculture.securities == [70.0, 70.0, 70.0]
+
+
+def test_batch_cli_processes_directory_in_parallel(tmp_path):
+    src = tmp_path / "in"
+    src.mkdir()
+    for i, budget in enumerate([100.0, 500.0, 1000.0]):
+        (src / f"country_{i}.txt").write_text(
+            _country_text(budget), encoding="utf-8")
+    (src / "broken.txt").write_text("garbage", encoding="utf-8")
+    out = tmp_path / "out"
+
+    code = main(["--mode", "basic", "--input", str(src), "--workers", "2",
+                 "--output", str(out), "--seed", "3"])
+
+    assert code == 2  # one file failed
+    payload = json.loads((out / "report.json").read_text(encoding="utf-8"))
+    by_name = {item["name"]: item for item in payload}
+    assert not by_name["broken"]["ok"]
+    assert by_name["broken"]["error"]
+
+    for i, budget in enumerate([100.0, 500.0, 1000.0]):
+        item = by_name[f"country_{i}"]
+        assert item["ok"]
+        assert item["report"]["budget_before"] == budget
+        # the rendered result is a valid input for the next turn
+        rendered = (out / f"country_{i}.txt").read_text(encoding="utf-8")
+        stats = parse_skipper_sections(
+            ModeRegistry.get(GameMode.BASIC).stats_config,
+            InputSection.split_text(rendered))
+        assert stats.Economy.current_budget == pytest.approx(
+            item["report"]["budget_final"], abs=0.05)
+
+
+def test_batch_names_outputs_by_path_below_the_common_directory(tmp_path):
+    for region, budget in [("eu", 100.0), ("asia", 500.0)]:
+        (tmp_path / "in" / region).mkdir(parents=True)
+        (tmp_path / "in" / region / "country.txt").write_text(
+            _country_text(budget), encoding="utf-8")
+    out = tmp_path / "out"
+
+    assert main(["--input", str(tmp_path / "in" / "*" / "*.txt"),
+                 "--workers", "1", "--output", str(out)]) == 0
+
+    payload = json.loads((out / "report.json").read_text(encoding="utf-8"))
+    assert {item["name"]: item["report"]["budget_before"]
+            for item in payload} == {"asia/country": 500.0,
+                                     "eu/country": 100.0}
+    for region in ["eu", "asia"]:
+        assert (out / region / "country.txt").is_file()
+
+
+def test_batch_rejects_inputs_with_the_same_name(tmp_path, capsys):
+    (tmp_path / "country.txt").write_text(_country_text(100.0),
+                                          encoding="utf-8")
+    (tmp_path / "country.stats").write_text(_country_text(500.0),
+                                            encoding="utf-8")
+    out = tmp_path / "out"
+
+    assert main(["--input", str(tmp_path / "country.*"),
+                 "--output", str(out)]) == 1
+    assert "country" in capsys.readouterr().out
+    assert not out.exists()
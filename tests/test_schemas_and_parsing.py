@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import random
-
+from functions.rng import seed_default_rng
 from stats.basic_stats import EconomyStats
 from stats.atterium_stats import AtteriumEconomyStats
 from stats.isf_stats import IsfEconomyStats
@@ -32,7 +31,7 @@ def test_common_schema_keys_are_shared_across_modes():
 
 
 def test_basic_economy_parses_from_its_own_rendered_string_roundtrip():
-    random.seed(10)
+    seed_default_rng(10)
     b = make_basic_bundle(budget=1000.0)
     e = b.economy
 
@@ -55,7 +54,7 @@ def test_basic_economy_parses_from_its_own_rendered_string_roundtrip():
 
 
 def test_atterium_and_isf_custom_fields_are_parsed():
-    random.seed(11)
+    seed_default_rng(11)
 
     a = make_atterium_bundle(budget=500.0).economy
     a.prev_budget = a.current_budget - 5.0
@@ -0,0 +1,176 @@
+import http.client
+import json
+import math
+import os
+import subprocess
+import sys
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from modules.run_start_skip import GameStats, InputSection
+from modules.service import MAX_BODY_BYTES, LatencyHistogram, dump_json, \
+    make_server
+
+from tests.factories import make_basic_bundle, make_isf_bundle
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _text(bundle) -> str:
+    return InputSection.render_text(GameStats(
+        Economy=bundle.economy,
+        Industry=bundle.industry,
+        Agriculture=bundle.agriculture,
+        InnerPolitics=bundle.inner_politics,
+    ))
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = make_server(port=0, workers=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+    server.service.close()
+
+
+def _request(base_url, path, payload=None):
+    data = None if payload is None else json.dumps(payload).encode("utf-8")
+    request = urllib.request.Request(base_url + path, data=data)
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_parse_render_and_skip_move_round_trip(base_url):
+    text = _text(make_basic_bundle())
+
+    status, parsed = _request(base_url, "/parse", {"text": text, "seed": 1})
+    assert status == 200
+    assert parsed["stats"]["Economy"]["current_budget"] == 1000.0
+
+    status, rendered = _request(base_url, "/render",
+                                {"stats": parsed["stats"], "seed": 1})
+    assert status == 200
+    assert rendered["rendered"] == _request(
+        base_url, "/render", {"text": text, "seed": 1})[1]["rendered"]
+
+    status, turn = _request(base_url, "/skip-move", {"text": text, "seed": 3})
+    assert status == 200
+    assert turn["report"]["mode"] == "basic"
+    assert turn["report"]["budget_before"] == 1000.0
+    assert InputSection.ECONOMY in turn["rendered"]
+    # Same seed, same turn
+    assert _request(base_url, "/skip-move",
+                    {"text": text, "seed": 3})[1] == turn
+
+
+def test_other_modes_and_ensemble(base_url):
+    status, turn = _request(base_url, "/skip-move",
+                            {"mode": "isf", "text": _text(make_isf_bundle())})
+    assert status == 200 and turn["report"]["mode"] == "isf"
+
+    status, result = _request(base_url, "/ensemble", {
+        "text": _text(make_basic_bundle()), "replicas": 8, "seed": 2})
+    assert status == 200 and result["replicas"] == 8
+    band = result["bands"]["budget_final"]
+    assert band["p5"] <= band["p50"] <= band["p95"]
+
+
+def test_concurrent_requests_are_counted_in_metrics(base_url):
+    text = _text(make_basic_bundle())
+    before = _request(base_url, "/metrics")[1]["endpoints"]["/skip-move"]
+
+    with ThreadPoolExecutor(max_workers=8) as clients:
+        statuses = list(clients.map(
+            lambda seed: _request(base_url, "/skip-move",
+                                  {"text": text, "seed": seed})[0],
+            range(16)))
+
+    assert statuses == [200] * 16
+    status, metrics = _request(base_url, "/metrics")
+    assert status == 200
+    assert metrics["workers"] == 2 and metrics["queue_depth"] == 0
+    after = metrics["endpoints"]["/skip-move"]
+    assert after["count"] == before["count"] + 16
+    assert sum(after["counts"]) == after["count"]
+    assert len(after["counts"]) == len(after["buckets_ms"])
+
+
+@pytest.mark.parametrize("method, path, payload, code", [
+    ("POST", "/skip-move", {"mode": "nope", "text": ""}, 400),
+    ("POST", "/skip-move", {"seed": 1}, 400),
+    ("POST", "/ensemble", {"text": "", "replicas": 0}, 400),
+    ("POST", "/render", {"stats": {"Economy": {}}}, 400),
+    ("POST", "/nowhere", {}, 404),
+    ("GET", "/nowhere", None, 404),
+])
+def test_bad_requests_get_json_errors(base_url, method, path, payload, code):
+    status, body = _request(base_url, path, payload)
+
+    assert status == code
+    assert body["error"]
+
+
+@pytest.mark.parametrize("length", ["abc", "-1", str(MAX_BODY_BYTES + 1)])
+def test_bad_content_length_gets_a_json_error(base_url, length):
+    host, port = base_url.removeprefix("http://").split(":")
+    connection = http.client.HTTPConnection(host, int(port), timeout=10)
+    connection.putrequest("POST", "/parse")
+    connection.putheader("Content-Length", length)
+    connection.endheaders()
+    response = connection.getresponse()
+
+    assert response.status == 400
+    assert json.loads(response.read())["error"]
+    connection.close()
+
+
+def test_non_finite_numbers_are_sent_as_null():
+    body = {"deficit": math.nan, "bands": [{"low": -math.inf, "high": 1.5}]}
+
+    assert json.loads(dump_json(body)) == {
+        "deficit": None, "bands": [{"low": None, "high": 1.5}]}
+    assert json.loads(dump_json({"a": 1.0})) == {"a": 1.0}
+
+
+def test_latency_histogram_buckets_and_quantiles():
+    histogram = LatencyHistogram()
+    for ms in (0.5, 3, 3, 40, 9000):
+        histogram.observe(ms / 1e3)
+    histogram.observe(0.001, ok=False)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 6 and snapshot["errors"] == 1
+    assert snapshot["counts"][0] == 2 and snapshot["counts"][-1] == 1
+    assert snapshot["p50_ms"] == 5
+    assert snapshot["p95_ms"] == "inf"
+
+
+def test_warm_up_builds_the_deferred_validators():
+    script = (
+        "from modules.mode_spec import ModeRegistry\n"
+        "from modules.service import _warm_up\n"
+        "classes = [cls for spec in ModeRegistry.available().values()\n"
+        "           for cls in vars(spec.stats_config).values()]\n"
+        "before = [cls.__pydantic_complete__ for cls in classes]\n"
+        "_warm_up()\n"
+        "print(any(before), all(cls.__pydantic_complete__ for cls in classes))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, capture_output=True,
+        text=True, check=True,
+        env={**os.environ, "WPI_LOG_TO_FILE": "0", "PYTHONPATH": str(ROOT)})
+
+    assert result.stdout.split() == ["False", "True"]
@@ -0,0 +1,70 @@
+import pytest
+
+from modules.credit_policy import (
+    CoverDeficitCredit,
+    FixedTargetCredit,
+    NeverCredit,
+)
+from modules.run_skip_move import BasicSkipMove
+from utils.user_io import TestIO
+
+from tests.factories import make_basic_bundle
+
+
+def _engine(budget: float = 1000.0, *, deficit: bool = False) -> BasicSkipMove:
+    b = make_basic_bundle(budget=budget)
+    if deficit:
+        b.economy.gov_wastes = [5000.0, 2000.0, 1000.0, 500.0]
+        b.economy.universal_tax = 0.1
+    return BasicSkipMove(
+        Economy=b.economy,
+        Industry=b.industry,
+        Agriculture=b.agriculture,
+        InnerPolitics=b.inner_politics,
+        io=TestIO(),  # any I/O request would raise
+    )
+
+
+def test_simulate_streams_reports_and_carries_state():
+    engine = _engine()
+    stream = engine.simulate(turns=5, credit_policy=NeverCredit())
+
+    first = next(stream)
+    assert engine.Economy.current_budget == first.budget_final
+
+    reports = [first, *stream]
+    assert len(reports) == 5
+    for previous, current in zip(reports, reports[1:]):
+        assert current.budget_before == previous.budget_final
+    assert engine.credit_policy is None
+
+
+def test_never_credit_keeps_negative_budget():
+    engine = _engine(budget=0.0, deficit=True)
+    reports = list(engine.simulate(turns=3, credit_policy=NeverCredit()))
+
+    assert all(not r.credit_taken for r in reports)
+    assert reports[-1].budget_final < reports[0].budget_final < 0
+
+
+def test_fixed_target_credit():
+    engine = _engine(budget=0.0, deficit=True)
+    report, = engine.simulate(turns=1, credit_policy=FixedTargetCredit(250.0))
+
+    assert report.credit_taken is True
+    assert report.budget_final == 250.0
+    assert report.credit_amount == pytest.approx(
+        250.0 - report.budget_after_boost)
+
+
+def test_cover_deficit_credit_with_margin():
+    engine = _engine(budget=0.0, deficit=True)
+    engine.credit_policy = CoverDeficitCredit(margin=10.0, margin_ratio=0.1)
+    report = engine.run()
+
+    deficit = -report.budget_after_boost
+    assert report.budget_final == pytest.approx(10.0 + 0.1 * deficit)
+    assert report.credit_amount == pytest.approx(deficit + report.budget_final)
+
+    with pytest.raises(ValueError):
+        CoverDeficitCredit(margin=-1.0)
@@ -1,5 +1,9 @@
-import random
+import math
 
+import numpy as np
+import pytest
+
+from functions.rng import seed_default_rng
 from modules.run_skip_move import BasicSkipMove, AtteriumSkipMove, IsfSkipMove
 from utils.user_io import TestIO
 
@@ -11,7 +15,7 @@ from tests.factories import (
 
 
 def test_basic_skip_move_runs_and_returns_report():
-    random.seed(1)
+    seed_default_rng(1)
     b = make_basic_bundle(budget=1000.0)
 
     engine = BasicSkipMove(
@@ -38,7 +42,7 @@ def test_basic_skip_move_runs_and_returns_report():
 
 
 def test_credit_is_requested_only_after_all_math_and_overrides_final_budget():
-    random.seed(2)
+    seed_default_rng(2)
     b = make_basic_bundle(budget=0.0)
 
     # Force a guaranteed deficit by inflating expenses and lowering taxes
@@ -70,7 +74,7 @@ def test_credit_is_requested_only_after_all_math_and_overrides_final_budget():
 
 
 def test_atterium_mode_runs():
-    random.seed(3)
+    seed_default_rng(3)
     b = make_atterium_bundle(budget=500.0)
 
     engine = AtteriumSkipMove(
@@ -87,7 +91,7 @@ def test_atterium_mode_runs():
 
 
 def test_isf_mode_runs():
-    random.seed(4)
+    seed_default_rng(4)
     b = make_isf_bundle(budget=500.0)
 
     engine = IsfSkipMove(
@@ -101,3 +105,80 @@ def test_isf_mode_runs():
     report = engine.run()
     assert report.mode == "isf"
     assert report.budget_final == b.economy.current_budget
+
+
+def test_report_lists_every_income_factor():
+    seed_default_rng(5)
+    b = make_isf_bundle(budget=500.0)
+    income_before = b.economy.income
+
+    engine = IsfSkipMove(
+        Economy=b.economy,
+        Industry=b.industry,
+        Agriculture=b.agriculture,
+        InnerPolitics=b.inner_politics,
+        io=TestIO(),
+    )
+    report = engine.run()
+
+    income_factors = [f for f in report.income_factors if f.target == "income"]
+    assert [f.name for f in income_factors] == [
+        "goods", "stability", "agriculture", "society_decline",
+        "food_diversity"]
+    assert b.economy.income == pytest.approx(income_before * math.prod(
+        f.value for f in income_factors))
+
+    money_factors = [f.name for f in report.income_factors
+                     if f.target == "money_income"]
+    assert money_factors == ["inflation", "mode"]
+    assert {"tax_income", "trade_income", "branches_income",
+            "industry_income"} <= {f.target for f in report.income_factors}
+
+
+def test_turn_computes_wastes_once():
+    seed_default_rng(6)
+    b = make_basic_bundle(budget=1000.0)
+    engine = BasicSkipMove(
+        Economy=b.economy,
+        Industry=b.industry,
+        Agriculture=b.agriculture,
+        InnerPolitics=b.inner_politics,
+        io=TestIO(),
+    )
+    calls = {"logistic": 0, "total": 0}
+    logistic, total = (engine._calculate_logistic_wastes,
+                       engine._calculate_total_wastes)
+
+    def count_logistic():
+        calls["logistic"] += 1
+        return logistic()
+
+    def count_total(logistic_wastes):
+        calls["total"] += 1
+        return total(logistic_wastes)
+
+    engine._calculate_logistic_wastes = count_logistic
+    engine._calculate_total_wastes = count_total
+
+    report = engine.run()
+    assert calls == {"logistic": 1, "total": 1}
+    assert report.total_wastes == total(report.logistic_wastes)
+
+
+def test_turn_updates_the_models_in_place():
+    bundle = make_basic_bundle(budget=1000.0)
+    engine = BasicSkipMove(
+        Economy=bundle.economy,
+        Industry=bundle.industry,
+        Agriculture=bundle.agriculture,
+        InnerPolitics=bundle.inner_politics,
+        io=TestIO(),
+        rng=np.random.default_rng(4),
+    )
+
+    report = engine.run()
+
+    assert engine.Economy is bundle.economy
+    assert bundle.economy.current_budget == report.budget_final
+    assert bundle.economy.prev_budget == 1000.0
+    assert "income" in bundle.economy._pinned_derived
@@ -0,0 +1,77 @@
+import io
+
+from modules.mode_spec import GameMode
+from modules.run_start_skip import GameStats, InputSection
+from modules.stats_dump import iter_blocks, iter_dump, read_dump
+
+from tests.factories import make_basic_bundle
+
+
+def _country_text(budget: float) -> str:
+    b = make_basic_bundle(budget=budget)
+    return InputSection.render_text(GameStats(
+        Economy=b.economy,
+        Industry=b.industry,
+        Agriculture=b.agriculture,
+        InnerPolitics=b.inner_politics,
+    ))
+
+
+def _named(name: str, text: str) -> str:
+    return f"{InputSection.COUNTRY.format(name=name)}\n{text}"
+
+
+def test_unnamed_blocks_are_split_on_repeated_headers():
+    text = _country_text(100.0) + "\n" + _country_text(200.0)
+    records = list(iter_dump(io.StringIO(text), GameMode.BASIC))
+
+    assert [r.ok for r in records] == [True, True]
+    assert [r.name for r in records] == [None, None]
+    assert [r.stats.Economy.current_budget for r in records] == [100.0, 200.0]
+    assert records[1].line > records[0].line == 1
+
+
+def test_broken_block_is_reported_and_stream_continues():
+    broken = (f"{InputSection.ECONOMY}\n```\nКазна - ничего\n```\n"
+              f"{InputSection.INDUSTRY}\n```\n```\n")
+    text = "\n".join([
+        _named("Альфа", _country_text(100.0)),
+        _named("Бета", broken),
+        _named("Гамма", _country_text(300.0)),
+    ])
+
+    records = list(iter_dump(text.splitlines(), GameMode.BASIC))
+
+    assert [r.name for r in records] == ["Альфа", "Бета", "Гамма"]
+    assert [r.ok for r in records] == [True, False, True]
+    assert records[1].stats is None and records[1].error
+    assert records[2].stats.Economy.current_budget == 300.0
+
+
+def test_text_before_first_header_is_an_error_of_that_block():
+    records = list(iter_dump(["garbage", *_country_text(1.0).splitlines()]))
+    assert len(records) == 1
+    assert "garbage" in records[0].error
+
+
+def test_blocks_are_produced_lazily():
+    def lines():
+        yield from _named("Один", _country_text(100.0)).splitlines()
+        yield from _named("Два", _country_text(200.0)).splitlines()
+        raise AssertionError("read past the second block")
+
+    blocks = iter_blocks(lines())
+    assert next(blocks).name == "Один"
+
+
+def test_read_dump_streams_a_file(tmp_path):
+    path = tmp_path / "world.txt"
+    path.write_text("\n".join(
+        _named(f"Страна {i}", _country_text(10.0 * i)) for i in range(1, 6)),
+        encoding="utf-8")
+
+    records = read_dump(path, GameMode.BASIC)
+    first = next(records)
+    assert first.name == "Страна 1" and first.ok
+    assert [r.stats.Economy.current_budget for r in records] == \
+        [20.0, 30.0, 40.0, 50.0]
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from modules.ensemble import numeric_report_fields
+from modules.mode_spec import GameMode
+from modules.run_start_skip import GameStats, InputSection
+from modules.sweep import SweepAxis, SweepEvaluator, main, parse_grid, run_sweep
+
+from tests.factories import make_basic_bundle, make_isf_bundle
+
+
+def _stats(bundle) -> GameStats:
+    return GameStats(
+        Economy=bundle.economy,
+        Industry=bundle.industry,
+        Agriculture=bundle.agriculture,
+        InnerPolitics=bundle.inner_politics,
+    )
+
+
+def test_grid_specs_are_parsed():
+    assert parse_grid("10:12:0.5") == (10.0, 10.5, 11.0, 11.5, 12.0)
+    assert parse_grid("0:1:0.1")[-1] == 1.0
+    assert parse_grid("1, 5,9") == (1.0, 5.0, 9.0)
+
+    axis = SweepAxis.parse("Economy.gov_wastes[2]=100,200")
+    assert (axis.domain, axis.field, axis.index) == ("Economy", "gov_wastes", 2)
+    assert axis.name == "Economy.gov_wastes[2]"
+
+    for spec in ("universal_tax", "universal_tax=a,b", "universal_tax=5:1:1",
+                 "universal_tax=1:5:0", "x[=1"):
+        with pytest.raises(ValueError):
+            SweepAxis.parse(spec)
+
+
+def test_sweep_covers_the_cartesian_product():
+    stats = _stats(make_basic_bundle())
+    budget_before = stats.Economy.current_budget
+
+    result = run_sweep(stats, [SweepAxis.parse("universal_tax=10:20:5"),
+                               SweepAxis.parse("med_wastes[0]=50,500")],
+                       seed=3, workers=1)
+
+    assert len(result) == 6
+    assert result.evaluator == SweepEvaluator.BATCH
+    assert list(result.columns)[:2] == ["Economy.universal_tax",
+                                        "Economy.med_wastes[0]"]
+    assert set(numeric_report_fields()) <= set(result.columns)
+    np.testing.assert_array_equal(result.columns["Economy.universal_tax"],
+                                  [10, 10, 15, 15, 20, 20])
+    np.testing.assert_array_equal(result.columns["Economy.med_wastes[0]"],
+                                  [50, 500] * 3)
+    # Higher taxes bring more money, bigger medicine spending costs more
+    tax = result.columns["tax_income"]
+    assert tax[0] < tax[2] < tax[4]
+    wastes = result.columns["total_wastes"]
+    assert np.all(wastes[1::2] > wastes[::2])
+    assert stats.Economy.current_budget == budget_before
+
+
+def test_sweep_is_reproducible_regardless_of_worker_count():
+    stats = _stats(make_basic_bundle())
+    axes = [SweepAxis.parse("universal_tax=5:30:1")]
+
+    inline = run_sweep(stats, axes, seed=11, workers=1, chunk_size=8)
+    pooled = run_sweep(stats, axes, seed=11, workers=2, chunk_size=8)
+
+    assert inline.columns.keys() == pooled.columns.keys()
+    for name in inline.columns:
+        np.testing.assert_array_equal(inline.columns[name], pooled.columns[name])
+
+
+def test_engine_evaluator_runs_every_mode():
+    result = run_sweep(_stats(make_isf_bundle()),
+                       [SweepAxis.parse("universal_tax=10,20")],
+                       mode=GameMode.ISF, seed=1, workers=1)
+
+    assert result.evaluator == SweepEvaluator.ENGINE
+    assert len(result) == 2
+    assert result.columns["tax_income"][0] < result.columns["tax_income"][1]
+
+    with pytest.raises(ValueError):
+        run_sweep(_stats(make_isf_bundle()), [SweepAxis.parse("universal_tax=10")],
+                  mode=GameMode.ISF, evaluator=SweepEvaluator.BATCH)
+
+
+def test_batch_and_engine_agree_on_deterministic_columns():
+    stats = _stats(make_basic_bundle())
+    axes = [SweepAxis.parse("universal_tax=10,25")]
+
+    batch = run_sweep(stats, axes, seed=2, workers=1,
+                      evaluator=SweepEvaluator.BATCH)
+    engine = run_sweep(stats, axes, seed=2, workers=1,
+                       evaluator=SweepEvaluator.ENGINE)
+
+    for name in ("budget_before", "tax_income", "logistic_wastes"):
+        np.testing.assert_allclose(batch.columns[name], engine.columns[name])
+
+
+@pytest.mark.parametrize("spec", [
+    "no_such_field=1",
+    "Industry.universal_tax=1",
+    "Nowhere.universal_tax=1",
+    "med_wastes=1",
+    "med_wastes[99]=1",
+    "universal_tax[0]=1",
+])
+def test_unknown_or_malformed_fields_are_rejected(spec):
+    with pytest.raises(ValueError):
+        run_sweep(_stats(make_basic_bundle()), [SweepAxis.parse(spec)], workers=1)
+
+
+def test_cli_writes_a_csv_table(tmp_path):
+    stats = _stats(make_basic_bundle())
+    source = tmp_path / "country.txt"
+    source.write_text(InputSection.render_text(stats), encoding="utf-8")
+    output = tmp_path / "sweep.csv"
+
+    code = main(["--input", str(source), "--grid", "universal_tax=10,20",
+                 "--output", str(output), "--workers", "1", "--seed", "1"])
+
+    assert code == 0
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("Economy.universal_tax,")
+    assert len(lines) == 3
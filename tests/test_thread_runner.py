@@ -0,0 +1,81 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from modules.mode_spec import GameMode
+from modules.run_start_skip import GameStats, InputSection
+from modules.thread_runner import RunnerBackend, main, run_games
+from stats import stats_base
+
+from tests.factories import make_basic_bundle, make_isf_bundle
+
+
+def _stats(bundle) -> GameStats:
+    return GameStats(
+        Economy=bundle.economy,
+        Industry=bundle.industry,
+        Agriculture=bundle.agriculture,
+        InnerPolitics=bundle.inner_politics,
+    )
+
+
+def test_games_do_not_depend_on_workers_or_backend():
+    stats = [_stats(make_basic_bundle(budget=100.0 * i)) for i in range(8)]
+    budgets = [s.Economy.current_budget for s in stats]
+
+    inline = run_games(stats, turns=3, master_seed=5, workers=1)
+    threaded = run_games(stats, turns=3, master_seed=5, workers=4)
+    processes = run_games(stats[:3], turns=3, master_seed=5, workers=2,
+                          backend=RunnerBackend.PROCESS)
+
+    assert threaded == inline
+    assert processes == inline[:3]
+    assert [len(reports) for reports in inline] == [3] * 8
+    # Games never touch the caller's stats
+    assert [s.Economy.current_budget for s in stats] == budgets
+
+    assert run_games(stats, turns=3, master_seed=6, workers=4) != inline
+
+
+def test_engines_run_concurrently_in_any_mode():
+    stats = [_stats(make_isf_bundle()) for _ in range(24)]
+
+    # More threads than games per thread, so turns interleave
+    threaded = run_games(stats, mode=GameMode.ISF, turns=2, master_seed=1,
+                         workers=12)
+
+    assert threaded == run_games(stats, mode=GameMode.ISF, turns=2,
+                                 master_seed=1, workers=1)
+    assert {reports[0].mode for reports in threaded} == {"isf"}
+
+
+def test_concurrent_first_use_builds_one_parse_plan():
+    model_class = type(_stats(make_basic_bundle()).Economy)
+    stats_base._PARSE_PLANS.pop(model_class, None)
+    barrier = threading.Barrier(8)
+
+    def first_use(_):
+        barrier.wait()
+        return model_class._get_parse_plan()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        plans = {id(plan) for plan in pool.map(first_use, range(8))}
+
+    assert len(plans) == 1
+
+
+def test_negative_turns_are_rejected():
+    with pytest.raises(ValueError):
+        run_games([_stats(make_basic_bundle())], turns=-1)
+
+
+def test_cli_summarizes_the_games(tmp_path, capsys):
+    path = tmp_path / "stats.txt"
+    path.write_text(InputSection.render_text(_stats(make_basic_bundle())),
+                    encoding="utf-8")
+
+    assert main(["--input", str(path), "--games", "4", "--turns", "2",
+                 "--workers", "2"]) == 0
+    assert "Игр: 4, ходов: 2" in capsys.readouterr().out
+    assert main(["--input", str(path), "--games", "0"]) == 1
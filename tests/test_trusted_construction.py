@@ -0,0 +1,67 @@
+import numpy as np
+import pydantic
+import pytest
+
+from stats.basic_stats import EconomyStats, IndustrialStats
+from stats.stats_base import check_trusted_construction
+
+from tests.factories import make_atterium_bundle, make_basic_bundle, \
+    make_isf_bundle
+
+
+def _all_stats():
+    for bundle in (make_basic_bundle(), make_atterium_bundle(),
+                   make_isf_bundle()):
+        yield from (bundle.economy, bundle.industry, bundle.agriculture,
+                    bundle.inner_politics)
+
+
+def test_trusted_models_equal_validated_ones():
+    for stats in _all_stats():
+        data = stats.model_dump(exclude_none=True)
+        trusted = type(stats).from_trusted(data, rng=np.random.default_rng(4))
+        validated = type(stats).model_validate(
+            data, context={"rng": np.random.default_rng(4)})
+        assert trusted == validated
+        assert str(trusted) == str(validated)
+
+
+def test_trusted_models_have_lazy_derived_fields_and_own_lists():
+    data = make_basic_bundle().industry.model_dump()
+    industry = IndustrialStats.from_trusted(data)
+
+    assert "civil_efficiency" not in vars(industry)
+    assert industry.civil_efficiency is not None
+    industry.usages[0] = -1.0
+    assert data["usages"][0] != -1.0
+
+
+def test_trusted_construction_skips_validators():
+    data = make_basic_bundle().economy.model_dump()
+    data["high_quality_percent"] += 50
+
+    EconomyStats.from_trusted(data)
+    with pytest.raises(pydantic.ValidationError):
+        EconomyStats(**data)
+
+
+def test_debug_switch_validates_a_sample():
+    good = make_basic_bundle().economy.model_dump()
+    bad = dict(good, high_quality_percent=good["high_quality_percent"] + 50)
+
+    with check_trusted_construction(rate=1.0):
+        with pytest.raises(pydantic.ValidationError):
+            EconomyStats.from_trusted(bad)
+
+    failures = 0
+    with check_trusted_construction(rate=0.25):
+        for _ in range(20):
+            try:
+                EconomyStats.from_trusted(bad)
+            except pydantic.ValidationError:
+                failures += 1
+    assert failures == 5
+
+    with pytest.raises(ValueError):
+        with check_trusted_construction(rate=2.0):
+            pass
@@ -17,24 +17,56 @@ from __future__ import annotations
 import glob
 import logging
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Optional, List
+
+
+class _DeferredFileHandler(logging.FileHandler):
+    """File handler that finds and creates its directory on the first record.
+
+    `open_dir` returns the directory, creating it if needed. If the
+    directory or the file cannot be created, file logging is silently
+    dropped.
+    """
+
+    _failed = False
+
+    def __init__(self, open_dir: Callable[[], Path], file_name: str,
+                 **kwargs) -> None:
+        super().__init__(file_name, delay=True, **kwargs)
+        self._open_dir = open_dir
+        self._file_name = file_name
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None and not self._failed:
+            try:
+                self.baseFilename = str(self._open_dir() / self._file_name)
+                self.stream = self._open()
+            except OSError:
+                self._failed = True
+        if self.stream is not None:
+            super().emit(record)
 
 
 class Logger:
     _instance: Optional['Logger'] = None
     _initialized = False
+    # The singleton is set up once even when threads race to create it
+    _lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
-        if not cls._instance:
-            cls._instance = super(Logger, cls).__new__(cls)
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super(Logger, cls).__new__(cls)
         return cls._instance
 
     def __init__(self):
-        if not self._initialized:
-            self._setup_logging_environment()
-            self._initialized = True
+        with self._lock:
+            if not self._initialized:
+                self._setup_logging_environment()
+                self._initialized = True
 
     def _get_project_root(self) -> Path:
         current_path = Path(__file__).resolve()
@@ -48,6 +80,14 @@ class Logger:
 
         return current_path.parent
 
+    def _open_log_dir(self) -> Path:
+        env_dir = os.environ.get('WPI_LOG_DIR')
+        log_dir = Path(env_dir) if env_dir else \
+            self._get_project_root() / 'logs'
+        log_dir.mkdir(parents=True, exist_ok=True)
+        self.log_dir = log_dir
+        return log_dir
+
     def _setup_logging_environment(self) -> None:
         # Respect env overrides (especially for tests)
         level_name = os.environ.get('WPI_LOG_LEVEL', 'DEBUG').upper()
@@ -56,31 +96,23 @@ class Logger:
         log_to_file = os.environ.get('WPI_LOG_TO_FILE', '1').strip() not in {
             '0', 'false', 'no'}
 
-        project_root = self._get_project_root()
-        log_dir = Path(
-            os.environ.get('WPI_LOG_DIR', str(project_root / 'logs')))
-
         handlers: List[logging.Handler] = []
 
         self.log_dir = None
 
         if log_to_file:
-            try:
-                log_dir.mkdir(parents=True, exist_ok=True)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                log_file = log_dir / f"app_{timestamp}.log"
-                handlers.insert(
-                    0,
-                    logging.FileHandler(
-                        log_file,
-                        mode='w',
-                        encoding='utf-8'
-                    )
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # The directory and the file are looked up and created by the
+            # first record, so importing the project touches no files.
+            handlers.insert(
+                0,
+                _DeferredFileHandler(
+                    self._open_log_dir,
+                    f"app_{timestamp}.log",
+                    mode='w',
+                    encoding='utf-8',
                 )
-                self.log_dir = log_dir
-            except Exception:
-                # If file logging fails for any reason, fall back to console.
-                self.log_dir = None
+            )
 
         logging.basicConfig(
             level=level,
@@ -8,6 +8,8 @@ in isolation:
 
 - Production uses :class:`ConsoleIO` (real stdin/stdout).
 - Tests can use :class:`TestIO` (pre-programmed answers).
+- Sessions sharing one event loop use an :class:`AsyncUserIO`, e.g.
+  :class:`InMemoryAsyncIO` (see :mod:`modules.async_skip_move`).
 
 Keep this intentionally small; add methods only when the engine needs them.
 """
@@ -15,9 +17,12 @@ Keep this intentionally small; add methods only when the engine needs them.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Deque, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Deque, Optional, Protocol, Tuple
 from collections import deque
 
+if TYPE_CHECKING:
+    import asyncio
+
 
 class UserIO(Protocol):
     """Minimal I/O surface used by the core engine."""
@@ -137,3 +142,108 @@ class TestIO:
         if not take:
             return None
         return self.ask_float("")
+
+
+@dataclass
+class HeadlessIO:
+    """Non-interactive I/O for batch and background runs.
+
+    Messages are collected in `printed`, questions fall back to their defaults
+    and credit is always refused.
+    """
+
+    printed: list[str] = field(default_factory=list)
+
+    def print(self, message: str) -> None:
+        self.printed.append(str(message))
+
+    def ask_bool(self, prompt: str, default: Optional[bool] = None) -> bool:
+        if default is None:
+            raise RuntimeError(f"HeadlessIO: нет ответа по умолчанию: {prompt}")
+        return default
+
+    def ask_float(self, prompt: str, default: Optional[float] = None) -> float:
+        if default is None:
+            raise RuntimeError(f"HeadlessIO: нет ответа по умолчанию: {prompt}")
+        return float(default)
+
+    def request_credit(self, deficit: float) -> Optional[float]:
+        return None
+
+
+class AsyncUserIO(Protocol):
+    """Awaitable counterpart of :class:`UserIO`."""
+
+    async def print(self, message: str) -> None:
+        ...
+
+    async def ask_bool(self, prompt: str,
+                       default: Optional[bool] = None) -> bool:
+        ...
+
+    async def ask_float(self, prompt: str,
+                        default: Optional[float] = None) -> float:
+        ...
+
+    async def request_credit(self, deficit: float) -> Optional[float]:
+        """Same contract as :meth:`UserIO.request_credit`."""
+        ...
+
+
+def _queue() -> asyncio.Queue:
+    # asyncio is imported only by sessions that use it
+    import asyncio
+
+    return asyncio.Queue()
+
+
+@dataclass
+class InMemoryAsyncIO:
+    """In-process stand-in for a remote player connection.
+
+    Every question is put into `questions` as a ``(kind, prompt)`` pair,
+    ``kind`` being ``"bool"`` or ``"float"``, and its answer is awaited from
+    `answers`; ``None`` means "use the default". Messages are collected in
+    `printed`.
+    """
+
+    questions: asyncio.Queue = field(default_factory=_queue)
+    answers: asyncio.Queue = field(default_factory=_queue)
+    printed: list[str] = field(default_factory=list)
+
+    async def print(self, message: str) -> None:
+        self.printed.append(str(message))
+
+    async def _ask(self, kind: str, prompt: str, default: Any) -> Any:
+        await self.questions.put((kind, prompt))
+        answer = await self.answers.get()
+        if answer is None:
+            if default is None:
+                raise RuntimeError(
+                    f"InMemoryAsyncIO: нет ответа по умолчанию: {prompt}")
+            return default
+        return answer
+
+    async def ask_bool(self, prompt: str,
+                       default: Optional[bool] = None) -> bool:
+        return bool(await self._ask("bool", prompt, default))
+
+    async def ask_float(self, prompt: str,
+                        default: Optional[float] = None) -> float:
+        return float(await self._ask("float", prompt, default))
+
+    async def request_credit(self, deficit: float) -> Optional[float]:
+        await self.print(f"У меня нет денег - не хватает {deficit}")
+        if not await self.ask_bool("Взять кредит? 1, если да, 0 - если нет",
+                                   default=False):
+            return None
+        return await self.ask_float(
+            "Введите сумму, которая в итоге будет в казне - ")
+
+    async def next_question(self) -> Tuple[str, str]:
+        """Player side: the next question the session asks."""
+        return await self.questions.get()
+
+    async def answer(self, value: Any) -> None:
+        """Player side: answers the pending question."""
+        await self.answers.put(value)